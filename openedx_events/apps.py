@@ -1,14 +1,26 @@
 """
 openedx_events Django application initialization.
 """
+import json
 import logging
 
 from django.apps import AppConfig
 from django.conf import settings
 
-from openedx_events.event_bus import get_producer
+from openedx_events.event_bus import (
+    PRODUCER_MODE_IMMEDIATE,
+    PRODUCER_MODE_ON_COMMIT,
+    PRODUCER_MODE_OUTBOX,
+    PRODUCER_MODES,
+    get_producer,
+)
+from openedx_events.event_bus.avro.custom_serializers import enable_custom_serializer_caches
+from openedx_events.event_bus.avro.schema import load_schema_bundle
+from openedx_events.event_bus.background import get_background_producer
+from openedx_events.event_bus.encoded import EncodedEvent, get_event_key_extractor
+from openedx_events.event_bus.on_commit import publish_on_commit
 from openedx_events.exceptions import ProducerConfigurationError
-from openedx_events.tooling import SIGNAL_PROCESSED_FROM_EVENT_BUS, OpenEdxPublicSignal, load_all_signals
+from openedx_events.tooling import KNOWN_UNSERIALIZABLE_SIGNALS, SIGNAL_PROCESSED_FROM_EVENT_BUS, OpenEdxPublicSignal
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +33,7 @@ def general_signal_handler(sender, signal, **kwargs):  # pylint: disable=unused-
     # event_type_producer_configs should look something like
     # {
     #        "topic_a": { "event_key_field": "my.key.field", "enabled": True },
-    #        "topic_b": { "event_key_field": "my.key.field", "enabled": False }
+    #        "topic_b": { "event_key_field": "my.key.field", "enabled": False, "mode": "on-commit" }
     # }"
     if kwargs.get(SIGNAL_PROCESSED_FROM_EVENT_BUS) is True:
         logger.debug(
@@ -32,15 +44,32 @@ def general_signal_handler(sender, signal, **kwargs):  # pylint: disable=unused-
 
     event_data = {key: kwargs.get(key) for key in signal.init_data}
 
+    # .. setting_name: EVENT_BUS_PRODUCER_MODE
+    # .. setting_default: 'immediate'
+    # .. setting_description: How the events configured in EVENT_BUS_PRODUCER_CONFIG are published when their topic
+    #   configuration has no "mode" key: "immediate" publishes them when the signal is sent, "on-commit" when
+    #   the current database transaction commits (immediately if there is none), dropping the events of
+    #   transactions that are rolled back, and "outbox" saves them in the outbox table in the current transaction,
+    #   to be published by the relay_outbox management command. See ADR 0015.
+    default_mode = getattr(settings, "EVENT_BUS_PRODUCER_MODE", PRODUCER_MODE_IMMEDIATE)
+    # A single encoded event is shared by all the topics, so that it is serialized at most once.
+    encoded_event = EncodedEvent(signal, event_data, kwargs["metadata"])
     for topic in event_type_producer_configs.keys():
         if event_type_producer_configs[topic]["enabled"] is True:
-            get_producer().send(
-                signal=signal,
-                topic=topic,
-                event_key_field=event_type_producer_configs[topic]["event_key_field"],
-                event_data=event_data,
-                event_metadata=kwargs["metadata"],
-            )
+            message = {
+                "topic": topic,
+                "event_key_field": event_type_producer_configs[topic]["event_key_field"],
+                "encoded_event": encoded_event,
+            }
+            mode = event_type_producer_configs[topic].get("mode", default_mode)
+            if mode == PRODUCER_MODE_ON_COMMIT:
+                publish_on_commit(**message)
+            elif mode == PRODUCER_MODE_OUTBOX:
+                # Imported here since the outbox imports models, which can't be imported with the apps.
+                from openedx_events.event_bus.outbox import save_to_outbox  # pylint: disable=import-outside-toplevel
+                save_to_outbox(**message)
+            else:
+                (get_background_producer() or get_producer()).send_encoded(**message)
 
 
 class OpenedxEventsConfig(AppConfig):
@@ -50,16 +79,19 @@ class OpenedxEventsConfig(AppConfig):
 
     name = "openedx_events"
 
-    def _get_validated_signal_config(self, event_type, configuration):
+    def _get_validated_signal_config(self, event_type, configuration, default_mode=PRODUCER_MODE_IMMEDIATE):
         """
         Validate signal configuration format.
 
         Example expected signal configuration:
         {
             "topic_a": { "event_key_field": "my.key.field", "enabled": True },
-            "topic_b": { "event_key_field": "my.key.field", "enabled": False }
+            "topic_b": { "event_key_field": "my.key.field", "enabled": False, "mode": "on-commit" }
         }
 
+        The "mode" key is optional, see EVENT_BUS_PRODUCER_MODE. The event key fields are compiled and checked
+        against the data of the signal, see get_event_key_extractor.
+
         Raises:
             ProducerConfigurationError: If configuration is not valid.
         """
@@ -72,7 +104,7 @@ class OpenedxEventsConfig(AppConfig):
             signal = OpenEdxPublicSignal.get_signal_by_type(event_type)
         except KeyError as exc:
             raise ProducerConfigurationError(message=f"No OpenEdxPublicSignal of type: '{event_type}'.") from exc
-        for _, topic_configuration in configuration.items():
+        for topic, topic_configuration in configuration.items():
             if not isinstance(topic_configuration, dict):
                 raise ProducerConfigurationError(
                     event_type=event_type,
@@ -91,6 +123,24 @@ class OpenedxEventsConfig(AppConfig):
                         message=(f"Expected type: {expected_type} for '{expected_key}', "
                                  f"found: {type(topic_configuration[expected_key])}")
                     )
+            mode = topic_configuration.get("mode", default_mode)
+            if mode not in PRODUCER_MODES:
+                raise ProducerConfigurationError(
+                    event_type=event_type,
+                    message=f"Expected 'mode' to be one of {PRODUCER_MODES}, found: '{mode}'"
+                )
+            if mode == PRODUCER_MODE_OUTBOX and event_type in KNOWN_UNSERIALIZABLE_SIGNALS:
+                raise ProducerConfigurationError(
+                    event_type=event_type,
+                    message="Events that can't be serialized can't be published with the outbox mode"
+                )
+            try:
+                get_event_key_extractor(signal, topic_configuration["event_key_field"])
+            except ValueError as exc:
+                raise ProducerConfigurationError(
+                    event_type=event_type,
+                    message=f"Invalid 'event_key_field' for topic '{topic}': {exc}"
+                ) from exc
         return signal
 
     def ready(self):
@@ -111,14 +161,38 @@ class OpenedxEventsConfig(AppConfig):
         Raises:
             ProducerConfigurationError: If `EVENT_BUS_PRODUCER_CONFIG` is not valid.
         """
-        load_all_signals()
+        # .. setting_name: EVENT_BUS_AVRO_SCHEMA_BUNDLE
+        # .. setting_default: None
+        # .. setting_description: Path of a JSON bundle of prebuilt Avro schemas, as written by
+        #   ``generate_avro_schemas --bundle``. Loading it at startup saves generating the schema of every signal
+        #   from its attrs classes, which shortens the cold start of short-lived processes. The bundle is ignored if
+        #   it was built by another version of openedx-events.
+        bundle_path = getattr(settings, "EVENT_BUS_AVRO_SCHEMA_BUNDLE", None)
+        if bundle_path:
+            with open(bundle_path, encoding="utf-8") as bundle_file:
+                load_schema_bundle(json.load(bundle_file))
+
         signals_config = getattr(settings, "EVENT_BUS_PRODUCER_CONFIG", {})
         if not isinstance(signals_config, dict):
             raise ProducerConfigurationError(
                 message=("Setting 'EVENT_BUS_PRODUCER_CONFIG' should be a dictionary with event_type as"
                          " key and list or tuple of config dictionaries as values")
             )
+        producer_mode = getattr(settings, "EVENT_BUS_PRODUCER_MODE", PRODUCER_MODE_IMMEDIATE)
+        if producer_mode not in PRODUCER_MODES:
+            raise ProducerConfigurationError(
+                message=f"Setting 'EVENT_BUS_PRODUCER_MODE' should be one of {PRODUCER_MODES}, found: '{producer_mode}'"
+            )
         for event_type, configurations in signals_config.items():
-            signal = self._get_validated_signal_config(event_type, configurations)
+            signal = self._get_validated_signal_config(event_type, configurations, producer_mode)
             signal.connect(general_signal_handler)
+
+        # .. setting_name: EVENT_BUS_AVRO_CUSTOM_SERIALIZER_CACHE_SIZE
+        # .. setting_default: None
+        # .. setting_description: If set, enables LRU caches of this size for the conversions done by the default
+        #   Avro custom serializers (e.g. parsing course and usage keys). Useful when a small set of keys is
+        #   repeated across many events. See ``openedx_events.event_bus.avro.custom_serializers.InterningCache``.
+        cache_size = getattr(settings, "EVENT_BUS_AVRO_CUSTOM_SERIALIZER_CACHE_SIZE", None)
+        if cache_size:
+            enable_custom_serializer_caches(maxsize=cache_size)
         return super().ready()
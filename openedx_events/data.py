@@ -7,11 +7,14 @@ pattern.
 import json
 import socket
 from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import UUID, uuid1
 
 import attr
 import attrs
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 import openedx_events
 
@@ -40,16 +43,44 @@ def get_service_name():
     return getattr(settings, "EVENTS_SERVICE_NAME", None) or getattr(settings, "SERVICE_VARIANT", None)
 
 
+@lru_cache(maxsize=None)
 def _get_source():
     """
     Get the source for an event using the service name.
 
     If the service name is set, the full source will be set to openedx/<service_name>/web or
     openedx/SERVICE_NAME_UNSET/web if service name is None.
+
+    The source is computed once per process, and again when the settings it depends on change.
     """
     return "openedx/{service}/web".format(service=(get_service_name() or "SERVICE_NAME_UNSET"))
 
 
+@lru_cache(maxsize=None)
+def _get_sourcehost():
+    """
+    Get the physical source of events, i.e. the host name, once per process.
+    """
+    return socket.gethostname()
+
+
+@lru_cache(maxsize=None)
+def _get_sourcelib():
+    """
+    Get the version of the Open edX Events library as a tuple of ints, once per process.
+    """
+    return tuple(map(int, openedx_events.__version__.split(".")))
+
+
+@receiver(setting_changed)
+def _reset_source(setting, **kwargs):  # pylint: disable=unused-argument
+    """
+    Forget the cached event source when the service name settings change (e.g. in tests).
+    """
+    if setting in ("EVENTS_SERVICE_NAME", "SERVICE_VARIANT"):
+        _get_source.cache_clear()
+
+
 @attr.s(frozen=True)
 class EventsMetadata:
     """
@@ -89,9 +120,7 @@ class EventsMetadata:
     )
     sourcehost = attr.ib(
         type=str, default=None,
-        converter=attr.converters.default_if_none(
-            attr.Factory(lambda: socket.gethostname())  # pylint: disable=unnecessary-lambda
-        ),
+        converter=attr.converters.default_if_none(attr.Factory(_get_sourcehost)),
         validator=attr.validators.instance_of(str),
     )
     time = attr.ib(
@@ -101,9 +130,7 @@ class EventsMetadata:
     )
     sourcelib = attr.ib(
         type=tuple, default=None,
-        converter=attr.converters.default_if_none(
-            attr.Factory(lambda: tuple(map(int, openedx_events.__version__.split("."))))
-        ),
+        converter=attr.converters.default_if_none(attr.Factory(_get_sourcelib)),
         validator=attr.validators.instance_of(tuple),
     )
 
@@ -140,4 +167,5 @@ class EventsMetadata:
         time = datetime.fromisoformat(as_json['time'])
         sourcelib = tuple(as_json['sourcelib'])
         return cls(event_type=as_json['event_type'], id=UUID(as_json['id']), source=as_json['source'],
-                   sourcehost=as_json['sourcehost'], time=time, sourcelib=sourcelib)
+                   sourcehost=as_json['sourcehost'], time=time, sourcelib=sourcelib,
+                   minorversion=as_json.get('minorversion', 0))
@@ -18,6 +18,7 @@ import copy
 import warnings
 from abc import ABC, abstractmethod
 from functools import lru_cache
+from typing import Iterable, Optional
 
 from django.conf import settings
 from django.dispatch import receiver
@@ -25,8 +26,17 @@ from django.test.signals import setting_changed
 from django.utils.module_loading import import_string
 
 from openedx_events.data import EventsMetadata
+from openedx_events.event_bus.encoded import EncodedEvent
 from openedx_events.tooling import OpenEdxPublicSignal
 
+# Modes of publishing the events sent to the event bus by EVENT_BUS_PRODUCER_CONFIG, see ADR 0015:
+# immediately when the signal is sent, when the current database transaction commits, or through the
+# transactional outbox.
+PRODUCER_MODE_IMMEDIATE = "immediate"
+PRODUCER_MODE_ON_COMMIT = "on-commit"
+PRODUCER_MODE_OUTBOX = "outbox"
+PRODUCER_MODES = (PRODUCER_MODE_IMMEDIATE, PRODUCER_MODE_ON_COMMIT, PRODUCER_MODE_OUTBOX)
+
 
 def _try_load(*, setting_name: str, args: tuple, kwargs: dict, expected_class: type, default):
     """
@@ -90,6 +100,64 @@ class EventBusProducer(ABC):
             event_metadata: The CloudEvent metadata
         """
 
+    def send_encoded(self, *, topic: str, event_key_field: str, encoded_event: EncodedEvent) -> None:
+        """
+        Send an event, encoded once for all the topics it is sent to, to the event bus under the specified topic.
+
+        This is what ``general_signal_handler`` calls for each topic configured in EVENT_BUS_PRODUCER_CONFIG. The
+        default implementation calls ``send``; implementations can override it to use the Avro payload
+        (``encoded_event.value``), header values (``encoded_event.headers``) and key
+        (``encoded_event.key(event_key_field)``) shared by all the topics, instead of serializing the event again.
+
+        Arguments:
+            topic: The event bus topic for the event (without any environmental prefix)
+            event_key_field: Path to the event data field to use as the event key (period-delimited
+              string naming the dictionary keys to descend)
+            encoded_event: The event and its encodings
+        """
+        self.send(
+            signal=encoded_event.signal,
+            topic=topic,
+            event_key_field=event_key_field,
+            event_data=encoded_event.event_data,
+            event_metadata=encoded_event.event_metadata,
+        )
+
+    def send_batch(self, messages: Iterable[dict]) -> None:
+        """
+        Send a batch of events to the event bus, in order.
+
+        The default implementation calls ``send_encoded`` for each message, stopping at the first error.
+        Implementations can override it to hand the whole batch to their broker client, in which case
+        ``supports_batches`` is True.
+
+        Arguments:
+            messages: The keyword arguments of ``send_encoded`` for each event
+        """
+        for message in messages:
+            self.send_encoded(**message)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:  # pylint: disable=unused-argument
+        """
+        Wait until the events sent so far have been delivered to the event bus.
+
+        The default implementation returns immediately, for implementations delivering events synchronously.
+
+        Arguments:
+            timeout: Maximum number of seconds to wait, None to wait forever
+
+        Returns:
+            bool: Whether all the events were delivered
+        """
+        return True
+
+    @property
+    def supports_batches(self) -> bool:
+        """
+        Whether the implementation overrides ``send_batch``, rather than sending the events of a batch one by one.
+        """
+        return type(self).send_batch is not EventBusProducer.send_batch
+
 
 class NoEventBusProducer(EventBusProducer):
     """
@@ -102,6 +170,9 @@ class NoEventBusProducer(EventBusProducer):
     ) -> None:
         """Do nothing."""
 
+    def send_batch(self, messages: Iterable[dict]) -> None:
+        """Do nothing."""
+
 
 # .. setting_name: EVENT_BUS_PRODUCER
 # .. setting_default: None
@@ -117,7 +188,8 @@ def get_producer() -> EventBusProducer:
     """
     Create or retrieve the producer implementation, as configured.
 
-    If misconfigured, returns a fake implementation that can be called but does nothing.
+    If misconfigured, returns a fake implementation that can be called but does nothing. High-volume callers can
+    check ``supports_batches`` on the producer to hand it whole batches of events with ``send_batch``.
     """
     return _try_load(
         setting_name='EVENT_BUS_PRODUCER', args=(), kwargs={},
@@ -206,10 +278,13 @@ def merge_producer_configs(producer_config_original, producer_config_overrides):
             topic_config_combined = event_type_config_combined.get(topic, {})
             enabled_override = topic_config_overrides.get('enabled', None)
             event_key_field_override = topic_config_overrides.get('event_key_field', None)
+            mode_override = topic_config_overrides.get('mode', None)
             if enabled_override is not None:
                 topic_config_combined['enabled'] = enabled_override
             if event_key_field_override is not None:
                 topic_config_combined['event_key_field'] = event_key_field_override
+            if mode_override is not None:
+                topic_config_combined['mode'] = mode_override
             event_type_config_combined[topic] = topic_config_combined
         combined[event_type] = event_type_config_combined
     return combined
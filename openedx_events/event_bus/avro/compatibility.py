@@ -0,0 +1,264 @@
+"""
+Check the compatibility of Avro schemas, following the schema resolution rules of the Avro specification.
+
+A reader schema can read data written with a writer schema if the writer schema can be resolved against it.
+Compatibility levels are named after the schema being checked (the new schema) relative to an old one:
+
+* ``backward``: consumers using the new schema can read data written with the old one
+* ``forward``: consumers using the old schema can read data written with the new one
+* ``full``: both of the above
+
+See https://avro.apache.org/docs/current/spec.html#Schema+Resolution
+"""
+import json
+from pathlib import Path
+
+from .schema import schema_from_signal
+
+BACKWARD = "backward"
+FORWARD = "forward"
+FULL = "full"
+COMPATIBILITY_LEVELS = (BACKWARD, FORWARD, FULL)
+
+# Primitive types a reader can read data written with each primitive type, besides the type itself.
+_PROMOTIONS = {
+    "int": {"long", "float", "double"},
+    "long": {"float", "double"},
+    "float": {"double"},
+    "string": {"bytes"},
+    "bytes": {"string"},
+}
+
+_NAMED_TYPES = ("record", "enum", "fixed")
+
+
+def _collect_named_types(schema, names):
+    """
+    Add the named types defined anywhere in an Avro schema to names, mapping their names to their definitions.
+    """
+    if isinstance(schema, list):
+        for branch in schema:
+            _collect_named_types(branch, names)
+    elif isinstance(schema, dict):
+        schema_type = schema["type"]
+        if schema_type in _NAMED_TYPES:
+            names[schema["name"]] = schema
+        if schema_type == "record":
+            for field in schema["fields"]:
+                _collect_named_types(field["type"], names)
+        elif schema_type == "array":
+            _collect_named_types(schema["items"], names)
+        elif schema_type == "map":
+            _collect_named_types(schema["values"], names)
+        elif isinstance(schema_type, (dict, list)):
+            _collect_named_types(schema_type, names)
+
+
+class _SchemaPair:
+    """
+    The reader and writer schemas being resolved, with the named types each of them defines.
+    """
+
+    def __init__(self, reader_schema, writer_schema):
+        self.reader_names = {}
+        self.writer_names = {}
+        _collect_named_types(reader_schema, self.reader_names)
+        _collect_named_types(writer_schema, self.writer_names)
+        # Pairs of named types being checked, to stop on recursive types.
+        self.in_progress = set()
+
+    def check(self, reader, writer, path, problems):
+        """
+        Append to problems a message for each part of writer that can't be resolved against reader.
+        """
+        reader = self._resolve(reader, self.reader_names)
+        writer = self._resolve(writer, self.writer_names)
+
+        if isinstance(writer, list):
+            for branch in writer:
+                if isinstance(reader, list):
+                    if not any(self._can_read(reader_branch, branch, path) for reader_branch in reader):
+                        problems.append(f"{path}: union branch {_type_name(branch)} is not in the reader union")
+                else:
+                    self.check(reader, branch, path, problems)
+            return
+        if isinstance(reader, list):
+            if not any(self._can_read(reader_branch, writer, path) for reader_branch in reader):
+                problems.append(f"{path}: {_type_name(writer)} is not in the reader union")
+            return
+
+        reader_type = _type_name(reader)
+        writer_type = _type_name(writer)
+        if reader_type != writer_type and reader_type not in _PROMOTIONS.get(writer_type, ()):
+            problems.append(f"{path}: {writer_type} can't be read as {reader_type}")
+        elif isinstance(reader, dict) and isinstance(writer, dict):
+            self._check_complex(reader, writer, path, problems)
+
+    def _can_read(self, reader, writer, path):
+        return not self.incompatibilities(reader, writer, path)
+
+    def incompatibilities(self, reader, writer, path=""):
+        """
+        Get a message for each part of writer that can't be resolved against reader.
+        """
+        problems = []
+        self.check(reader, writer, path, problems)
+        return problems
+
+    def _check_complex(self, reader, writer, path, problems):
+        """
+        Check complex types with the same type name, or named types with the same name.
+        """
+        schema_type = reader["type"]
+        if schema_type == "array":
+            self.check(reader["items"], writer["items"], f"{path}[]", problems)
+        elif schema_type == "map":
+            self.check(reader["values"], writer["values"], f"{path}{{}}", problems)
+        elif schema_type == "fixed":
+            if reader["size"] != writer["size"]:
+                problems.append(f"{path}: fixed size changed from {writer['size']} to {reader['size']}")
+        elif schema_type == "enum":
+            missing = set(writer["symbols"]) - set(reader["symbols"])
+            if missing and "default" not in reader:
+                problems.append(f"{path}: enum symbols {sorted(missing)} are missing from the reader")
+        elif schema_type == "record":
+            key = (reader["name"], writer["name"])
+            if key in self.in_progress:
+                return
+            self.in_progress.add(key)
+            try:
+                self._check_record(reader, writer, path, problems)
+            finally:
+                self.in_progress.discard(key)
+
+    def _check_record(self, reader, writer, path, problems):
+        """
+        Check that each field of the reader record is either in the writer record, or has a default.
+        """
+        writer_fields = {}
+        for field in writer["fields"]:
+            writer_fields[field["name"]] = field
+        for field in reader["fields"]:
+            field_path = f"{path}.{field['name']}" if path else field["name"]
+            writer_field = writer_fields.get(field["name"])
+            if writer_field is None:
+                writer_field = next(
+                    (writer_fields[alias] for alias in field.get("aliases", ()) if alias in writer_fields), None
+                )
+            if writer_field is not None:
+                self.check(field["type"], writer_field["type"], field_path, problems)
+            elif "default" not in field:
+                problems.append(f"{field_path}: field is missing from the writer and has no default")
+
+    @staticmethod
+    def _resolve(schema, names):
+        """
+        Replace named type references by their definitions, and unwrap {"type": <primitive>} definitions.
+        """
+        if isinstance(schema, str):
+            return names.get(schema, schema)
+        if isinstance(schema, dict) and isinstance(schema["type"], (str, list)) and schema["type"] not in (
+            *_NAMED_TYPES, "array", "map"
+        ):
+            return _SchemaPair._resolve(schema["type"], names)
+        return schema
+
+
+def _type_name(schema):
+    """
+    Get the name used to compare types: the name of named types, and the type of other types.
+    """
+    if isinstance(schema, str):
+        return schema
+    if isinstance(schema, list):
+        return "union"
+    if schema["type"] in _NAMED_TYPES:
+        return schema["name"]
+    return schema["type"]
+
+
+def check_can_read(reader_schema, writer_schema):
+    """
+    Check that data written with writer_schema can be read with reader_schema.
+
+    Arguments:
+        reader_schema: An Avro schema, as a dict
+        writer_schema: An Avro schema, as a dict
+
+    Returns:
+        list: A message for each incompatibility found, empty if the schemas are compatible
+    """
+    return _SchemaPair(reader_schema, writer_schema).incompatibilities(reader_schema, writer_schema)
+
+
+def check_compatibility(new_schema, old_schema, level=FULL):
+    """
+    Check the compatibility of a new version of a schema with an old one.
+
+    Arguments:
+        new_schema: The new Avro schema, as a dict
+        old_schema: The old Avro schema, as a dict
+        level: One of BACKWARD, FORWARD or FULL
+
+    Returns:
+        list: A message for each incompatibility found, empty if the schemas are compatible
+    """
+    if level not in COMPATIBILITY_LEVELS:
+        raise ValueError(f"Unknown compatibility level {level}, expected one of {COMPATIBILITY_LEVELS}")
+    problems = []
+    if level in (BACKWARD, FULL):
+        problems += [f"backward: {problem}" for problem in check_can_read(new_schema, old_schema)]
+    if level in (FORWARD, FULL):
+        problems += [f"forward: {problem}" for problem in check_can_read(old_schema, new_schema)]
+    return problems
+
+
+def load_schema_history(directory):
+    """
+    Load the stored schemas of signals from the .avsc files of a directory, parsing each file once.
+
+    Schemas are grouped by their namespace, which is the event type of the signal they were generated for, so a
+    directory can hold several versions of the schema of a signal.
+
+    Arguments:
+        directory: Path of the directory containing the .avsc files
+
+    Returns:
+        dict: Map of event type to a list of (file name, schema) tuples, sorted by file name
+    """
+    history = {}
+    for path in sorted(Path(directory).glob("*.avsc")):
+        with open(path, encoding="utf-8") as schema_file:
+            schema = json.load(schema_file)
+        history.setdefault(schema.get("namespace"), []).append((path.name, schema))
+    return history
+
+
+def check_signals_compatibility(signals, history, level=FULL):
+    """
+    Check the current schema of signals against their stored schemas.
+
+    Arguments:
+        signals: An iterable of serializable OpenEdxPublicSignal instances
+        history: Map of event type to a list of (file name, schema) tuples, see load_schema_history
+        level: One of BACKWARD, FORWARD or FULL
+
+    Returns:
+        dict: Map of event type to the list of problems found for its signal. Signals without stored schemas have a
+            problem reporting it. Compatible signals are left out.
+    """
+    problems_by_event_type = {}
+    for signal in signals:
+        stored_schemas = history.get(signal.event_type)
+        if not stored_schemas:
+            problems_by_event_type[signal.event_type] = ["no stored schema"]
+            continue
+        current_schema = schema_from_signal(signal)
+        problems = [
+            f"{file_name}: {problem}"
+            for file_name, stored_schema in stored_schemas
+            for problem in check_compatibility(current_schema, stored_schema, level)
+        ]
+        if problems:
+            problems_by_event_type[signal.event_type] = problems
+    return problems_by_event_type
@@ -0,0 +1,117 @@
+"""
+Write and read streams of events to and from Avro Object Container Files.
+
+Each record in the file holds an event's data, using the schema generated for its signal, and its
+EventsMetadata. A file only holds events of a single signal, whose event type is stored in the file header.
+
+See https://avro.apache.org/docs/current/spec.html#Object+Container+Files
+"""
+from datetime import datetime
+from uuid import UUID
+
+import fastavro
+
+from openedx_events.data import EventsMetadata
+from openedx_events.tooling import OpenEdxPublicSignal
+
+from .deserializer import get_signal_deserializer
+from .serializer import get_signal_serializer
+
+# Key of the file header metadata entry holding the event type of the events in the file.
+EVENT_TYPE_METADATA_KEY = "openedx.event_type"
+
+EVENTS_METADATA_AVRO_SCHEMA = {
+    "name": "EventsMetadata",
+    "type": "record",
+    "fields": [
+        {"name": "id", "type": "string"},
+        {"name": "event_type", "type": "string"},
+        {"name": "minorversion", "type": "long"},
+        {"name": "source", "type": "string"},
+        {"name": "sourcehost", "type": "string"},
+        {"name": "time", "type": "string"},
+        {"name": "sourcelib", "type": {"type": "array", "items": "long"}},
+    ],
+}
+
+
+def _container_schema_from_signal(signal):
+    """
+    Create the Avro schema of the records of a container file for events sent by signal.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+    """
+    return {
+        "name": "EventRecord",
+        "type": "record",
+        "doc": "Event data and metadata of an Open edX event, as stored by openedx_events/container",
+        "namespace": signal.event_type,
+        "fields": [
+            {"name": "metadata", "type": EVENTS_METADATA_AVRO_SCHEMA},
+            {"name": "data", "type": get_signal_serializer(signal).schema},
+        ],
+    }
+
+
+def _metadata_from_record(record):
+    """
+    Create an EventsMetadata object from an EventsMetadata Avro record dictionary.
+    """
+    return EventsMetadata(
+        event_type=record["event_type"],
+        id=UUID(record["id"]),
+        minorversion=record["minorversion"],
+        source=record["source"],
+        sourcehost=record["sourcehost"],
+        time=datetime.fromisoformat(record["time"]),
+        sourcelib=tuple(record["sourcelib"]),
+    )
+
+
+def write_events_to_container(fo, signal, events, codec="deflate", sync_interval=16000):
+    """
+    Write events sent by a signal to an Avro Object Container File.
+
+    Arguments:
+        fo: A writable binary file-like object
+        signal: An instance of OpenEdxPublicSignal that sent the events
+        events: An iterable of (event_data, metadata) tuples, where event_data is a dict as sent via the signal's
+            send_event method and metadata is its EventsMetadata
+        codec: Block compression codec, one of the codecs supported by fastavro. Defaults to "deflate".
+        sync_interval: Approximate size in bytes of the uncompressed blocks
+    """
+    serializer = get_signal_serializer(signal)
+    records = (
+        {"metadata": metadata.to_json_data(), "data": serializer.to_dict(event_data)}
+        for event_data, metadata in events
+    )
+    fastavro.writer(
+        fo,
+        fastavro.parse_schema(_container_schema_from_signal(signal)),
+        records,
+        codec=codec,
+        sync_interval=sync_interval,
+        metadata={EVENT_TYPE_METADATA_KEY: signal.event_type},
+    )
+
+
+def read_events_from_container(fo, signal=None):
+    """
+    Read events from an Avro Object Container File written by write_events_to_container.
+
+    Events are decoded one block at a time, so arbitrarily large files can be read with constant memory.
+
+    Arguments:
+        fo: A readable binary file-like object
+        signal: (Optional) The OpenEdxPublicSignal that sent the events. Defaults to the signal of the event type
+            stored in the file header.
+    Yields:
+        (event_data, metadata) tuples, where event_data can be sent by the signal and metadata is an EventsMetadata
+    """
+    reader = fastavro.reader(fo)
+    if signal is None:
+        signal = OpenEdxPublicSignal.get_signal_by_type(reader.metadata[EVENT_TYPE_METADATA_KEY])
+    deserializer = get_signal_deserializer(signal)
+    for record in reader:
+        yield deserializer.from_dict(record["data"]), _metadata_from_record(record["metadata"])
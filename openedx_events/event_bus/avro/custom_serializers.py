@@ -4,6 +4,7 @@ Classes to serialize and deserialize custom types used by openedx events. See RE
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import lru_cache
 
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import LibraryLocatorV2, LibraryUsageLocatorV2
@@ -11,6 +12,95 @@ from opaque_keys.edx.locator import LibraryLocatorV2, LibraryUsageLocatorV2
 from openedx_events.event_bus.avro.types import PYTHON_TYPE_TO_AVRO_MAPPING
 
 
+class InterningCache:
+    """
+    Opt-in, size-bounded LRU cache around a conversion function of custom serializers.
+
+    While disabled, calls go straight to the wrapped function. Once enabled, repeated values (e.g. the course keys
+    of a busy course) cost a dict lookup instead of a parse, and equal results are shared between events.
+    Only immutable values whose equality implies an identical conversion result can be cached.
+    """
+
+    def __init__(self, func):
+        """
+        Initialize a disabled cache.
+
+        Arguments:
+            func: Conversion function taking a single hashable argument
+        """
+        self.func = func
+        self._call = func
+
+    def __call__(self, value):
+        """Convert value, using the cache if enabled."""
+        return self._call(value)
+
+    def enable(self, maxsize):
+        """
+        Enable the cache, dropping any cached results and counters.
+
+        Arguments:
+            maxsize: Maximum number of results to keep
+        """
+        self._call = lru_cache(maxsize=maxsize)(self.func)
+
+    def disable(self):
+        """Disable the cache, dropping any cached results."""
+        self._call = self.func
+
+    def cache_info(self):
+        """Get the hits, misses, maxsize and currsize of the cache, or None if it is disabled."""
+        if self._call is self.func:
+            return None
+        return self._call.cache_info()
+
+
+# Caches for the conversions of custom serializers. Datetimes are only cached when parsed:
+# equal datetimes in different timezones have different ISO format representations.
+CUSTOM_SERIALIZER_CACHES = {
+    "CourseKey.deserialize": InterningCache(CourseKey.from_string),
+    "CourseKey.serialize": InterningCache(str),
+    "datetime.deserialize": InterningCache(datetime.fromisoformat),
+    "UsageKey.deserialize": InterningCache(UsageKey.from_string),
+    "UsageKey.serialize": InterningCache(str),
+    "LibraryLocatorV2.deserialize": InterningCache(LibraryLocatorV2.from_string),
+    "LibraryLocatorV2.serialize": InterningCache(str),
+    "LibraryUsageLocatorV2.deserialize": InterningCache(LibraryUsageLocatorV2.from_string),
+    "LibraryUsageLocatorV2.serialize": InterningCache(str),
+}
+
+
+def enable_custom_serializer_caches(maxsize=1024):
+    """
+    Enable the caches of the default custom serializers.
+
+    Arguments:
+        maxsize: Maximum number of results kept by each cache
+    """
+    for cache in CUSTOM_SERIALIZER_CACHES.values():
+        cache.enable(maxsize)
+
+
+def disable_custom_serializer_caches():
+    """
+    Disable the caches of the default custom serializers.
+    """
+    for cache in CUSTOM_SERIALIZER_CACHES.values():
+        cache.disable()
+
+
+def get_custom_serializer_cache_info():
+    """
+    Get the statistics of the enabled caches of the default custom serializers.
+
+    Returns:
+        dict: Map of cache name (e.g. "CourseKey.deserialize") to its lru_cache info
+    """
+    return {
+        name: info for name, cache in CUSTOM_SERIALIZER_CACHES.items() if (info := cache.cache_info()) is not None
+    }
+
+
 class BaseCustomTypeAvroSerializer(ABC):
     """
     Used by openedx_events.avro_utilities class to serialize/deserialize custom types.
@@ -41,12 +131,12 @@ class CourseKeyAvroSerializer(BaseCustomTypeAvroSerializer):
     @staticmethod
     def serialize(obj) -> str:
         """Serialize obj into string."""
-        return str(obj)
+        return CUSTOM_SERIALIZER_CACHES["CourseKey.serialize"](obj)
 
     @staticmethod
     def deserialize(data: str):
         """Deserialize string into obj."""
-        return CourseKey.from_string(data)
+        return CUSTOM_SERIALIZER_CACHES["CourseKey.deserialize"](data)
 
 
 class DatetimeAvroSerializer(BaseCustomTypeAvroSerializer):
@@ -69,7 +159,7 @@ class DatetimeAvroSerializer(BaseCustomTypeAvroSerializer):
     @staticmethod
     def deserialize(data: str):
         """Deserialize string into obj."""
-        return datetime.fromisoformat(data)
+        return CUSTOM_SERIALIZER_CACHES["datetime.deserialize"](data)
 
 
 class UsageKeyAvroSerializer(BaseCustomTypeAvroSerializer):
@@ -83,12 +173,12 @@ class UsageKeyAvroSerializer(BaseCustomTypeAvroSerializer):
     @staticmethod
     def serialize(obj) -> str:
         """Serialize obj into string."""
-        return str(obj)
+        return CUSTOM_SERIALIZER_CACHES["UsageKey.serialize"](obj)
 
     @staticmethod
     def deserialize(data: str):
         """Deserialize string into obj."""
-        return UsageKey.from_string(data)
+        return CUSTOM_SERIALIZER_CACHES["UsageKey.deserialize"](data)
 
 
 class LibraryLocatorV2AvroSerializer(BaseCustomTypeAvroSerializer):
@@ -102,12 +192,12 @@ class LibraryLocatorV2AvroSerializer(BaseCustomTypeAvroSerializer):
     @staticmethod
     def serialize(obj) -> str:
         """Serialize obj into string."""
-        return str(obj)
+        return CUSTOM_SERIALIZER_CACHES["LibraryLocatorV2.serialize"](obj)
 
     @staticmethod
     def deserialize(data: str):
         """Deserialize string into obj."""
-        return LibraryLocatorV2.from_string(data)
+        return CUSTOM_SERIALIZER_CACHES["LibraryLocatorV2.deserialize"](data)
 
 
 class LibraryUsageLocatorV2AvroSerializer(BaseCustomTypeAvroSerializer):
@@ -121,12 +211,12 @@ class LibraryUsageLocatorV2AvroSerializer(BaseCustomTypeAvroSerializer):
     @staticmethod
     def serialize(obj) -> str:
         """Serialize obj into string."""
-        return str(obj)
+        return CUSTOM_SERIALIZER_CACHES["LibraryUsageLocatorV2.serialize"](obj)
 
     @staticmethod
     def deserialize(data: str):
         """Deserialize string into obj."""
-        return LibraryUsageLocatorV2.from_string(data)
+        return CUSTOM_SERIALIZER_CACHES["LibraryUsageLocatorV2.deserialize"](data)
 
 
 DEFAULT_CUSTOM_SERIALIZERS = [
@@ -136,3 +226,43 @@ DEFAULT_CUSTOM_SERIALIZERS = [
     LibraryUsageLocatorV2AvroSerializer,
     UsageKeyAvroSerializer,
 ]
+
+
+class CustomTypeDispatchTable:
+    """
+    Resolve the custom serialization (or deserialization) method to use for a Python type.
+
+    Resolution walks the type's MRO, so subclasses of a registered class (e.g. ``CourseLocator`` for
+    ``CourseKey``) use the method of their closest registered ancestor. Results are memoized per type,
+    so lookups only cost a dict access after the first one for each concrete type.
+    """
+
+    def __init__(self, methods):
+        """
+        Initialize the dispatch table.
+
+        Arguments:
+            methods: A map of Python type to (de)serialization method
+        """
+        self.methods = dict(methods)
+        self._resolved = {}
+
+    def get(self, data_type):
+        """
+        Get the method registered for data_type or its closest ancestor, or None if there isn't one.
+
+        Arguments:
+            data_type: Python type of a value or attrs field, eg `CourseKey`, `datetime`, `List[int]`
+        """
+        try:
+            return self._resolved[data_type]
+        except KeyError:
+            pass
+        method = None
+        if isinstance(data_type, type):
+            for klass in data_type.__mro__:
+                if klass in self.methods:
+                    method = self.methods[klass]
+                    break
+        self._resolved[data_type] = method
+        return method
@@ -3,18 +3,155 @@ Deserialize Avro record dictionaries to events that can be sent with OpenEdxPubl
 """
 import io
 import json
+from functools import cached_property, lru_cache
+from pathlib import Path
 from typing import get_args, get_origin
 
 import attr
 import fastavro
 
-from .custom_serializers import DEFAULT_CUSTOM_SERIALIZERS
-from .schema import schema_from_signal
+from openedx_events.tooling import KNOWN_UNSERIALIZABLE_SIGNALS, OpenEdxPublicSignal
+
+from .custom_serializers import DEFAULT_CUSTOM_SERIALIZERS, CustomTypeDispatchTable
+from .schema import (
+    SINGLE_OBJECT_MARKER,
+    fingerprint_from_signal,
+    schema_fingerprint,
+    schema_from_signal,
+    schema_string_from_signal,
+)
 from .types import PYTHON_TYPE_TO_AVRO_MAPPING, SIMPLE_PYTHON_TYPE_TO_AVRO_MAPPING
 
 # Dict of class to deserialize methods (e.g. datetime => DatetimeAvroSerializer.deserialize)
 DEFAULT_DESERIALIZERS = {serializer.cls: serializer.deserialize for serializer in DEFAULT_CUSTOM_SERIALIZERS}
 
+# Number of writer schema dicts whose fingerprint a deserializer remembers, see get_parsed_writer_schema.
+WRITER_SCHEMA_FINGERPRINT_CACHE_SIZE = 32
+
+# Number of unknown fingerprints remembered, see _get_decoder_by_fingerprint.
+UNKNOWN_FINGERPRINT_CACHE_SIZE = 1024
+
+
+def _get_deserializer_table(deserializers=None):
+    """
+    Merge custom deserializers with DEFAULT_DESERIALIZERS into a CustomTypeDispatchTable.
+
+    Arguments:
+        deserializers: Map of Python data type to deserializer method, or an already built CustomTypeDispatchTable
+    """
+    if isinstance(deserializers, CustomTypeDispatchTable):
+        return deserializers
+    return CustomTypeDispatchTable({**DEFAULT_DESERIALIZERS, **(deserializers or {})})
+
+
+class _AvroRecordDecoder:
+    """
+    Builds decoding plans converting Avro record dictionaries into instances of Python data types.
+
+    A decoding function is compiled once per data type: it already knows the attrs class to construct,
+    which fields need a custom deserializer (e.g. `CourseKey.from_string`) and which can be passed
+    through unchanged, so decoding a message involves no type introspection.
+    """
+
+    def __init__(self, deserializers=None):
+        """
+        Initialize the decoder.
+
+        Arguments:
+            deserializers: Map of Python data type to deserializer method, or a CustomTypeDispatchTable
+        """
+        self.deserializer_table = _get_deserializer_table(deserializers)
+        self._attrs_decoders = {}
+
+    def get_decoder(self, data_type):
+        """
+        Compile a function converting Avro data into an instance of data_type.
+
+        Returns None if the data can be used as is.
+
+        Arguments:
+            data_type: Desired Python data type, eg `str`, `CourseKey`, `CourseEnrollmentData`
+
+        Raises:
+            TypeError: If data_type can't be deserialized
+        """
+        # get generic type of data_type
+        # if data_type == List[int], data_type_origin = list
+        data_type_origin = get_origin(data_type)
+
+        if deserializer := self.deserializer_table.get(data_type):
+            return deserializer
+        elif data_type in PYTHON_TYPE_TO_AVRO_MAPPING:
+            return None
+        elif data_type_origin == list:
+            # returns types of list contents
+            # if data_type == List[int], arg_data_type = (int,)
+            arg_data_type = get_args(data_type)
+            if not arg_data_type:
+                raise TypeError(
+                    "List without annotation type is not supported. The argument should be a type, for eg., List[int]"
+                )
+            # check whether list items type is in basic types.
+            if arg_data_type[0] in SIMPLE_PYTHON_TYPE_TO_AVRO_MAPPING:
+                return None
+        elif hasattr(data_type, "__attrs_attrs__"):
+            return self.get_attrs_decoder(data_type)
+        raise TypeError(
+            f"Unable to deserialize {data_type} data, please add CustomTypeAvroSerializer for custom data type"
+        )
+
+    def get_attrs_decoder(self, data_type):
+        """
+        Get the function converting Avro record dictionaries into instances of the attrs class data_type.
+
+        Arguments:
+            data_type: An attrs decorated class, eg `CourseEnrollmentData`
+        """
+        if decoder := self._attrs_decoders.get(data_type):
+            return decoder
+
+        # Register the decoder before compiling the fields, so self-referencing classes don't recurse forever.
+        field_decoders = []
+
+        def decode_attrs(data):
+            transformed = {}
+            for name, decode, required in field_decoders:
+                if name in data:
+                    sub_data = data[name]
+                    # Empty optional values are left to the attrs default.
+                    if sub_data or required:
+                        transformed[name] = sub_data if decode is None else decode(sub_data)
+            return data_type(**transformed)
+
+        self._attrs_decoders[data_type] = decode_attrs
+        try:
+            field_decoders.extend(
+                (attribute.name, self.get_decoder(attribute.type), attribute.default is attr.NOTHING)
+                for attribute in data_type.__attrs_attrs__
+            )
+        except TypeError:
+            del self._attrs_decoders[data_type]
+            raise
+        return decode_attrs
+
+    def get_event_data_decoder(self, signal):
+        """
+        Compile a function converting Avro record dictionaries into event data that can be sent by signal.
+
+        Arguments:
+            signal: An instance of OpenEdxPublicSignal
+        """
+        data_decoders = tuple(
+            (data_key, self.get_decoder(data_type)) for data_key, data_type in signal.init_data.items()
+        )
+
+        def decode_event_data(avro_record_dict):
+            return {
+                data_key: avro_record_dict[data_key] if decode is None else decode(avro_record_dict[data_key])
+                for data_key, decode in data_decoders
+            }
+        return decode_event_data
+
 
 def _deserialized_avro_record_dict_to_object(data: dict, data_type, deserializers=None):
     """
@@ -26,45 +163,12 @@ def _deserialized_avro_record_dict_to_object(data: dict, data_type, deserializer
     Arguments:
         data: Dictionary representation of an Avro record
         data_type: Desired Python data type, eg `str`, `CourseKey`, `CourseEnrollmentData`
-        deserializers: Map of Python data type to deserializer method
+        deserializers: Map of Python data type to deserializer method, or a CustomTypeDispatchTable
     Returns:
         An instance of data_type
     """
-    param_deserializers = deserializers or {}
-    all_deserializers = {**DEFAULT_DESERIALIZERS, **param_deserializers}
-    # get generic type of data_type
-    # if data_type == List[int], data_type_origin = list
-    data_type_origin = get_origin(data_type)
-
-    if deserializer := all_deserializers.get(data_type, None):
-        return deserializer(data)
-    elif data_type in PYTHON_TYPE_TO_AVRO_MAPPING:
-        return data
-    elif data_type_origin == list:
-        # returns types of list contents
-        # if data_type == List[int], arg_data_type = (int,)
-        arg_data_type = get_args(data_type)
-        if not arg_data_type:
-            raise TypeError(
-                "List without annotation type is not supported. The argument should be a type, for eg., List[int]"
-            )
-        # check whether list items type is in basic types.
-        if arg_data_type[0] in SIMPLE_PYTHON_TYPE_TO_AVRO_MAPPING:
-            return data
-    elif hasattr(data_type, "__attrs_attrs__"):
-        transformed = {}
-        for attribute in data_type.__attrs_attrs__:
-            if attribute.name in data:
-                sub_data = data[attribute.name]
-                if sub_data or attribute.default is attr.NOTHING:
-                    transformed[attribute.name] = _deserialized_avro_record_dict_to_object(sub_data,
-                                                                                           attribute.type,
-                                                                                           deserializers=deserializers)
-
-        return data_type(**transformed)
-    raise TypeError(
-        f"Unable to deserialize {data_type} data, please add CustomTypeAvroSerializer for custom data type"
-    )
+    decode = _AvroRecordDecoder(deserializers).get_decoder(data_type)
+    return data if decode is None else decode(data)
 
 
 def _avro_record_dict_to_event_data(signal, avro_record_dict, deserializers=None):
@@ -74,28 +178,47 @@ def _avro_record_dict_to_event_data(signal, avro_record_dict, deserializers=None
     Arguments:
         signal: An instance of OpenEdxPublicSignal
         avro_record_dict: Dictionary representation of an Avro record
-        deserializers: Map of Python data type to deserializer method
+        deserializers: Map of Python data type to deserializer method, or a CustomTypeDispatchTable
 
     Returns:
          An event data dictionary that can be sent by the given signal
     """
-    return {data_key: _deserialized_avro_record_dict_to_object(avro_record_dict[data_key], data_type, deserializers)
-            for data_key, data_type in signal.init_data.items()}
+    return _AvroRecordDecoder(deserializers).get_event_data_decoder(signal)(avro_record_dict)
 
 
-def deserialize_bytes_to_event_data(bytes_from_wire, signal):
+def _read_event_data(stream, deserializer, parsed_writer_schema=None):
+    """
+    Decode Avro-serialized event data from a stream.
+
+    Arguments:
+        stream: A binary file-like object positioned at the start of the payload
+        deserializer: The AvroSignalDeserializer of the signal that sent the event
+        parsed_writer_schema: (Optional) The parsed schema the payload was written with, if different from the
+            deserializer's own schema. See AvroSignalDeserializer.get_parsed_writer_schema.
+    """
+    if parsed_writer_schema is None:
+        as_dict = fastavro.schemaless_reader(stream, deserializer.parsed_schema)
+    else:
+        as_dict = fastavro.schemaless_reader(stream, parsed_writer_schema, deserializer.parsed_schema)
+    return deserializer.from_dict(as_dict)
+
+
+def deserialize_bytes_to_event_data(bytes_from_wire, signal, writer_schema=None):
     """
     Deserialize event_bus and Avro-serialized data.
 
+    To decode many messages of the same signal, e.g. in a consume loop, prefer a reusable AvroSignalReader.
+
     Arguments:
-        bytes_from_wire: data that was serialized by an Avro serializer
+        bytes_from_wire: data that was serialized by an Avro serializer, as any bytes-like object
         signal: An instance of OpenEdxPublicSignal
+        writer_schema: (Optional) The schema the data was written with, if it may differ from the schema of the
+            signal (e.g. it was produced by an older version of openedx-events). Either a schema dict, or the
+            fingerprint of a schema registered with register_writer_schema.
     """
-    deserializer = AvroSignalDeserializer(signal)
-    schema_dict = deserializer.schema
-    data_file = io.BytesIO(bytes_from_wire)
-    as_dict = fastavro.schemaless_reader(data_file, schema_dict)
-    return deserializer.from_dict(as_dict)
+    deserializer = get_signal_deserializer(signal)
+    parsed_writer_schema = None if writer_schema is None else deserializer.get_parsed_writer_schema(writer_schema)
+    return _read_event_data(io.BytesIO(bytes_from_wire), deserializer, parsed_writer_schema)
 
 
 class AvroSignalDeserializer:
@@ -119,16 +242,90 @@ class AvroSignalDeserializer:
         """
         self.signal = signal
         self.deserializers = {ext.cls: ext.deserialize for ext in self.custom_type_serializers()}
+        self.deserializer_table = _get_deserializer_table(self.deserializers)
         self.custom_types = {ext.cls: ext.field_type for ext in self.custom_type_serializers()}
         self.schema = schema_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
+        self.parsed_schema = fastavro.parse_schema(self.schema)
+        self._parsed_writer_schemas = {}
+        # Map of id of a writer schema dict to the (writer schema, fingerprint) pair, see get_parsed_writer_schema.
+        self._writer_schema_fingerprints = {}
 
     def schema_string(self):
         """Get Avro schema as string."""
-        return json.dumps(self.schema, sort_keys=True)
+        return schema_string_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
+
+    @cached_property
+    def fingerprint(self):
+        """Get the CRC-64-AVRO fingerprint of the Avro schema, as bytes."""
+        return fingerprint_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
+
+    def get_parsed_writer_schema(self, writer_schema):
+        """
+        Get the parsed form of a writer schema, to decode payloads written with it using schema resolution.
+
+        Parsed writer schemas are cached per fingerprint. The fingerprint of a dict is computed once per dict (the
+        last WRITER_SCHEMA_FINGERPRINT_CACHE_SIZE ones are remembered by identity), so passing the same dict with
+        every payload doesn't compute its canonical form and CRC-64 again; the dict must not be modified. fastavro
+        still applies the resolution rules while reading each payload, it has no compiled reader to cache.
+
+        Arguments:
+            writer_schema: The schema payloads were written with, as a dict, or the fingerprint of either this
+                deserializer's schema or a schema registered with register_writer_schema
+
+        Returns:
+            The parsed writer schema, or None if it is this deserializer's own schema and needs no resolution
+
+        Raises:
+            ValueError: If writer_schema is the fingerprint of an unknown schema
+        """
+        if isinstance(writer_schema, bytes):
+            fingerprint = writer_schema
+        else:
+            fingerprint = self._get_writer_schema_fingerprint(writer_schema)
+        if fingerprint == self.fingerprint:
+            return None
+        try:
+            return self._parsed_writer_schemas[fingerprint]
+        except KeyError:
+            pass
+        if isinstance(writer_schema, bytes):
+            try:
+                writer_schema = _writer_schemas_by_fingerprint[fingerprint]
+            except KeyError as exc:
+                raise ValueError(f"No registered writer schema has the fingerprint {fingerprint.hex()}") from exc
+        parsed_writer_schema = fastavro.parse_schema(writer_schema)
+        self._parsed_writer_schemas[fingerprint] = parsed_writer_schema
+        return parsed_writer_schema
+
+    def _get_writer_schema_fingerprint(self, writer_schema):
+        """
+        Get the fingerprint of a writer schema dict, remembered by identity.
+
+        The dict is kept along with its fingerprint, so that its id can't be reused by another object.
+        """
+        try:
+            cached_schema, fingerprint = self._writer_schema_fingerprints[id(writer_schema)]
+            if cached_schema is writer_schema:
+                return fingerprint
+        except KeyError:
+            pass
+        fingerprint = schema_fingerprint(writer_schema)
+        if len(self._writer_schema_fingerprints) >= WRITER_SCHEMA_FINGERPRINT_CACHE_SIZE:
+            # Dicts built for each payload: evict the oldest one
+            del self._writer_schema_fingerprints[next(iter(self._writer_schema_fingerprints))]
+        self._writer_schema_fingerprints[id(writer_schema)] = (writer_schema, fingerprint)
+        return fingerprint
+
+    @cached_property
+    def _decode_event_data(self):
+        """
+        Get the decoding plan for the signal's event data, compiled on first use.
+        """
+        return _AvroRecordDecoder(self.deserializer_table).get_event_data_decoder(self.signal)
 
     def from_dict(self, avro_record_dict):
         """Convert Avro record dictionary to event data."""
-        return _avro_record_dict_to_event_data(self.signal, avro_record_dict, self.deserializers)
+        return self._decode_event_data(avro_record_dict)
 
     def custom_type_serializers(self):
         """
@@ -138,3 +335,252 @@ class AvroSignalDeserializer:
             A list of subclasses of BaseCustomTypeAvroSerializer
         """
         return []
+
+
+@lru_cache(maxsize=None)
+def get_signal_deserializer(signal, deserializer_class=AvroSignalDeserializer):
+    """
+    Get the process-wide deserializer for a signal, creating it on first use.
+
+    Instances are cached per (signal, deserializer class), so the schema is only generated and
+    parsed by fastavro once. The deserializer class determines the set of custom type serializers
+    in use.
+
+    Call ``get_signal_deserializer.cache_clear()`` to invalidate the cache (e.g. in tests).
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        deserializer_class: AvroSignalDeserializer or a subclass of it providing custom type serializers
+
+    Returns:
+        An instance of deserializer_class for the signal
+    """
+    return deserializer_class(signal)
+
+
+class AvroSignalReader:
+    """
+    Reusable reader of Avro-serialized event data for a signal.
+
+    ``read`` accepts any bytes-like object, including ``bytearray`` and ``memoryview`` slices into a larger
+    fetch buffer, so consumers don't need to copy each message into its own ``bytes`` object first.
+    Non-``bytes`` input is copied into a buffer owned by the reader and reused for every message, since
+    fastavro can only decode from streams returning ``bytes``.
+
+    Readers are not thread-safe; use one reader per consume loop.
+    """
+
+    def __init__(self, signal, deserializer_class=AvroSignalDeserializer, writer_schema=None):
+        """
+        Initialize the reader.
+
+        Arguments:
+            signal: An instance of OpenEdxPublicSignal
+            deserializer_class: AvroSignalDeserializer or a subclass of it providing custom type serializers
+            writer_schema: (Optional) The schema payloads were written with, if it may differ from the schema of
+                the signal. Either a schema dict, or the fingerprint of a schema registered with
+                register_writer_schema.
+        """
+        self.deserializer = get_signal_deserializer(signal, deserializer_class)
+        self.parsed_writer_schema = None
+        if writer_schema is not None:
+            self.parsed_writer_schema = self.deserializer.get_parsed_writer_schema(writer_schema)
+        self._stream = io.BytesIO()
+
+    def read(self, buffer):
+        """
+        Deserialize event data from a bytes-like object.
+
+        Arguments:
+            buffer: data that was serialized by an Avro serializer
+        Returns:
+            An event data dictionary that can be sent by the reader's signal
+        """
+        if isinstance(buffer, bytes):
+            # BytesIO shares the memory of a bytes object instead of copying it.
+            stream = io.BytesIO(buffer)
+        else:
+            stream = self._stream
+            stream.seek(0)
+            stream.truncate(stream.write(buffer))
+            stream.seek(0)
+        return _read_event_data(stream, self.deserializer, self.parsed_writer_schema)
+
+
+# Map of fingerprint to writer schemas that payloads may have been written with, besides the current schemas.
+_writer_schemas_by_fingerprint = {}
+
+# Map of schema fingerprint to the (deserializer, parsed writer schema) pair decoding payloads written with that
+# schema. The parsed writer schema is None when it is the deserializer's own schema.
+_decoders_by_fingerprint = {}
+
+# Number of signals whose default deserializers were registered by _get_decoder_by_fingerprint.
+_registered_signals_count = 0
+
+# Fingerprints no known schema had when all the signals were last registered.
+_unknown_fingerprints = set()
+
+
+def register_writer_schema(writer_schema):
+    """
+    Register a schema that payloads may have been written with, such as an archived schema of an older version.
+
+    Registered schemas can be referred to by fingerprint when deserializing, and single-object encoded payloads
+    written with them are resolved against the current schema of their signal (found by the schema's namespace).
+
+    Arguments:
+        writer_schema: An Avro schema generated for a signal, as a dict
+
+    Returns:
+        bytes: The fingerprint of the schema
+    """
+    fingerprint = schema_fingerprint(writer_schema)
+    _writer_schemas_by_fingerprint[fingerprint] = writer_schema
+    _unknown_fingerprints.discard(fingerprint)
+    return fingerprint
+
+
+def load_writer_schemas(directory):
+    """
+    Register all the schemas stored as .avsc files in a directory.
+
+    See the generate_avro_schemas management command, and the archived schemas in event_bus/avro/tests/schemas.
+
+    Arguments:
+        directory: Path of the directory containing the .avsc files
+
+    Returns:
+        list: The fingerprints of the loaded schemas
+    """
+    fingerprints = []
+    for path in sorted(Path(directory).glob("*.avsc")):
+        with open(path, encoding="utf-8") as schema_file:
+            fingerprints.append(register_writer_schema(json.load(schema_file)))
+    return fingerprints
+
+
+def register_deserializer_fingerprint(signal, deserializer_class=AvroSignalDeserializer):
+    """
+    Make single-object encoded payloads of a signal decodable with the given deserializer class.
+
+    Signals using the default deserializer don't need to be registered, see get_deserializer_by_fingerprint.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        deserializer_class: AvroSignalDeserializer or a subclass of it providing custom type serializers
+
+    Returns:
+        The registered deserializer
+    """
+    deserializer = get_signal_deserializer(signal, deserializer_class)
+    _decoders_by_fingerprint[deserializer.fingerprint] = (deserializer, None)
+    _unknown_fingerprints.discard(deserializer.fingerprint)
+    return deserializer
+
+
+def _get_decoder_by_fingerprint(fingerprint):
+    """
+    Get the (deserializer, parsed writer schema) pair for payloads written with the schema with the given fingerprint.
+
+    On a miss, the default deserializers of all serializable signals are registered, and registered writer schemas
+    are resolved against the deserializer of their signal, before looking again. Signals are only registered again
+    when new signals were created since, and fingerprints still unknown then are remembered, so that payloads written
+    with unknown schemas are rejected without scanning the signals each time.
+
+    Arguments:
+        fingerprint: CRC-64-AVRO fingerprint of the writer schema, as bytes
+
+    Raises:
+        ValueError: If no known schema has that fingerprint
+    """
+    global _registered_signals_count  # pylint: disable=global-statement
+    try:
+        return _decoders_by_fingerprint[fingerprint]
+    except KeyError:
+        pass
+    if fingerprint in _unknown_fingerprints and len(OpenEdxPublicSignal.instances) == _registered_signals_count:
+        raise ValueError(f"No known Avro schema has the fingerprint {fingerprint.hex()}")
+
+    deserializers_by_event_type = {
+        deserializer.signal.event_type: deserializer for deserializer, _ in _decoders_by_fingerprint.values()
+    }
+    signals = OpenEdxPublicSignal.all_events()
+    if len(signals) != _registered_signals_count:
+        for signal in signals:
+            if signal.event_type in KNOWN_UNSERIALIZABLE_SIGNALS or signal.event_type in deserializers_by_event_type:
+                continue
+            try:
+                deserializer = get_signal_deserializer(signal)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Signals whose data can't be represented in Avro can't have produced any payload either.
+                continue
+            deserializers_by_event_type[signal.event_type] = deserializer
+            _decoders_by_fingerprint.setdefault(deserializer.fingerprint, (deserializer, None))
+        _registered_signals_count = len(signals)
+        _unknown_fingerprints.clear()
+
+    if fingerprint not in _decoders_by_fingerprint and fingerprint in _writer_schemas_by_fingerprint:
+        event_type = _writer_schemas_by_fingerprint[fingerprint].get("namespace")
+        if deserializer := deserializers_by_event_type.get(event_type):
+            _decoders_by_fingerprint[fingerprint] = (deserializer, deserializer.get_parsed_writer_schema(fingerprint))
+
+    try:
+        return _decoders_by_fingerprint[fingerprint]
+    except KeyError as exc:
+        if len(_unknown_fingerprints) >= UNKNOWN_FINGERPRINT_CACHE_SIZE:
+            _unknown_fingerprints.clear()
+        _unknown_fingerprints.add(fingerprint)
+        raise ValueError(f"No known Avro schema has the fingerprint {fingerprint.hex()}") from exc
+
+
+def get_deserializer_by_fingerprint(fingerprint):
+    """
+    Get the deserializer for payloads written with the schema with the given fingerprint.
+
+    On a miss, the default deserializers of all serializable signals are registered before looking again.
+
+    Arguments:
+        fingerprint: CRC-64-AVRO fingerprint of the writer schema, as bytes
+
+    Raises:
+        ValueError: If no known schema has that fingerprint
+    """
+    return _get_decoder_by_fingerprint(fingerprint)[0]
+
+
+def clear_deserializer_fingerprints():
+    """
+    Forget all registered fingerprints and writer schemas (e.g. in tests).
+    """
+    global _registered_signals_count  # pylint: disable=global-statement
+    _decoders_by_fingerprint.clear()
+    _writer_schemas_by_fingerprint.clear()
+    _registered_signals_count = 0
+    _unknown_fingerprints.clear()
+
+
+def deserialize_single_object_bytes_to_event_data(bytes_from_wire):
+    """
+    Deserialize Avro single-object encoded data.
+
+    Payloads written with a registered writer schema (see register_writer_schema) are resolved against the current
+    schema of their signal.
+
+    Arguments:
+        bytes_from_wire: data that was serialized by serialize_event_data_to_single_object_bytes, as any bytes-like
+            object
+
+    Returns:
+        (signal, event_data) tuple, where event_data can be sent by signal
+
+    Raises:
+        ValueError: If the data is not single-object encoded, or was written with an unknown schema
+    """
+    data = memoryview(bytes_from_wire)
+    header_length = len(SINGLE_OBJECT_MARKER) + 8
+    if len(data) < header_length or data[:len(SINGLE_OBJECT_MARKER)] != SINGLE_OBJECT_MARKER:
+        raise ValueError("Data is not Avro single-object encoded")
+    deserializer, parsed_writer_schema = _get_decoder_by_fingerprint(
+        bytes(data[len(SINGLE_OBJECT_MARKER):header_length])
+    )
+    return deserializer.signal, _read_event_data(io.BytesIO(data[header_length:]), deserializer, parsed_writer_schema)
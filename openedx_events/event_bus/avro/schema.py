@@ -4,19 +4,212 @@ Code to convert attr classes to Avro specification.
 TODO: Handle optional parameters and allow for schema evolution. https://github.com/edx/edx-arch-experiments/issues/53
 """
 
-
+import json
+import logging
 from typing import get_args, get_origin
 
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+from openedx_events import __version__
+from openedx_events.signals_manifest import SIGNAL_MANIFEST
+from openedx_events.tooling import OpenEdxPublicSignal
+
 from .custom_serializers import DEFAULT_CUSTOM_SERIALIZERS
 from .types import PYTHON_TYPE_TO_AVRO_MAPPING, SIMPLE_PYTHON_TYPE_TO_AVRO_MAPPING
 
 DEFAULT_FIELD_TYPES = {serializer.cls: serializer.field_type for serializer in DEFAULT_CUSTOM_SERIALIZERS}
 
+# Marker preceding the schema fingerprint in Avro single-object encoded payloads.
+# See https://avro.apache.org/docs/current/spec.html#single_object_encoding
+SINGLE_OBJECT_MARKER = b"\xc3\x01"
+
+logger = logging.getLogger(__name__)
+
+# Schemas, schema strings and fingerprints generated for signals, keyed by _schema_cache_key.
+_schemas = {}
+_schema_strings = {}
+_fingerprints = {}
+# Entries of the loaded schema bundle not used yet, keyed by event type, see load_schema_bundle.
+_bundled_schemas = {}
+
+
+def schema_fingerprint(schema):
+    """
+    Compute the CRC-64-AVRO (Rabin) fingerprint of an Avro schema.
+
+    Arguments:
+        schema: An Avro schema, as a dict
+
+    Returns:
+        bytes: The 8 fingerprint bytes, in the little-endian order used by single-object encoding
+    """
+    return bytes.fromhex(fingerprint(to_parsing_canonical_form(schema), "CRC-64-AVRO"))
+
+
+def _schema_cache_key(signal, custom_type_to_avro_type):
+    """
+    Get the key of the schema caches for a signal and a map of custom Python classes to Avro types.
+    """
+    return signal, frozenset(
+        (data_type, json.dumps(avro_type, sort_keys=True))
+        for data_type, avro_type in (custom_type_to_avro_type or {}).items()
+    )
+
 
 def schema_from_signal(signal, custom_type_to_avro_type=None):
     """
     Create an Avro schema for events sent by an instance of OpenEdxPublicSignal.
 
+    Schemas are generated once per signal and map of custom types. The returned schema is shared and must not be
+    modified.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        custom_type_to_avro_type: A map of Python class to Avro type
+    """
+    key = _schema_cache_key(signal, custom_type_to_avro_type)
+    try:
+        return _schemas[key]
+    except KeyError:
+        pass
+    if _load_bundled_schema(signal, key):
+        return _schemas[key]
+    schema = _generate_schema_from_signal(signal, custom_type_to_avro_type)
+    _schemas[key] = schema
+    return schema
+
+
+def schema_string_from_signal(signal, custom_type_to_avro_type=None):
+    """
+    Get the Avro schema for events sent by an instance of OpenEdxPublicSignal, as a JSON string.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        custom_type_to_avro_type: A map of Python class to Avro type
+    """
+    key = _schema_cache_key(signal, custom_type_to_avro_type)
+    try:
+        return _schema_strings[key]
+    except KeyError:
+        pass
+    if _load_bundled_schema(signal, key):
+        return _schema_strings[key]
+    schema_string = json.dumps(schema_from_signal(signal, custom_type_to_avro_type), sort_keys=True)
+    _schema_strings[key] = schema_string
+    return schema_string
+
+
+def fingerprint_from_signal(signal, custom_type_to_avro_type=None):
+    """
+    Get the CRC-64-AVRO fingerprint of the Avro schema for events sent by an instance of OpenEdxPublicSignal.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        custom_type_to_avro_type: A map of Python class to Avro type
+
+    Returns:
+        bytes: The 8 fingerprint bytes, see schema_fingerprint
+    """
+    key = _schema_cache_key(signal, custom_type_to_avro_type)
+    try:
+        return _fingerprints[key]
+    except KeyError:
+        pass
+    if _load_bundled_schema(signal, key):
+        return _fingerprints[key]
+    schema_fingerprint_bytes = schema_fingerprint(schema_from_signal(signal, custom_type_to_avro_type))
+    _fingerprints[key] = schema_fingerprint_bytes
+    return schema_fingerprint_bytes
+
+
+def clear_schema_cache():
+    """
+    Forget all generated and bundled schemas (e.g. in tests).
+    """
+    _schemas.clear()
+    _schema_strings.clear()
+    _fingerprints.clear()
+    _bundled_schemas.clear()
+
+
+def build_schema_bundle(signals):
+    """
+    Build a bundle of the schemas of signals, using the default custom types, to be loaded with load_schema_bundle.
+
+    Arguments:
+        signals: An iterable of serializable OpenEdxPublicSignal instances
+
+    Returns:
+        dict: A JSON-serializable bundle holding the schema, schema string and fingerprint of each signal
+    """
+    return {
+        "openedx_events_version": __version__,
+        "schemas": {
+            signal.event_type: {
+                "schema": schema_from_signal(signal),
+                "schema_string": schema_string_from_signal(signal),
+                "fingerprint": fingerprint_from_signal(signal).hex(),
+            }
+            for signal in signals
+        },
+    }
+
+
+def load_schema_bundle(bundle):
+    """
+    Load a bundle built by build_schema_bundle, so that the schemas of the bundled signals aren't generated.
+
+    The entries are kept by event type, without importing the signals, and fill the schema caches of a signal the
+    first time its schema is needed, so that signals are still loaded lazily. A bundle built by another version of
+    openedx-events is ignored, since the signals it describes may have changed.
+
+    Arguments:
+        bundle: A bundle built by build_schema_bundle
+
+    Returns:
+        int: The number of schemas loaded
+    """
+    if bundle.get("openedx_events_version") != __version__:
+        logger.warning(
+            f"Ignoring Avro schema bundle built by openedx-events {bundle.get('openedx_events_version')}, "
+            f"running version is {__version__}"
+        )
+        return 0
+    known_event_types = OpenEdxPublicSignal._mapping.keys() | SIGNAL_MANIFEST.keys()  # pylint: disable=protected-access
+    loaded = 0
+    for event_type, entry in bundle["schemas"].items():
+        if event_type not in known_event_types:
+            logger.warning(f"Ignoring bundled Avro schema of unknown event type {event_type}")
+            continue
+        _bundled_schemas[event_type] = entry
+        loaded += 1
+    return loaded
+
+
+def _load_bundled_schema(signal, key):
+    """
+    Fill the schema caches of a signal from its entry of the loaded bundle, if any.
+
+    Bundles only hold the schemas generated with the default custom types, and each entry is used once.
+
+    Returns:
+        bool: whether the caches were filled.
+    """
+    if key[1]:
+        return False
+    entry = _bundled_schemas.pop(signal.event_type, None)
+    if entry is None:
+        return False
+    _schemas[key] = entry["schema"]
+    _schema_strings[key] = entry["schema_string"]
+    _fingerprints[key] = bytes.fromhex(entry["fingerprint"])
+    return True
+
+
+def _generate_schema_from_signal(signal, custom_type_to_avro_type=None):
+    """
+    Generate an Avro schema for events sent by an instance of OpenEdxPublicSignal from its data definition.
+
     Arguments:
         signal: An instance of OpenEdxPublicSignal
         custom_type_to_avro_type: A map of Python class to Avro type
@@ -2,81 +2,136 @@
 Serialize events to Avro records.
 """
 import io
-import json
+from functools import cached_property, lru_cache
 
-import attr
 import fastavro
 
-from .custom_serializers import DEFAULT_CUSTOM_SERIALIZERS
-from .schema import schema_from_signal
+from .custom_serializers import DEFAULT_CUSTOM_SERIALIZERS, CustomTypeDispatchTable
+from .schema import SINGLE_OBJECT_MARKER, fingerprint_from_signal, schema_from_signal, schema_string_from_signal
 
 DEFAULT_SERIALIZERS = {serializer.cls: serializer.serialize for serializer in DEFAULT_CUSTOM_SERIALIZERS}
 
+# Types that need no conversion to be part of an Avro record dictionary.
+_PASSTHROUGH_TYPES = frozenset([str, int, float, bool, type(None)])
 
-def _get_non_attrs_serializer(serializers=None):
+
+def _raise_for_none():
     """
-    Create a method to pass as the value_serializer argument to attr.as_dict to serialize using custom serializers.
+    Bail out early with an informative message rather than an inscrutable error from inside a custom serializer.
 
-    Arguments:
-        serializers: A map of Python type to serialization method
+    If we ever make a custom serializer that can handle None as an input, we can remove this check.
+    """
+    # pylint: disable-next=broad-exception-raised
+    raise Exception("None cannot be handled by custom serializers (and default=None was not set)")
 
-    Returns:
-        A method for serializing non_attrs values
-    """
-    param_serializers = serializers or {}
-    all_serializers = {**DEFAULT_SERIALIZERS, **param_serializers}
-
-    def _serialize_non_attrs_values(inst, field, value):  # pylint: disable=unused-argument
-        if value is None:
-            # All default=None fields are implicit union types of NoneType
-            # and something else. (See ADR 7.) Note that if there isn't a
-            # default at all, field.default will be attrs.NOTHING, not None.
-            if field.default is None:
-                return None
-            else:
-                # Bail out early with an informative message rather
-                # than ending up with an inscrutable error from inside
-                # a custom serializer.
-                #
-                # If we ever make a custom serializer that can handle
-                # None as an input, we can remove this check.
-                # pylint: disable-next=broad-exception-raised
-                raise Exception("None cannot be handled by custom serializers (and default=None was not set)")
-
-        for extended_class, serializer in all_serializers.items():
-            if field:
-                # Make sure that field.type is a class first.
-                if isinstance(field.type, type) and issubclass(field.type, extended_class):
-                    return serializer(value)
-            if issubclass(type(value), extended_class):
-                return serializer(value)
+
+class _AvroRecordEncoder:
+    """
+    Converts event data values into Avro record dictionary values.
+
+    An encoding function is compiled once per attrs class from its ``__attrs_attrs__`` and the custom serializers,
+    so the conversion of an event is a single pass over its data, without any per-value type introspection
+    for fields whose type is known ahead of time.
+    """
+
+    def __init__(self, serializers=None):
+        """
+        Initialize the encoder.
+
+        Arguments:
+            serializers: A map of Python type to serialization method, overriding DEFAULT_SERIALIZERS
+        """
+        self.serializers = CustomTypeDispatchTable({**DEFAULT_SERIALIZERS, **(serializers or {})})
+        self._attrs_encoders = {}
+
+    def encode_value(self, value):
+        """
+        Convert a value whose type is not known ahead of time, dispatching on its runtime type.
+        """
+        value_type = type(value)
+        if value_type in _PASSTHROUGH_TYPES:
+            return value
+        if serializer := self.serializers.get(value_type):
+            return serializer(value)
+        if hasattr(value_type, "__attrs_attrs__"):
+            return self.get_attrs_encoder(value_type)(value)
+        if isinstance(value, (tuple, list, set, frozenset)):
+            return [self.encode_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.encode_value(item) for key, item in value.items()}
         return value
-    return _serialize_non_attrs_values
 
+    def get_field_encoder(self, data_type, default_is_none=False):
+        """
+        Compile a function converting values of a field declared with data_type.
 
-def _event_data_to_avro_record_dict(event_data, serializers=None):
+        Arguments:
+            data_type: Declared Python type of the field, eg `str`, `CourseKey`, `CourseEnrollmentData`
+            default_is_none: Whether the field accepts None, i.e. has 'None' as a default (see ADR 7)
+        """
+        if serializer := self.serializers.get(data_type):
+            encode = serializer
+        elif hasattr(data_type, "__attrs_attrs__"):
+            encode = self.get_attrs_encoder(data_type)
+        else:
+            encode = self.encode_value
+
+        if default_is_none:
+            def encode_field(value):
+                return None if value is None else encode(value)
+        else:
+            def encode_field(value):
+                if value is None:
+                    _raise_for_none()
+                return encode(value)
+        return encode_field
+
+    def get_attrs_encoder(self, data_type):
+        """
+        Get the function converting instances of the attrs class data_type into Avro record dictionaries.
+
+        Arguments:
+            data_type: An attrs decorated class, eg `CourseEnrollmentData`
+        """
+        if encoder := self._attrs_encoders.get(data_type):
+            return encoder
+
+        # Register the encoder before compiling the fields, so self-referencing classes don't recurse forever.
+        field_encoders = []
+
+        def encode_attrs(value):
+            if type(value) is not data_type:  # pylint: disable=unidiomatic-typecheck
+                # A subclass may define more fields than the declared type; fall back to its own encoder.
+                return self.encode_value(value)
+            return {name: encode(getattr(value, name)) for name, encode in field_encoders}
+
+        self._attrs_encoders[data_type] = encode_attrs
+        field_encoders.extend(
+            (attribute.name, self.get_field_encoder(attribute.type, default_is_none=attribute.default is None))
+            for attribute in data_type.__attrs_attrs__
+        )
+        return encode_attrs
+
+
+def _event_data_to_avro_record_dict(event_data, serializers=None, encoder=None, field_encoders=None):
     """
     Create an Avro record dictionary from an event data dict.
 
     Arguments:
         event_data: A dictionary representing an event sent by an instance of OpenEdxPublicSignal
         serializers: A map of Python type to serialization method
+        encoder: (Optional) An _AvroRecordEncoder to reuse; created from serializers if not provided
+        field_encoders: (Optional) Map of event data key to compiled field encoder
 
     Returns:
         An Avro record dictionary representation of the event data
     """
-
-    def value_to_dict(value):
-        # Case 1: Value is an instance of an attrs-decorated class
-        if hasattr(value, "__attrs_attrs__"):
-            return attr.asdict(value, value_serializer=_get_non_attrs_serializer(serializers))
-        return _get_non_attrs_serializer(serializers)(None, None, value)
-
-    return json.loads(
-        json.dumps(
-            event_data, sort_keys=True, default=value_to_dict
-        )
-    )
+    encoder = encoder or _AvroRecordEncoder(serializers)
+    field_encoders = field_encoders or {}
+    return {
+        key: field_encoders[key](value) if key in field_encoders else encoder.encode_value(value)
+        for key, value in event_data.items()
+    }
 
 
 def serialize_event_data_to_bytes(event_data, signal):
@@ -89,13 +144,60 @@ def serialize_event_data_to_bytes(event_data, signal):
     Returns:
         bytes: Byte representation of the event_data, to be sent over the wire
     """
-    serializer = AvroSignalSerializer(signal)
-    schema_dict = serializer.schema
+    serializer = get_signal_serializer(signal)
     out = io.BytesIO()
     data_dict = serializer.to_dict(event_data)
-    fastavro.schemaless_writer(out, schema_dict, data_dict)
-    out.seek(0)
-    return out.read()
+    fastavro.schemaless_writer(out, serializer.parsed_schema, data_dict)
+    return out.getvalue()
+
+
+def serialize_event_data_to_single_object_bytes(event_data, signal):
+    """
+    Serialize event data to bytes using Avro single-object encoding.
+
+    The payload is prefixed with a marker and the fingerprint of the signal's schema, so consumers can find the
+    schema to decode it with, even when several event types or schema versions share a topic.
+
+    Arguments:
+        event_data: Event data to be sent via an OpenEdxPublicSignal's send_event method
+        signal: An instance of OpenEdxPublicSignal
+    Returns:
+        bytes: Single-object encoded representation of the event_data, to be sent over the wire
+    """
+    serializer = get_signal_serializer(signal)
+    out = io.BytesIO()
+    out.write(SINGLE_OBJECT_MARKER)
+    out.write(serializer.fingerprint)
+    fastavro.schemaless_writer(out, serializer.parsed_schema, serializer.to_dict(event_data))
+    return out.getvalue()
+
+
+def serialize_many(signal, events_data):
+    """
+    Serialize several event data dicts for the same signal into a single buffer.
+
+    All events are encoded back to back into one growable buffer, and the result for each event is a
+    zero-copy slice of it, so bulk producers don't pay for a new buffer and a bytes copy per event.
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        events_data: An iterable of event data dicts, as would be sent via the signal's send_event method
+    Returns:
+        list of memoryview: Byte representation of each event data dict, in order. The views share the
+        underlying buffer, which is kept alive for as long as any of them is.
+    """
+    serializer = get_signal_serializer(signal)
+    schema = serializer.parsed_schema
+    out = io.BytesIO()
+    offsets = []
+    start = 0
+    for event_data in events_data:
+        fastavro.schemaless_writer(out, schema, serializer.to_dict(event_data))
+        end = out.tell()
+        offsets.append((start, end))
+        start = end
+    buffer = out.getbuffer()
+    return [buffer[start:end] for start, end in offsets]
 
 
 class AvroSignalSerializer:
@@ -121,14 +223,28 @@ class AvroSignalSerializer:
         self.serializers = {ext.cls: ext.serialize for ext in self.custom_type_serializers()}
         self.custom_types = {ext.cls: ext.field_type for ext in self.custom_type_serializers()}
         self.schema = schema_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
+        self.parsed_schema = fastavro.parse_schema(self.schema)
+        self._encoder = _AvroRecordEncoder(self.serializers)
+        # Top-level event data is never validated against None, unlike attrs fields.
+        self._field_encoders = {
+            data_key: self._encoder.get_field_encoder(data_type, default_is_none=True)
+            for data_key, data_type in self.signal.init_data.items()
+        }
 
     def schema_string(self):
         """Get Avro schema as JSON string."""
-        return json.dumps(self.schema, sort_keys=True)
+        return schema_string_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
+
+    @cached_property
+    def fingerprint(self):
+        """Get the CRC-64-AVRO fingerprint of the Avro schema, as bytes."""
+        return fingerprint_from_signal(self.signal, custom_type_to_avro_type=self.custom_types)
 
     def to_dict(self, event_data):
         """Convert event data to an Avro record dictionary."""
-        return _event_data_to_avro_record_dict(event_data, serializers=self.serializers)
+        return _event_data_to_avro_record_dict(
+            event_data, encoder=self._encoder, field_encoders=self._field_encoders
+        )
 
     def custom_type_serializers(self):
         """
@@ -138,3 +254,24 @@ class AvroSignalSerializer:
             A list of subclasses of BaseCustomTypeAvroSerializer
         """
         return []
+
+
+@lru_cache(maxsize=None)
+def get_signal_serializer(signal, serializer_class=AvroSignalSerializer):
+    """
+    Get the process-wide serializer for a signal, creating it on first use.
+
+    Building a serializer walks every attrs class in the signal's ``init_data`` and parses the
+    resulting schema with fastavro, so instances are cached per (signal, serializer class). The
+    serializer class determines the set of custom type serializers in use.
+
+    Call ``get_signal_serializer.cache_clear()`` to invalidate the cache (e.g. in tests).
+
+    Arguments:
+        signal: An instance of OpenEdxPublicSignal
+        serializer_class: AvroSignalSerializer or a subclass of it providing custom type serializers
+
+    Returns:
+        An instance of serializer_class for the signal
+    """
+    return serializer_class(signal)
@@ -1,9 +1,12 @@
 """Test interplay of the various Avro helper classes"""
+import copy
 import io
+import json
 import os
 from datetime import datetime
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 from fastavro import schemaless_reader, schemaless_writer
 from fastavro.repository.base import SchemaRepositoryError
@@ -11,12 +14,29 @@ from fastavro.schema import load_schema
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import LibraryLocatorV2, LibraryUsageLocatorV2
 
-from openedx_events.event_bus.avro.deserializer import AvroSignalDeserializer, deserialize_bytes_to_event_data
-from openedx_events.event_bus.avro.serializer import AvroSignalSerializer, serialize_event_data_to_bytes
+from openedx_events.event_bus.avro.deserializer import (
+    AvroSignalDeserializer,
+    AvroSignalReader,
+    deserialize_bytes_to_event_data,
+    deserialize_single_object_bytes_to_event_data,
+    get_deserializer_by_fingerprint,
+    load_writer_schemas,
+    register_deserializer_fingerprint,
+    register_writer_schema,
+)
+from openedx_events.event_bus.avro.schema import SINGLE_OBJECT_MARKER, schema_fingerprint
+from openedx_events.event_bus.avro.serializer import (
+    AvroSignalSerializer,
+    serialize_event_data_to_bytes,
+    serialize_event_data_to_single_object_bytes,
+)
 from openedx_events.event_bus.avro.tests.test_utilities import (
     EventData,
     NestedAttrsWithDefaults,
+    NonAttrs,
     SimpleAttrsWithDefaults,
+    SpecialDeserializer,
+    SpecialSerializer,
     SubTestData0,
     SubTestData1,
     create_simple_signal,
@@ -259,3 +279,121 @@ class TestAvro(FreezeSignalCacheMixin, TestCase):
         self.assertEqual(deserialized, event_data)
         # ensure signal can actually send deserialized event data
         SIGNAL.send_event(**deserialized)
+
+    def test_single_object_encoding(self):
+        """
+        Test that single-object encoded payloads are decoded with the schema of the signal that sent them.
+        """
+        SIGNAL_0 = create_simple_signal({"test_data": SubTestData0}, event_type="single.object.zero")
+        SIGNAL_1 = create_simple_signal({"test_data": SubTestData1}, event_type="single.object.one")
+        event_data_0 = {"test_data": SubTestData0("a.sub.name", "a.course")}
+        event_data_1 = {"test_data": SubTestData1("b.sub.name", "b.course")}
+
+        serialized_0 = serialize_event_data_to_single_object_bytes(event_data_0, SIGNAL_0)
+        serialized_1 = serialize_event_data_to_single_object_bytes(event_data_1, SIGNAL_1)
+
+        self.assertEqual(serialized_0[:2], b"\xc3\x01")
+        self.assertEqual(serialized_0[2:10], AvroSignalSerializer(SIGNAL_0).fingerprint)
+        self.assertEqual(serialized_0[10:], serialize_event_data_to_bytes(event_data_0, SIGNAL_0))
+        self.assertEqual(deserialize_single_object_bytes_to_event_data(serialized_1), (SIGNAL_1, event_data_1))
+        self.assertEqual(deserialize_single_object_bytes_to_event_data(serialized_0), (SIGNAL_0, event_data_0))
+
+    def test_single_object_encoding_with_registered_deserializer(self):
+        SIGNAL = create_simple_signal({"test_data": NonAttrs}, event_type="single.object.custom")
+        event_data = {"test_data": NonAttrs("a.val", "a.nother.val")}
+        serializer = SpecialSerializer(SIGNAL)
+        out = io.BytesIO()
+        out.write(SINGLE_OBJECT_MARKER + serializer.fingerprint)
+        schemaless_writer(out, serializer.schema, serializer.to_dict(event_data))
+        serialized = out.getvalue()
+
+        with self.assertRaises(ValueError):
+            deserialize_single_object_bytes_to_event_data(serialized)
+
+        register_deserializer_fingerprint(SIGNAL, SpecialDeserializer)
+        self.assertEqual(deserialize_single_object_bytes_to_event_data(serialized), (SIGNAL, event_data))
+
+    def test_unknown_fingerprints_are_remembered(self):
+        unknown = b"\xc3\x01" + b"\x00" * 8 + b"\x06foo"
+        with self.assertRaises(ValueError):
+            deserialize_single_object_bytes_to_event_data(unknown)
+
+        with patch.object(OpenEdxPublicSignal, "all_events") as mock_all_events:
+            with self.assertRaises(ValueError):
+                deserialize_single_object_bytes_to_event_data(unknown)
+        mock_all_events.assert_not_called()
+
+        # Signals created since are registered, and their payloads decoded
+        SIGNAL = create_simple_signal({"test_data": SubTestData0}, event_type="single.object.later")
+        event_data = {"test_data": SubTestData0("a.sub.name", "a.course")}
+        serialized = serialize_event_data_to_single_object_bytes(event_data, SIGNAL)
+        self.assertEqual(deserialize_single_object_bytes_to_event_data(serialized), (SIGNAL, event_data))
+
+    def test_single_object_encoding_errors(self):
+        with self.assertRaises(ValueError):
+            deserialize_single_object_bytes_to_event_data(b"\x06foo")
+        with self.assertRaises(ValueError):
+            deserialize_single_object_bytes_to_event_data(b"\xc3\x01" + b"\x00" * 8 + b"\x06foo")
+
+    def test_writer_schema_resolution(self):
+        """
+        Test that payloads written with an older schema are resolved against the current schema of the signal.
+        """
+        SIGNAL = create_simple_signal({"test_data": SubTestData0}, event_type="writer.schema.resolution")
+        current_schema = AvroSignalSerializer(SIGNAL).schema
+        # The older version of the schema had a field that has since been removed.
+        writer_schema = copy.deepcopy(current_schema)
+        writer_schema["fields"][0]["type"]["fields"].append({"name": "removed_field", "type": "long"})
+        out = io.BytesIO()
+        schemaless_writer(out, writer_schema, {"test_data": {"sub_name": "a.sub.name", "course_id": "a.course",
+                                                             "removed_field": 3}})
+        serialized = out.getvalue()
+        expected = {"test_data": SubTestData0("a.sub.name", "a.course")}
+
+        with self.assertRaises(ValueError):
+            deserialize_bytes_to_event_data(serialized, SIGNAL, writer_schema=schema_fingerprint(writer_schema))
+        self.assertEqual(deserialize_bytes_to_event_data(serialized, SIGNAL, writer_schema=writer_schema), expected)
+
+        fingerprint = register_writer_schema(writer_schema)
+        self.assertEqual(fingerprint, schema_fingerprint(writer_schema))
+        self.assertEqual(deserialize_bytes_to_event_data(serialized, SIGNAL, writer_schema=fingerprint), expected)
+        self.assertEqual(AvroSignalReader(SIGNAL, writer_schema=fingerprint).read(serialized), expected)
+        self.assertEqual(
+            deserialize_single_object_bytes_to_event_data(SINGLE_OBJECT_MARKER + fingerprint + serialized),
+            (SIGNAL, expected),
+        )
+        # The current schema needs no resolution
+        self.assertIsNone(AvroSignalDeserializer(SIGNAL).get_parsed_writer_schema(current_schema))
+
+    def test_writer_schema_dict_fingerprint_is_cached(self):
+        """
+        Test that the fingerprint of a writer schema dict is computed once, while new dicts are fingerprinted.
+        """
+        SIGNAL = create_simple_signal({"test_data": SubTestData0}, event_type="writer.schema.fingerprint")
+        deserializer = AvroSignalDeserializer(SIGNAL)
+        writer_schema = copy.deepcopy(deserializer.schema)
+        writer_schema["fields"][0]["type"]["fields"].append({"name": "removed_field", "type": "long"})
+
+        with patch(
+            "openedx_events.event_bus.avro.deserializer.schema_fingerprint", wraps=schema_fingerprint
+        ) as mock_fingerprint:
+            parsed_writer_schema = deserializer.get_parsed_writer_schema(writer_schema)
+            self.assertIs(deserializer.get_parsed_writer_schema(writer_schema), parsed_writer_schema)
+            mock_fingerprint.assert_called_once()
+
+            self.assertIs(deserializer.get_parsed_writer_schema(copy.deepcopy(writer_schema)), parsed_writer_schema)
+            self.assertEqual(mock_fingerprint.call_count, 2)
+
+    def test_load_stored_writer_schemas(self):
+        """
+        Test that payloads written with the stored schemas are mapped to their signal once the schemas are loaded.
+        """
+        schemas_dir = f"{os.path.dirname(os.path.abspath(__file__))}/schemas"
+        fingerprints = load_writer_schemas(schemas_dir)
+        self.assertEqual(len(fingerprints), len(os.listdir(schemas_dir)))
+
+        for schema_filename in os.listdir(schemas_dir):
+            with open(f"{schemas_dir}/{schema_filename}", encoding="utf-8") as f:
+                stored_schema = json.load(f)
+            signal = OpenEdxPublicSignal.get_signal_by_type(stored_schema["namespace"])
+            self.assertIs(get_deserializer_by_fingerprint(schema_fingerprint(stored_schema)).signal, signal)
@@ -0,0 +1,127 @@
+"""
+Tests for event_bus.avro.compatibility module
+"""
+import copy
+import json
+import tempfile
+from unittest import TestCase
+
+from openedx_events.event_bus.avro.compatibility import (
+    BACKWARD,
+    FORWARD,
+    FULL,
+    check_can_read,
+    check_compatibility,
+    check_signals_compatibility,
+    load_schema_history,
+)
+from openedx_events.event_bus.avro.schema import schema_from_signal
+from openedx_events.event_bus.avro.tests.test_utilities import (
+    EventData,
+    SimpleAttrsWithDefaults,
+    SubTestData0,
+    create_simple_signal,
+)
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+
+
+def _record(name, fields):
+    return {"name": name, "type": "record", "fields": fields}
+
+
+class TestCompatibility(FreezeSignalCacheMixin, TestCase):
+    """
+    Test Avro schema compatibility checks.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.schema = schema_from_signal(create_simple_signal({"test_data": EventData}))
+
+    def test_generated_schema_is_compatible_with_itself(self):
+        self.assertEqual(check_compatibility(self.schema, copy.deepcopy(self.schema), FULL), [])
+        self.assertEqual(check_compatibility(
+            schema_from_signal(create_simple_signal({"test_data": SimpleAttrsWithDefaults})),
+            schema_from_signal(create_simple_signal({"test_data": SimpleAttrsWithDefaults})),
+        ), [])
+
+    def test_added_field(self):
+        new_schema = copy.deepcopy(self.schema)
+        new_schema["fields"][0]["type"]["fields"].append({"name": "new_field", "type": "long"})
+
+        self.assertEqual(check_compatibility(new_schema, self.schema, FORWARD), [])
+        self.assertEqual(
+            check_compatibility(new_schema, self.schema, BACKWARD),
+            ["backward: test_data.new_field: field is missing from the writer and has no default"],
+        )
+
+        new_schema["fields"][0]["type"]["fields"][-1] = {
+            "name": "new_field", "type": ["null", "long"], "default": None,
+        }
+        self.assertEqual(check_compatibility(new_schema, self.schema, FULL), [])
+
+    def test_changed_types(self):
+        writer = _record("R", [{"name": "a", "type": "long"}, {"name": "b", "type": "string"}])
+        reader = _record("R", [{"name": "a", "type": "double"}, {"name": "b", "type": "long"}])
+        self.assertEqual(check_can_read(reader, writer), ["b: string can't be read as long"])
+        self.assertEqual(check_can_read(_record("S", []), writer), [": R can't be read as S"])
+
+    def test_unions(self):
+        optional = _record("R", [{"name": "a", "type": ["null", "string"], "default": None}])
+        required = _record("R", [{"name": "a", "type": "string"}])
+        self.assertEqual(check_can_read(optional, required), [])
+        self.assertEqual(check_can_read(required, optional), ["a: null can't be read as string"])
+        self.assertEqual(
+            check_can_read(_record("R", [{"name": "a", "type": ["null", "long"]}]), optional),
+            ["a: union branch string is not in the reader union"],
+        )
+
+    def test_named_type_references(self):
+        sub_record = _record("Sub", [{"name": "x", "type": "string"}])
+        writer = _record("R", [{"name": "a", "type": sub_record}, {"name": "b", "type": "Sub"}])
+        reader = copy.deepcopy(writer)
+        reader["fields"][0]["type"]["fields"][0]["type"] = "long"
+        self.assertEqual(check_can_read(reader, writer), [
+            "a.x: string can't be read as long",
+            "b.x: string can't be read as long",
+        ])
+
+    def test_complex_types(self):
+        writer = _record("R", [
+            {"name": "a", "type": {"type": "array", "items": "int"}},
+            {"name": "e", "type": {"type": "enum", "name": "E", "symbols": ["A", "B"]}},
+        ])
+        reader = _record("R", [
+            {"name": "a", "type": {"type": "array", "items": "string"}},
+            {"name": "e", "type": {"type": "enum", "name": "E", "symbols": ["A"]}},
+        ])
+        self.assertEqual(check_can_read(reader, writer), [
+            "a[]: int can't be read as string",
+            "e: enum symbols ['B'] are missing from the reader",
+        ])
+
+    def test_unknown_level(self):
+        with self.assertRaises(ValueError):
+            check_compatibility(self.schema, self.schema, "transitive")
+
+    def test_check_signals_against_history(self):
+        signal = create_simple_signal({"test_data": SubTestData0}, event_type="compatibility.signal")
+        missing_signal = create_simple_signal({"test_data": SubTestData0}, event_type="compatibility.missing")
+        old_schema = copy.deepcopy(schema_from_signal(signal))
+        old_schema["fields"][0]["type"]["fields"].pop()
+
+        with tempfile.TemporaryDirectory() as schemas_dir:
+            with open(f"{schemas_dir}/compatibility+signal_schema.avsc", "w", encoding="utf-8") as schema_file:
+                json.dump(old_schema, schema_file)
+            history = load_schema_history(schemas_dir)
+
+        self.assertEqual(list(history), ["compatibility.signal"])
+        self.assertEqual(check_signals_compatibility([signal, missing_signal], history, FORWARD), {
+            "compatibility.missing": ["no stored schema"],
+        })
+        self.assertEqual(check_signals_compatibility([signal], history), {
+            "compatibility.signal": [
+                "compatibility+signal_schema.avsc: backward: test_data.course_id: field is missing from the writer"
+                " and has no default",
+            ],
+        })
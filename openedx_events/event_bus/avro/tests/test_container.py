@@ -0,0 +1,74 @@
+"""Tests for avro.container module."""
+import io
+import types
+from datetime import datetime, timezone
+
+import fastavro
+from django.test import TestCase
+
+from openedx_events.event_bus.avro.container import (
+    EVENT_TYPE_METADATA_KEY,
+    read_events_from_container,
+    write_events_to_container,
+)
+from openedx_events.event_bus.avro.tests.test_utilities import (
+    NestedAttrsWithDefaults,
+    SimpleAttrsWithDefaults,
+    SubTestData0,
+    create_simple_signal,
+)
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+
+
+class TestAvroContainer(FreezeSignalCacheMixin, TestCase):
+    """Tests for writing and reading events to and from Avro Object Container Files."""
+
+    def setUp(self):
+        super().setUp()
+        self.signal = create_simple_signal({"test_data": SubTestData0}, event_type="container.signal")
+        self.events = [
+            (
+                {"test_data": SubTestData0(f"sub.name.{index}", "a.course")},
+                self.signal.generate_signal_metadata(time=datetime(2024, 1, 1, index, tzinfo=timezone.utc)),
+            )
+            for index in range(5)
+        ]
+
+    def test_round_trip(self):
+        out = io.BytesIO()
+        write_events_to_container(out, self.signal, self.events)
+        out.seek(0)
+
+        events = read_events_from_container(out, self.signal)
+
+        self.assertIsInstance(events, types.GeneratorType)
+        self.assertEqual(list(events), self.events)
+
+    def test_header(self):
+        out = io.BytesIO()
+        write_events_to_container(out, self.signal, self.events)
+        out.seek(0)
+
+        reader = fastavro.reader(out)
+
+        self.assertEqual(reader.codec, "deflate")
+        self.assertEqual(reader.metadata[EVENT_TYPE_METADATA_KEY], "container.signal")
+
+    def test_signal_from_header(self):
+        out = io.BytesIO()
+        write_events_to_container(out, self.signal, self.events, codec="null")
+        out.seek(0)
+
+        self.assertEqual(list(read_events_from_container(out)), self.events)
+
+    def test_optional_fields(self):
+        signal = create_simple_signal({"test_data": NestedAttrsWithDefaults}, event_type="container.optional")
+        events = [
+            ({"test_data": NestedAttrsWithDefaults(field_0=SimpleAttrsWithDefaults())},
+             signal.generate_signal_metadata()),
+        ]
+        out = io.BytesIO()
+        write_events_to_container(out, signal, events)
+        out.seek(0)
+
+        self.assertEqual(list(read_events_from_container(out, signal)), events)
@@ -0,0 +1,90 @@
+"""Tests for avro.custom_serializers module."""
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+
+from django.apps import apps
+from django.test import override_settings
+from opaque_keys.edx.keys import CourseKey, UsageKey
+from opaque_keys.edx.locator import CourseLocator, LibraryUsageLocatorV2
+
+from openedx_events.event_bus.avro.custom_serializers import (
+    CourseKeyAvroSerializer,
+    CustomTypeDispatchTable,
+    DatetimeAvroSerializer,
+    LibraryUsageLocatorV2AvroSerializer,
+    UsageKeyAvroSerializer,
+    disable_custom_serializer_caches,
+    enable_custom_serializer_caches,
+    get_custom_serializer_cache_info,
+)
+
+
+class TestCustomTypeDispatchTable(TestCase):
+    """Tests for CustomTypeDispatchTable."""
+
+    def setUp(self):
+        super().setUp()
+        self.table = CustomTypeDispatchTable({
+            CourseKey: CourseKeyAvroSerializer.serialize,
+            UsageKey: UsageKeyAvroSerializer.serialize,
+            LibraryUsageLocatorV2: LibraryUsageLocatorV2AvroSerializer.serialize,
+        })
+
+    def test_exact_type(self):
+        self.assertIs(self.table.get(CourseKey), CourseKeyAvroSerializer.serialize)
+
+    def test_closest_ancestor_wins(self):
+        """
+        LibraryUsageLocatorV2 is a UsageKey, but has its own method registered.
+        """
+        self.assertIs(self.table.get(CourseLocator), CourseKeyAvroSerializer.serialize)
+        self.assertIs(self.table.get(LibraryUsageLocatorV2), LibraryUsageLocatorV2AvroSerializer.serialize)
+
+    def test_unregistered_types(self):
+        self.assertIsNone(self.table.get(datetime))
+        self.assertIsNone(self.table.get(str))
+        self.assertIsNone(self.table.get(List[int]))
+
+    def test_resolution_is_memoized(self):
+        self.table.get(CourseLocator)
+        self.table.methods.clear()
+        self.assertIs(self.table.get(CourseLocator), CourseKeyAvroSerializer.serialize)
+
+
+class TestCustomSerializerCaches(TestCase):
+    """Tests for the opt-in caches of the default custom serializers."""
+
+    def tearDown(self):
+        super().tearDown()
+        disable_custom_serializer_caches()
+
+    def test_disabled_by_default(self):
+        course_key = CourseKeyAvroSerializer.deserialize("course-v1:edX+DemoX.1+2014")
+        self.assertIsNot(CourseKeyAvroSerializer.deserialize("course-v1:edX+DemoX.1+2014"), course_key)
+        self.assertEqual(get_custom_serializer_cache_info(), {})
+
+    def test_enabled(self):
+        enable_custom_serializer_caches(maxsize=2)
+
+        course_key = CourseKeyAvroSerializer.deserialize("course-v1:edX+DemoX.1+2014")
+        self.assertIs(CourseKeyAvroSerializer.deserialize("course-v1:edX+DemoX.1+2014"), course_key)
+        self.assertEqual(CourseKeyAvroSerializer.serialize(course_key), "course-v1:edX+DemoX.1+2014")
+        self.assertEqual(CourseKeyAvroSerializer.serialize(course_key), "course-v1:edX+DemoX.1+2014")
+        self.assertEqual(
+            DatetimeAvroSerializer.deserialize("2024-01-01T00:00:00"), datetime(2024, 1, 1)
+        )
+
+        cache_info = get_custom_serializer_cache_info()
+        self.assertEqual(cache_info["CourseKey.deserialize"].hits, 1)
+        self.assertEqual(cache_info["CourseKey.deserialize"].misses, 1)
+        self.assertEqual(cache_info["CourseKey.serialize"].hits, 1)
+        self.assertEqual(cache_info["datetime.deserialize"].misses, 1)
+        self.assertEqual(cache_info["UsageKey.deserialize"].currsize, 0)
+        self.assertEqual(cache_info["UsageKey.deserialize"].maxsize, 2)
+        self.assertNotIn("datetime.serialize", cache_info)
+
+    @override_settings(EVENT_BUS_AVRO_CUSTOM_SERIALIZER_CACHE_SIZE=10)
+    def test_enabled_by_setting(self):
+        apps.get_app_config("openedx_events").ready()
+        self.assertEqual(get_custom_serializer_cache_info()["CourseKey.deserialize"].maxsize, 10)
@@ -3,11 +3,18 @@ import json
 from datetime import datetime
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import LibraryLocatorV2, LibraryUsageLocatorV2
 
-from openedx_events.event_bus.avro.deserializer import AvroSignalDeserializer, deserialize_bytes_to_event_data
+from openedx_events.event_bus.avro.deserializer import (
+    AvroSignalDeserializer,
+    AvroSignalReader,
+    deserialize_bytes_to_event_data,
+    get_signal_deserializer,
+)
+from openedx_events.event_bus.avro.serializer import serialize_many
 from openedx_events.event_bus.avro.tests.test_utilities import (
     EventData,
     NestedAttrsWithDefaults,
@@ -277,3 +284,64 @@ class TestAvroSignalDeserializerCache(TestCase, FreezeSignalCacheMixin):
         deserialized = deserialize_bytes_to_event_data(bytes_data, SIGNAL)
         self.assertIsInstance(deserialized["test_data"], EventData)
         self.assertEqual(deserialized, expected)
+
+    def test_get_signal_deserializer_is_cached(self):
+        """
+        Test that deserializers are built once per signal and deserializer class.
+        """
+        SIGNAL = create_simple_signal({"test_data": SimpleAttrs})
+        deserializer = get_signal_deserializer(SIGNAL)
+        special_deserializer = get_signal_deserializer(SIGNAL, SpecialDeserializer)
+
+        self.assertIs(get_signal_deserializer(SIGNAL), deserializer)
+        self.assertIs(get_signal_deserializer(SIGNAL, SpecialDeserializer), special_deserializer)
+        self.assertIsInstance(special_deserializer, SpecialDeserializer)
+        self.assertIsNot(deserializer, special_deserializer)
+
+        get_signal_deserializer.cache_clear()
+        self.assertIsNot(get_signal_deserializer(SIGNAL), deserializer)
+
+    def test_avro_signal_reader(self):
+        """
+        Test that AvroSignalReader decodes bytes, bytearray and memoryview slices, reusing its buffer.
+        """
+        SIGNAL = create_simple_signal({"test_data": SubTestData0})
+        events_data = [
+            {"test_data": SubTestData0("a.much.longer.sub.name", "a.much.longer.course")},
+            {"test_data": SubTestData0("a.sub.name", "a.course")},
+        ]
+        views = serialize_many(SIGNAL, events_data)
+        reader = AvroSignalReader(SIGNAL)
+
+        self.assertEqual([reader.read(view) for view in views], events_data)
+        self.assertEqual(reader.read(bytearray(views[0])), events_data[0])
+        self.assertEqual(reader.read(bytes(views[1])), events_data[1])
+        # A shorter message after a longer one must not read stale data from the reused buffer.
+        self.assertEqual(reader.read(views[1]), events_data[1])
+        self.assertEqual(deserialize_bytes_to_event_data(views[0], SIGNAL), events_data[0])
+
+    def test_decoding_plan_is_compiled_once(self):
+        """
+        Check that decoding does no type introspection once the plan for the signal is compiled.
+        """
+        SIGNAL = create_simple_signal({"test_data": EventData, "list_input": List[int]})
+        deserializer = AvroSignalDeserializer(SIGNAL)
+        as_dict = {
+            "test_data": {
+                "course_id": "bar.course",
+                "sub_name": "foo",
+                "sub_test_0": {"course_id": "a.nother.course", "sub_name": "a.sub.name"},
+                "sub_test_1": {"course_id": "b.uber.another.course", "sub_name": "b.uber.sub.name"},
+            },
+            "list_input": [1, 3],
+        }
+        expected = {
+            "test_data": EventData("foo", "bar.course", SubTestData0("a.sub.name", "a.nother.course"),
+                                   SubTestData1("b.uber.sub.name", "b.uber.another.course")),
+            "list_input": [1, 3],
+        }
+        self.assertEqual(deserializer.from_dict(as_dict), expected)
+
+        with patch("openedx_events.event_bus.avro.deserializer.get_origin") as mock_get_origin:
+            self.assertEqual(deserializer.from_dict(as_dict), expected)
+        mock_get_origin.assert_not_called()
@@ -1,10 +1,25 @@
 """
 Tests for event_bus.avro.schema module
 """
+import json
+import tempfile
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
-from openedx_events.event_bus.avro.schema import schema_from_signal
+from django.apps import apps
+from django.test import override_settings
+
+from openedx_events.event_bus.avro.schema import (
+    build_schema_bundle,
+    clear_schema_cache,
+    fingerprint_from_signal,
+    load_schema_bundle,
+    schema_fingerprint,
+    schema_from_signal,
+    schema_string_from_signal,
+)
+from openedx_events.event_bus.avro.serializer import AvroSignalSerializer
 from openedx_events.event_bus.avro.tests.test_utilities import (
     EventData,
     NestedAttrsWithDefaults,
@@ -16,6 +31,8 @@ from openedx_events.event_bus.avro.tests.test_utilities import (
     SubTestData1,
     create_simple_signal,
 )
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+from openedx_events.tooling import OpenEdxPublicSignal
 
 
 class TestSchemaGeneration(TestCase):
@@ -270,3 +287,90 @@ class TestSchemaGeneration(TestCase):
         }
         schema = schema_from_signal(LIST_SIGNAL)
         self.assertDictEqual(schema, expected_dict)
+
+
+class TestSchemaCache(FreezeSignalCacheMixin, TestCase):
+    """
+    Test memoization and bundling of generated Avro schemas.
+    """
+
+    def setUp(self):
+        super().setUp()
+        clear_schema_cache()
+
+    def test_schema_is_generated_once(self):
+        SIGNAL = create_simple_signal({"test_data": EventData})
+        with patch(
+            "openedx_events.event_bus.avro.schema._generate_schema_from_signal", wraps=lambda *args: {"name": "x"}
+        ) as mock_generate:
+            schema = schema_from_signal(SIGNAL)
+            self.assertIs(schema_from_signal(SIGNAL), schema)
+            self.assertIs(schema_from_signal(SIGNAL, {}), schema)
+            mock_generate.assert_called_once()
+
+            schema_from_signal(SIGNAL, {NonAttrs: "string"})
+            schema_from_signal(create_simple_signal({"test_data": EventData}))
+            self.assertEqual(mock_generate.call_count, 3)
+
+        clear_schema_cache()
+        self.assertIsNot(schema_from_signal(SIGNAL), schema)
+
+    def test_schema_string_and_fingerprint(self):
+        SIGNAL = create_simple_signal({"test_data": EventData})
+        schema = schema_from_signal(SIGNAL)
+        self.assertEqual(schema_string_from_signal(SIGNAL), json.dumps(schema, sort_keys=True))
+        self.assertEqual(fingerprint_from_signal(SIGNAL), schema_fingerprint(schema))
+
+    def test_schema_bundle(self):
+        SIGNAL = create_simple_signal({"test_data": EventData}, event_type="schema.bundle")
+        bundle = json.loads(json.dumps(build_schema_bundle([SIGNAL])))
+        serializer = AvroSignalSerializer(SIGNAL)
+        clear_schema_cache()
+
+        with patch("openedx_events.event_bus.avro.schema._generate_schema_from_signal") as mock_generate:
+            self.assertEqual(load_schema_bundle(bundle), 1)
+            bundled_serializer = AvroSignalSerializer(SIGNAL)
+            mock_generate.assert_not_called()
+        self.assertEqual(bundled_serializer.schema, serializer.schema)
+        self.assertEqual(bundled_serializer.schema_string(), serializer.schema_string())
+        self.assertEqual(bundled_serializer.fingerprint, serializer.fingerprint)
+
+    def test_schema_bundle_is_loaded_lazily(self):
+        SIGNAL = create_simple_signal({"test_data": EventData}, event_type="schema.bundle")
+        bundle = build_schema_bundle([SIGNAL])
+        entry = bundle["schemas"]["schema.bundle"]
+        bundle["schemas"]["org.openedx.analytics.tracking.event.emitted.v1"] = entry
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+
+        with patch.object(OpenEdxPublicSignal, "_load_signal") as mock_load_signal:
+            self.assertEqual(load_schema_bundle(bundle), 2)
+        mock_load_signal.assert_not_called()
+
+        with patch("openedx_events.event_bus.avro.schema._generate_schema_from_signal") as mock_generate:
+            self.assertEqual(fingerprint_from_signal(SIGNAL).hex(), entry["fingerprint"])
+            self.assertEqual(schema_string_from_signal(SIGNAL), entry["schema_string"])
+            self.assertEqual(schema_from_signal(SIGNAL, {NonAttrs: "string"}), mock_generate.return_value)
+        mock_generate.assert_called_once()
+
+    def test_schema_bundle_is_ignored_if_stale(self):
+        SIGNAL = create_simple_signal({"test_data": EventData}, event_type="schema.bundle")
+        bundle = build_schema_bundle([SIGNAL])
+        clear_schema_cache()
+
+        self.assertEqual(load_schema_bundle({**bundle, "openedx_events_version": "0.0.1"}), 0)
+        self.assertEqual(load_schema_bundle({**bundle, "schemas": {"unknown.event": {}}}), 0)
+
+    def test_schema_bundle_loaded_by_setting(self):
+        SIGNAL = create_simple_signal({"test_data": EventData}, event_type="schema.bundle")
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as bundle_file:
+            json.dump(build_schema_bundle([SIGNAL]), bundle_file)
+            bundle_file.flush()
+            clear_schema_cache()
+
+            with override_settings(EVENT_BUS_AVRO_SCHEMA_BUNDLE=bundle_file.name):
+                apps.get_app_config("openedx_events").ready()
+
+        with patch("openedx_events.event_bus.avro.schema._generate_schema_from_signal") as mock_generate:
+            schema_from_signal(SIGNAL)
+        mock_generate.assert_not_called()
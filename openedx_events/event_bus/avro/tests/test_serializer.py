@@ -2,13 +2,20 @@
 
 import json
 from datetime import datetime
+from typing import List
 
+import attr
 import pytest
 from django.test import TestCase
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import LibraryLocatorV2, LibraryUsageLocatorV2
 
-from openedx_events.event_bus.avro.serializer import AvroSignalSerializer, serialize_event_data_to_bytes
+from openedx_events.event_bus.avro.serializer import (
+    AvroSignalSerializer,
+    get_signal_serializer,
+    serialize_event_data_to_bytes,
+    serialize_many,
+)
 from openedx_events.event_bus.avro.tests.test_utilities import (
     CustomAttrsWithDefaults,
     CustomAttrsWithoutDefaults,
@@ -211,6 +218,39 @@ class TestAvroSignalSerializerCache(FreezeSignalCacheMixin, TestCase):
                                                               'attrs_field': None
                                                               }}})
 
+    def test_serialization_of_list_fields(self):
+        """
+        Test that lists are serialized item by item, at the top level and inside attrs classes.
+        """
+        SIGNAL = create_simple_signal({"list_input": List[int], "data": NestedAttrsWithDefaults})
+        serializer = AvroSignalSerializer(SIGNAL)
+        event_data = {
+            "list_input": (1, 2, 3),
+            "data": NestedAttrsWithDefaults(field_0=SimpleAttrsWithDefaults(attrs_field=SimpleAttrs(
+                boolean_field=True, int_field=1, float_field=1.0, bytes_field=b"b", string_field="s",
+            ))),
+        }
+        data_dict = serializer.to_dict(event_data)
+        self.assertEqual(data_dict["list_input"], [1, 2, 3])
+        self.assertDictEqual(data_dict["data"]["field_0"]["attrs_field"], {
+            "boolean_field": True, "int_field": 1, "float_field": 1.0, "bytes_field": b"b", "string_field": "s",
+        })
+
+    def test_serialization_of_attrs_subclass_values(self):
+        """
+        Test that an instance of a subclass of the declared attrs class is serialized with all its fields.
+        """
+        @attr.s(frozen=True)
+        class SubTestData0Subclass(SubTestData0):
+            extra = attr.ib(type=str, default="extra")
+
+        SIGNAL = create_simple_signal({"test_data": SubTestData0})
+        serializer = AvroSignalSerializer(SIGNAL)
+        data_dict = serializer.to_dict({"test_data": SubTestData0Subclass("a.sub.name", "a.course")})
+        self.assertDictEqual(data_dict, {"test_data": {
+            "sub_name": "a.sub.name", "course_id": "a.course", "extra": "extra",
+        }})
+
     def test_serialize_event_data_to_bytes(self):
         """
         Test serialize_event_data_to_bytes utility function.
@@ -225,3 +265,41 @@ class TestAvroSignalSerializerCache(FreezeSignalCacheMixin, TestCase):
         serialized = serialize_event_data_to_bytes(event_data, SIGNAL)
         expected = b'\x06foo\x14bar.course\x14a.sub.name\x1ea.nother.course\x1eb.uber.sub.name*b.uber.another.course'
         self.assertEqual(serialized, expected)
+
+    def test_get_signal_serializer_is_cached(self):
+        """
+        Test that serializers are built once per signal and serializer class.
+        """
+        SIGNAL = create_simple_signal({"test_data": SimpleAttrs})
+        serializer = get_signal_serializer(SIGNAL)
+        special_serializer = get_signal_serializer(SIGNAL, SpecialSerializer)
+
+        self.assertIs(get_signal_serializer(SIGNAL), serializer)
+        self.assertIs(get_signal_serializer(SIGNAL, SpecialSerializer), special_serializer)
+        self.assertIsInstance(special_serializer, SpecialSerializer)
+        self.assertIsNot(serializer, special_serializer)
+
+        get_signal_serializer.cache_clear()
+        self.assertIsNot(get_signal_serializer(SIGNAL), serializer)
+
+    def test_serialize_many(self):
+        """
+        Test that serialize_many produces the same bytes as serializing each event on its own.
+        """
+        SIGNAL = create_simple_signal({"test_data": EventData})
+        events_data = [
+            {"test_data": EventData(
+                f"foo{index}",
+                "bar.course",
+                SubTestData0("a.sub.name", "a.nother.course"),
+                SubTestData1("b.uber.sub.name", "b.uber.another.course"),
+            )}
+            for index in range(3)
+        ]
+        serialized = serialize_many(SIGNAL, events_data)
+
+        self.assertEqual(len(serialized), 3)
+        for view, event_data in zip(serialized, events_data):
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(bytes(view), serialize_event_data_to_bytes(event_data, SIGNAL))
+        self.assertEqual(serialize_many(SIGNAL, []), [])
@@ -0,0 +1,238 @@
+"""
+Publish events to the event bus from background threads.
+
+When the ``EVENT_BUS_PRODUCER_QUEUE`` setting is set, the events produced by ``general_signal_handler`` are put in a
+bounded in-process queue, and background threads drain it into the configured ``EventBusProducer``. Serialization
+and broker round-trips then happen outside of the request threads, so a slow broker doesn't stall web workers.
+
+Events still in the queue when the process exits are published by an ``atexit`` handler, but they are lost if the
+process crashes or is killed.
+"""
+import atexit
+import logging
+import queue
+import threading
+from functools import lru_cache
+from time import monotonic
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from edx_django_utils.monitoring import set_custom_attribute
+
+from openedx_events.event_bus import EventBusProducer, get_producer
+from openedx_events.event_bus.encoded import EncodedEvent
+
+logger = logging.getLogger(__name__)
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+FULL_QUEUE_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+# Put in the queue to stop a worker thread.
+_STOP = object()
+
+
+class BackgroundProducer(EventBusProducer):
+    """
+    EventBusProducer putting events in a bounded queue drained by background threads into the configured producer.
+
+    Arguments:
+        maxsize (int): maximum number of events waiting in the queue.
+        workers (int): number of threads publishing events.
+        full_queue_policy (str): what to do with an event when the queue is full, one of FULL_QUEUE_POLICIES:
+            wait for room in the queue (for at most block_timeout seconds, then drop the event), drop the oldest
+            event in the queue, or drop the new event.
+        block_timeout (float): maximum number of seconds to wait for room in a full queue with the block policy,
+            None to wait forever.
+    """
+
+    def __init__(self, maxsize=1000, workers=1, full_queue_policy=BLOCK, block_timeout=None):
+        """
+        Create the queue and start the worker threads.
+        """
+        if full_queue_policy not in FULL_QUEUE_POLICIES:
+            raise ImproperlyConfigured(
+                f"EVENT_BUS_PRODUCER_QUEUE full_queue_policy should be one of {FULL_QUEUE_POLICIES},"
+                f" got '{full_queue_policy}'"
+            )
+        self.full_queue_policy = full_queue_policy
+        self.block_timeout = block_timeout
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._stats_lock = threading.Lock()
+        self._stats = {"enqueued": 0, "published": 0, "dropped": 0, "errors": 0}
+        self._threads = [
+            threading.Thread(target=self._drain, name=f"openedx-events-producer-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def send(self, *, signal, topic, event_key_field, event_data, event_metadata):
+        """
+        Put an event in the queue, see send_encoded.
+
+        See EventBusProducer.send for the arguments.
+        """
+        self.send_encoded(
+            topic=topic,
+            event_key_field=event_key_field,
+            encoded_event=EncodedEvent(signal, event_data, event_metadata),
+        )
+
+    def send_encoded(self, *, topic, event_key_field, encoded_event):
+        """
+        Put an event in the queue, applying the full queue policy if there's no room for it.
+
+        The event is encoded by the worker threads, once for all its topics if the producer overrides send_encoded.
+        See EventBusProducer.send_encoded for the arguments.
+        """
+        message = {"topic": topic, "event_key_field": event_key_field, "encoded_event": encoded_event}
+        if not self._put(message):
+            self._count("dropped")
+            logger.warning(f"Producer queue is full, dropping event {encoded_event}")
+            return
+        self._count("enqueued")
+        set_custom_attribute("openedx_events.producer_queue_depth", self._queue.qsize())
+
+    def _put(self, message):
+        """
+        Put a message in the queue as the full queue policy says, and return whether it was put.
+        """
+        try:
+            if self.full_queue_policy == BLOCK:
+                self._queue.put(message, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(message)
+            return True
+        except queue.Full:
+            if self.full_queue_policy != DROP_OLDEST:
+                return False
+        # Make room by dropping the oldest message. Other threads may fill the queue again, in which case
+        # the new message is dropped instead.
+        try:
+            oldest = self._queue.get_nowait()
+            self._queue.task_done()
+            if oldest is _STOP:
+                # The producer is being closed: keep stopping the worker, which is still draining the queue.
+                self._queue.put(_STOP)
+                return False
+            self._count("dropped")
+            logger.warning(f"Producer queue is full, dropping event {oldest['encoded_event']}")
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except queue.Full:
+            return False
+
+    def _drain(self):
+        """
+        Publish the messages of the queue with the configured producer until a worker is stopped.
+        """
+        while True:
+            message = self._queue.get()
+            try:
+                if message is _STOP:
+                    return
+                get_producer().send_encoded(**message)
+                self._count("published")
+            except Exception:  # pylint: disable=broad-exception-caught
+                self._count("errors")
+                logger.exception(f"Error publishing event {message['encoded_event']} to topic {message['topic']}")
+            finally:
+                self._queue.task_done()
+
+    def _count(self, stat):
+        with self._stats_lock:
+            self._stats[stat] += 1
+
+    def stats(self):
+        """
+        Get the queue depth and the counts of events since the queue was created.
+
+        Returns:
+            dict: "depth" and "maxsize" of the queue, and the number of events "enqueued", "published", "dropped"
+                and failed to publish ("errors").
+        """
+        with self._stats_lock:
+            return {"depth": self._queue.qsize(), "maxsize": self._queue.maxsize, **self._stats}
+
+    def flush(self, timeout=None):
+        """
+        Wait until all the events put in the queue have been published or failed.
+
+        Arguments:
+            timeout (float): maximum number of seconds to wait, None to wait forever.
+
+        Returns:
+            bool: whether the queue was emptied.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout=None):
+        """
+        Publish the events left in the queue, then stop the worker threads.
+
+        Arguments:
+            timeout (float): maximum number of seconds to wait for the events to be published, None to wait forever.
+        """
+        flushed = self.flush(timeout)
+        if not flushed:
+            logger.warning(f"Closing the producer queue with {self._queue.qsize()} unpublished events")
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                break
+
+
+@lru_cache  # will just be one cache entry, in practice
+def get_background_producer():
+    """
+    Create or retrieve the BackgroundProducer publishing events produced by the signal handler.
+
+    Returns:
+        BackgroundProducer: the producer, or None if events are published from the threads sending them.
+    """
+    # .. setting_name: EVENT_BUS_PRODUCER_QUEUE
+    # .. setting_default: None
+    # .. setting_description: If set, the events that EVENT_BUS_PRODUCER_CONFIG sends to the event bus are put in a
+    #   bounded in-process queue and published by background threads, instead of being published by the threads
+    #   sending the signals. A dictionary with the optional keys "maxsize" (maximum number of events in the queue,
+    #   defaults to 1000), "workers" (number of publishing threads, defaults to 1), "full_queue_policy" (one of
+    #   "block", "drop_oldest" and "drop_newest", defaults to "block") and "block_timeout" (maximum number of
+    #   seconds to wait for room in the queue with the block policy before dropping the event, defaults to waiting
+    #   forever). Events still in the queue are published when the process exits, within "shutdown_timeout"
+    #   seconds (defaults to 10). For example: {"maxsize": 5000, "workers": 2, "full_queue_policy": "drop_oldest"}
+    config = getattr(settings, "EVENT_BUS_PRODUCER_QUEUE", None)
+    if config is None:
+        return None
+    config = dict(config)
+    shutdown_timeout = config.pop("shutdown_timeout", 10)
+    producer = BackgroundProducer(**config)
+    atexit.register(producer.close, timeout=shutdown_timeout)
+    return producer
+
+
+@receiver(setting_changed)
+def _reset_background_producer(setting, **kwargs):  # pylint: disable=unused-argument
+    """
+    Stop the background producer when its settings change during unit tests.
+    """
+    if setting == "EVENT_BUS_PRODUCER_QUEUE" and get_background_producer.cache_info().currsize:
+        producer = get_background_producer()
+        get_background_producer.cache_clear()
+        if producer is not None:
+            producer.close()
+            atexit.unregister(producer.close)
@@ -0,0 +1,116 @@
+"""
+Events encoded once for all the topics they are published to.
+
+When ``EVENT_BUS_PRODUCER_CONFIG`` routes an event type to several topics, ``general_signal_handler`` creates a single
+``EncodedEvent`` per event and passes it to ``EventBusProducer.send_encoded`` for each topic. Its Avro payload,
+header values and keys are computed the first time a producer asks for them and shared by the other topics, so
+producers overriding ``send_encoded`` serialize each event once instead of once per topic.
+
+Event keys are extracted by functions compiled once per signal and event key field, which ``OpenedxEventsConfig``
+compiles for every topic of ``EVENT_BUS_PRODUCER_CONFIG`` at startup so that invalid paths are reported then.
+"""
+from functools import cached_property, lru_cache
+from operator import attrgetter, itemgetter
+
+import attr
+
+from openedx_events.event_bus.avro.schema import fingerprint_from_signal
+from openedx_events.event_bus.avro.serializer import serialize_event_data_to_bytes
+
+
+@lru_cache(maxsize=None)
+def get_event_key_extractor(signal, event_key_field):
+    """
+    Compile an event key field of a signal into a function getting the event key from the event data.
+
+    The path is split once, checked against the attrs classes of the signal's data, and turned into an item lookup
+    followed by an ``operator.attrgetter``. Attributes of types that aren't attrs classes can't be checked, so they
+    are only looked up when events are sent.
+
+    Arguments:
+        signal (OpenEdxPublicSignal): the signal the events are sent to.
+        event_key_field (str): path to the event data field to use as the event key, e.g. "xblock_info.usage_key":
+            the first name is a key of the event data and the next ones are attributes.
+
+    Returns:
+        callable: function taking the event data and returning the value of the event key field.
+
+    Raises:
+        ValueError: if the path doesn't exist in the data of the signal.
+    """
+    data_key, *attribute_names = event_key_field.split(".")
+    if data_key not in signal.init_data:
+        raise ValueError(f"'{data_key}' is not in the data of {signal.event_type}: {sorted(signal.init_data)}")
+    data_type = signal.init_data[data_key]
+    for attribute_name in attribute_names:
+        if not (isinstance(data_type, type) and attr.has(data_type)):
+            break
+        fields = attr.fields_dict(data_type)
+        if attribute_name not in fields:
+            raise ValueError(f"{data_type.__name__} of '{event_key_field}' has no attribute '{attribute_name}'")
+        data_type = fields[attribute_name].type
+
+    if not attribute_names:
+        return itemgetter(data_key)
+    get_attribute = attrgetter(".".join(attribute_names))
+
+    def extract_event_key(event_data):
+        return get_attribute(event_data[data_key])
+    return extract_event_key
+
+
+class EncodedEvent:
+    """
+    An event sent to a signal, along with its encodings computed on first use.
+
+    Arguments:
+        signal (OpenEdxPublicSignal): the signal the event was sent to.
+        event_data (dict): the event data (kwargs) sent to the signal.
+        event_metadata (EventsMetadata): the CloudEvent metadata.
+    """
+
+    def __init__(self, signal, event_data, event_metadata):
+        """
+        Keep the event, nothing is encoded until it is needed.
+        """
+        self.signal = signal
+        self.event_data = event_data
+        self.event_metadata = event_metadata
+        self._keys = {}
+
+    @cached_property
+    def value(self):
+        """
+        Get the event data serialized with the Avro schema of the signal.
+        """
+        return serialize_event_data_to_bytes(self.event_data, self.signal)
+
+    @cached_property
+    def schema_fingerprint(self):
+        """
+        Get the CRC-64-AVRO fingerprint of the schema the value is serialized with.
+        """
+        return fingerprint_from_signal(self.signal)
+
+    @cached_property
+    def headers(self):
+        """
+        Get the header values of the event: its metadata as a JSON-compatible dictionary.
+        """
+        return self.event_metadata.to_json_data()
+
+    def key(self, event_key_field):
+        """
+        Get the value of an event key field, with the extractor compiled by get_event_key_extractor.
+        """
+        try:
+            return self._keys[event_key_field]
+        except KeyError:
+            key = self._keys[event_key_field] = get_event_key_extractor(self.signal, event_key_field)(self.event_data)
+            return key
+
+    def __str__(self):
+        """
+        Describe the event by its id and event type, for logs.
+        """
+        return f"{self.event_metadata.id} of {self.signal.event_type}"
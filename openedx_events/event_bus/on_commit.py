@@ -0,0 +1,173 @@
+"""
+Publish events to the event bus once the current database transaction commits.
+
+This is the ``on-commit`` producer mode of ADR 0015: events sent inside a transaction are only published if it
+commits, and are published immediately outside of transactions. All the events of a transaction are buffered in a
+single batch per database connection, published by one ``transaction.on_commit`` callback, so a request sending
+dozens of events pays for a single callback, wherever they were sent in nested atomic blocks.
+
+The batch is registered in the savepoints enclosing all its events, so that rolling one of them back drops it. The
+events sent in other savepoints are kept in a segment of the batch, along with a no-op ``on_commit`` marker registered
+in those savepoints. Django drops the marker if a savepoint is rolled back, and the markers left run before the batch
+on commit, so that the batch only publishes the segments whose savepoints were committed.
+"""
+import logging
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from openedx_events.event_bus import get_producer
+from openedx_events.event_bus.background import get_background_producer
+
+logger = logging.getLogger(__name__)
+
+
+class _Segment:
+    """
+    Events sent in the same savepoint, and the on-commit marker telling whether that savepoint was committed.
+
+    Arguments:
+        savepoint_ids (tuple): ids of the savepoints active when the events were sent, empty outside of savepoints.
+    """
+
+    def __init__(self, savepoint_ids=()):
+        """
+        Create an empty segment, committed until its marker is registered.
+        """
+        self.savepoint_ids = savepoint_ids
+        self.messages = []
+        self.committed = True
+
+    def __call__(self):
+        """
+        Mark the segment as committed: Django only runs the marker if its savepoints weren't rolled back.
+        """
+        self.committed = True
+
+
+class OnCommitBatch:
+    """
+    Events published by a single on-commit callback, in the order they were sent.
+
+    Arguments:
+        messages (list): (Optional) keyword arguments of EventBusProducer.send_encoded for each event sent outside of
+            savepoints.
+        savepoint_ids (tuple): (Optional) ids of the savepoints enclosing all the events of the batch.
+    """
+
+    def __init__(self, messages=None, savepoint_ids=()):
+        """
+        Create a batch of messages.
+        """
+        self.savepoint_ids = savepoint_ids
+        self.segments = [_Segment()]
+        self.segments[0].messages.extend(messages or [])
+
+    @property
+    def messages(self):
+        """
+        Get the messages of the batch sent outside of savepoints or in savepoints that were committed.
+        """
+        return [message for segment in self.segments if segment.committed for message in segment.messages]
+
+    def add(self, message, savepoint_ids, using):
+        """
+        Add a message to the batch, starting a new segment if it was sent in another savepoint.
+
+        Segments sent in savepoints that don't enclose all the events of the batch register a marker, since rolling
+        them back doesn't drop the batch. Savepoints that enclose them all can't be rolled back without the batch.
+
+        Arguments:
+            message (dict): keyword arguments of EventBusProducer.send_encoded.
+            savepoint_ids (tuple): ids of the currently active savepoints.
+            using (str): alias of the database whose transaction the batch is bound to.
+        """
+        common_length = 0
+        for batch_savepoint_id, savepoint_id in zip(self.savepoint_ids, savepoint_ids):
+            if batch_savepoint_id != savepoint_id:
+                break
+            common_length += 1
+        self.savepoint_ids = savepoint_ids[:common_length]
+        segment = self.segments[-1]
+        if segment.savepoint_ids != savepoint_ids:
+            segment = _Segment(savepoint_ids)
+            self.segments.append(segment)
+            if len(savepoint_ids) > len(self.savepoint_ids):
+                # Rolling back the savepoints of the segment wouldn't drop the batch: track them with a marker.
+                segment.committed = False
+                transaction.on_commit(segment, using=using)
+        segment.messages.append(message)
+
+    def __call__(self):
+        """
+        Publish the events of the batch, logging publishing errors so that they don't affect the committed code.
+
+        Producers supporting batches get all the events at once, others get them one by one so that an error only
+        loses a single event.
+        """
+        messages = self.messages
+        if not messages:
+            return
+        producer = get_background_producer() or get_producer()
+        if producer.supports_batches:
+            try:
+                producer.send_batch(messages)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception(f"Error publishing a batch of {len(messages)} events after the transaction committed")
+            return
+        for message in messages:
+            try:
+                producer.send_encoded(**message)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception(
+                    f"Error publishing event {message['encoded_event']} to topic {message['topic']}"
+                    " after the transaction committed"
+                )
+
+
+def _get_batch(connection):
+    """
+    Get the batch of the current transaction, if any.
+    """
+    # Each entry of run_on_commit starts with the savepoint ids the callback was registered in, followed by the
+    # callback itself. Django drops the entries of the savepoints it rolls back, and all of them on rollback.
+    for entry in connection.run_on_commit:
+        if isinstance(entry[1], OnCommitBatch):
+            return entry[1]
+    return None
+
+
+def _move_last(connection, batch):
+    """
+    Register a batch again after the other on-commit callbacks, in the savepoints enclosing all its events.
+
+    The markers of its segments then run before it.
+    """
+    for index, entry in enumerate(connection.run_on_commit):
+        if entry[1] is batch:
+            connection.run_on_commit.pop(index)
+            connection.run_on_commit.append((set(batch.savepoint_ids), *entry[1:]))
+            return
+
+
+def publish_on_commit(using=DEFAULT_DB_ALIAS, **message):
+    """
+    Publish an event to the event bus when the current transaction commits, or immediately if there's none.
+
+    Events sent in a transaction are added to its batch, and discarded if the savepoint they were sent in is rolled
+    back. The batch is published after the on-commit callbacks registered before the last event.
+
+    Arguments:
+        using (str): alias of the database whose transaction the event is bound to.
+        message: keyword arguments of EventBusProducer.send_encoded.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        transaction.on_commit(OnCommitBatch([message]), using=using)
+        return
+    savepoint_ids = tuple(connection.savepoint_ids)
+    batch = _get_batch(connection)
+    if batch is None:
+        batch = OnCommitBatch(savepoint_ids=savepoint_ids)
+        transaction.on_commit(batch, using=using)
+    batch.add(message, savepoint_ids, using)
+    _move_last(connection, batch)
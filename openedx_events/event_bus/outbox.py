@@ -0,0 +1,212 @@
+"""
+Publish events to the event bus through a transactional outbox.
+
+This is the ``outbox`` producer mode of ADR 0015: events are serialized and saved as OutboxEvent rows in the
+transaction of the code sending them, so they are saved if and only if the transaction commits. The
+``relay_outbox`` management command then publishes the rows in order with the configured ``EventBusProducer``,
+and the ``purge_outbox`` management command deletes the rows that were published.
+
+Each row keeps the schema its payload was written with, so that rows saved before an upgrade changing the schema of
+their signal are resolved against it. Rows that can't be decoded are set aside (see ``OutboxEvent.failed``) instead
+of blocking the relay.
+"""
+import json
+import logging
+from functools import lru_cache
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from edx_django_utils.monitoring import set_custom_attribute
+
+from openedx_events.data import EventsMetadata
+from openedx_events.event_bus import get_producer
+from openedx_events.event_bus.avro.deserializer import deserialize_bytes_to_event_data
+from openedx_events.event_bus.avro.schema import schema_string_from_signal
+from openedx_events.event_bus.encoded import EncodedEvent
+from openedx_events.models import OutboxEvent
+from openedx_events.tooling import OpenEdxPublicSignal
+
+logger = logging.getLogger(__name__)
+
+
+def save_to_outbox(*, topic, event_key_field, encoded_event, using=DEFAULT_DB_ALIAS):
+    """
+    Save an event to the outbox, in the current transaction of the database if there is one.
+
+    Arguments:
+        topic, event_key_field, encoded_event: see EventBusProducer.send_encoded.
+        using (str): alias of the database holding the outbox.
+
+    Returns:
+        OutboxEvent: the saved row.
+    """
+    return OutboxEvent.objects.using(using).create(
+        topic=topic,
+        event_type=encoded_event.signal.event_type,
+        event_key_field=event_key_field,
+        payload=encoded_event.value,
+        schema_fingerprint=encoded_event.schema_fingerprint.hex(),
+        writer_schema=schema_string_from_signal(encoded_event.signal),
+        metadata=encoded_event.event_metadata.to_json(),
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_writer_schema(schema_string):
+    """
+    Parse the writer schema of outbox rows, once per schema so that the deserializer can cache its fingerprint.
+    """
+    return json.loads(schema_string)
+
+
+def _get_outbox_message(outbox_event):
+    """
+    Get the keyword arguments of EventBusProducer.send_encoded publishing an outbox row.
+
+    Raises:
+        Exception: if the row can't be decoded, e.g. its event type is unknown or its payload was written with a
+            schema that is neither stored in the row nor registered with register_writer_schema.
+    """
+    signal = OpenEdxPublicSignal.get_signal_by_type(outbox_event.event_type)
+    payload = bytes(outbox_event.payload)
+    fingerprint = bytes.fromhex(outbox_event.schema_fingerprint)
+    if outbox_event.writer_schema:
+        writer_schema = _load_writer_schema(outbox_event.writer_schema)
+    else:
+        writer_schema = fingerprint
+    encoded_event = EncodedEvent(
+        signal,
+        deserialize_bytes_to_event_data(payload, signal, writer_schema=writer_schema),
+        EventsMetadata.from_json(outbox_event.metadata),
+    )
+    if fingerprint == encoded_event.schema_fingerprint:
+        # The payload is already serialized with the current schema of the signal.
+        encoded_event.value = payload
+    return {
+        "topic": outbox_event.topic,
+        "event_key_field": outbox_event.event_key_field,
+        "encoded_event": encoded_event,
+    }
+
+
+def _decode_outbox_events(outbox_events, using):
+    """
+    Get the messages of the outbox rows that can be decoded, and set the others aside.
+
+    Decoding errors don't go away by retrying, so the rows are marked as failed along with the error, and are no
+    longer relayed.
+
+    Returns:
+        list: (id, message) pairs of the decoded rows, in order.
+    """
+    decoded = []
+    for outbox_event in outbox_events:
+        try:
+            decoded.append((outbox_event.id, _get_outbox_message(outbox_event)))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Error decoding outbox event {outbox_event.id}, it is set aside and won't be retried")
+            OutboxEvent.objects.using(using).filter(id=outbox_event.id).update(failed=timezone.now(), error=repr(exc))
+    return decoded
+
+
+def _publish_outbox_events(producer, decoded):
+    """
+    Publish decoded outbox rows with the producer, in order, and return the ids of the published rows.
+
+    Producers supporting batches get all the rows at once and either publish all of them or none. Others get them
+    one by one, stopping at the first row that can't be published.
+    """
+    if producer.supports_batches:
+        try:
+            producer.send_batch([message for _, message in decoded])
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Error publishing a batch of {len(decoded)} outbox events, it will be retried")
+            return []
+        return [outbox_event_id for outbox_event_id, _ in decoded]
+
+    published_ids = []
+    for outbox_event_id, message in decoded:
+        try:
+            producer.send_encoded(**message)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception(f"Error publishing outbox event {outbox_event_id}, it will be retried")
+            break
+        published_ids.append(outbox_event_id)
+    return published_ids
+
+
+def relay_outbox_batch(batch_size=100, delete=False, flush_timeout=30, using=DEFAULT_DB_ALIAS):
+    """
+    Publish the oldest unpublished events of the outbox, in order.
+
+    The rows are locked with ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database supports it, so that several
+    relays can run at the same time (at the cost of ordering across relays). The batch stops at the first event
+    that can't be published, which is retried by the next batch, so events are never published out of order by a
+    single relay. Rows are only marked as published once the producer has flushed them to the event bus. Rows that
+    can't be decoded are marked as failed and skipped.
+
+    Arguments:
+        batch_size (int): maximum number of events to publish.
+        delete (bool): delete the published rows, instead of marking them as published.
+        flush_timeout (float): maximum number of seconds to wait for the producer to deliver the events.
+        using (str): alias of the database holding the outbox.
+
+    Returns:
+        tuple: number of events published, and whether an event could not be published.
+    """
+    producer = get_producer()
+    with transaction.atomic(using=using):
+        unpublished = OutboxEvent.objects.using(using).filter(published__isnull=True, failed__isnull=True)
+        unpublished = unpublished.order_by("id")
+        if connections[using].features.has_select_for_update_skip_locked:
+            unpublished = unpublished.select_for_update(skip_locked=True)
+        decoded = _decode_outbox_events(list(unpublished[:batch_size]), using)
+        published_ids = _publish_outbox_events(producer, decoded)
+        failed = len(published_ids) < len(decoded)
+        if published_ids and not producer.flush(flush_timeout):
+            logger.error(f"Timed out delivering {len(published_ids)} outbox events, they will be retried")
+            published_ids, failed = [], True
+
+        published = OutboxEvent.objects.using(using).filter(id__in=published_ids)
+        if delete:
+            published.delete()
+        else:
+            published.update(published=timezone.now())
+    return len(published_ids), failed
+
+
+def get_outbox_backlog(using=DEFAULT_DB_ALIAS):
+    """
+    Get the number of unpublished events in the outbox and the age of the oldest one, not counting failed events.
+
+    The values are also set as the custom monitoring attributes ``openedx_events.outbox_backlog_size`` and
+    ``openedx_events.outbox_backlog_age``.
+
+    Arguments:
+        using (str): alias of the database holding the outbox.
+
+    Returns:
+        tuple: the number of unpublished events, and the age in seconds of the oldest one (0 if there's none).
+    """
+    unpublished = OutboxEvent.objects.using(using).filter(published__isnull=True, failed__isnull=True)
+    size = unpublished.count()
+    oldest = unpublished.order_by("id").values_list("created", flat=True).first()
+    age = (timezone.now() - oldest).total_seconds() if oldest else 0
+    set_custom_attribute("openedx_events.outbox_backlog_size", size)
+    set_custom_attribute("openedx_events.outbox_backlog_age", age)
+    return size, age
+
+
+def purge_outbox(older_than, using=DEFAULT_DB_ALIAS):
+    """
+    Delete the events of the outbox that were published before a given age.
+
+    Arguments:
+        older_than (timedelta): minimum time since the events were published.
+        using (str): alias of the database holding the outbox.
+
+    Returns:
+        int: the number of deleted events.
+    """
+    deleted, _ = OutboxEvent.objects.using(using).filter(published__lt=timezone.now() - older_than).delete()
+    return deleted
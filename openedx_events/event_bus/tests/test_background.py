@@ -0,0 +1,150 @@
+"""
+Tests for the background producer queue.
+"""
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import ddt
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from openedx_events.event_bus.background import DROP_NEWEST, DROP_OLDEST, BackgroundProducer, get_background_producer
+from openedx_events.tests.utils import login_event_message, published_user_ids
+
+
+@ddt.ddt
+class TestBackgroundProducer(TestCase):
+    """
+    Tests for BackgroundProducer.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.producer = Mock()
+        patcher = patch("openedx_events.event_bus.background.get_producer", return_value=self.producer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_events_are_published_in_background(self):
+        background_producer = BackgroundProducer(workers=2)
+        self.addCleanup(background_producer.close)
+
+        for number in range(10):
+            background_producer.send_encoded(**login_event_message(number))
+
+        assert background_producer.flush(timeout=5)
+        assert sorted(published_user_ids(self.producer.send_encoded)) == list(range(10))
+        assert background_producer.stats() == {
+            "depth": 0, "maxsize": 1000, "enqueued": 10, "published": 10, "dropped": 0, "errors": 0,
+        }
+
+    def test_send(self):
+        background_producer = BackgroundProducer()
+        self.addCleanup(background_producer.close)
+        message = login_event_message(1)
+        encoded_event = message.pop("encoded_event")
+
+        background_producer.send(
+            signal=encoded_event.signal,
+            event_data=encoded_event.event_data,
+            event_metadata=encoded_event.event_metadata,
+            **message,
+        )
+
+        assert background_producer.flush(timeout=5)
+        assert published_user_ids(self.producer.send_encoded) == [1]
+        assert self.producer.send_encoded.call_args.kwargs["encoded_event"].key("user.pii.username") == "user1"
+
+    def test_publishing_errors_are_logged(self):
+        self.producer.send_encoded.side_effect = [Exception("broker down"), None]
+        background_producer = BackgroundProducer()
+        self.addCleanup(background_producer.close)
+
+        with self.assertLogs("openedx_events.event_bus.background", "ERROR"):
+            background_producer.send_encoded(**login_event_message(1))
+            background_producer.send_encoded(**login_event_message(2))
+            assert background_producer.flush(timeout=5)
+
+        assert background_producer.stats()["errors"] == 1
+        assert background_producer.stats()["published"] == 1
+
+    def block_worker(self, background_producer):
+        """
+        Publish an event whose publication blocks the worker until the returned event is set.
+        """
+        started, release = threading.Event(), threading.Event()
+        published = []
+
+        def send(**kwargs):
+            if kwargs["encoded_event"].event_data["user"].id == 0:
+                started.set()
+                release.wait(5)
+            published.append(kwargs["encoded_event"].event_data["user"].id)
+
+        self.producer.send_encoded.side_effect = send
+        self.addCleanup(release.set)
+        background_producer.send_encoded(**login_event_message(0))
+        started.wait(5)
+        return release, published
+
+    @ddt.data(
+        (DROP_OLDEST, [2, 3]),
+        (DROP_NEWEST, [1, 2]),
+    )
+    @ddt.unpack
+    def test_full_queue_policy(self, policy, expected_published):
+        background_producer = BackgroundProducer(maxsize=2, full_queue_policy=policy)
+        self.addCleanup(background_producer.close)
+        release, published = self.block_worker(background_producer)
+
+        with self.assertLogs("openedx_events.event_bus.background", "WARNING"):
+            for number in (1, 2, 3):
+                background_producer.send_encoded(**login_event_message(number))
+        release.set()
+
+        assert background_producer.flush(timeout=5)
+        assert published == [0, *expected_published]
+        assert background_producer.stats()["dropped"] == 1
+
+    def test_drop_oldest_keeps_stopping_workers(self):
+        background_producer = BackgroundProducer(maxsize=1, full_queue_policy=DROP_OLDEST)
+        release, published = self.block_worker(background_producer)
+        background_producer.close(timeout=0.01)
+
+        with self.assertLogs("openedx_events.event_bus.background", "WARNING"):
+            background_producer.send_encoded(**login_event_message(1))
+        release.set()
+
+        background_producer._threads[0].join(5)  # pylint: disable=protected-access
+        assert not background_producer._threads[0].is_alive()  # pylint: disable=protected-access
+        assert published == [0]
+        assert background_producer.stats()["dropped"] == 1
+
+    def test_block_timeout(self):
+        background_producer = BackgroundProducer(maxsize=1, block_timeout=0.01)
+        self.addCleanup(background_producer.close)
+        self.block_worker(background_producer)
+        background_producer.send_encoded(**login_event_message(1))
+
+        with self.assertLogs("openedx_events.event_bus.background", "WARNING"):
+            background_producer.send_encoded(**login_event_message(2))
+
+        assert background_producer.stats()["dropped"] == 1
+        assert not background_producer.flush(timeout=0.01)
+
+    def test_invalid_policy(self):
+        with pytest.raises(ImproperlyConfigured, match="full_queue_policy"):
+            BackgroundProducer(full_queue_policy="drop_all")
+
+    def test_get_background_producer(self):
+        assert get_background_producer() is None
+
+        with override_settings(EVENT_BUS_PRODUCER_QUEUE={"maxsize": 10, "shutdown_timeout": 1}):
+            background_producer = get_background_producer()
+            assert isinstance(background_producer, BackgroundProducer)
+            assert get_background_producer() is background_producer
+            assert background_producer.stats()["maxsize"] == 10
+
+        assert get_background_producer() is None
@@ -0,0 +1,127 @@
+"""
+Tests for events encoded once for all their topics.
+"""
+import re
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import pytest
+from opaque_keys.edx.keys import UsageKey
+
+import openedx_events
+from openedx_events.content_authoring.data import XBlockData
+from openedx_events.content_authoring.signals import XBLOCK_PUBLISHED
+from openedx_events.event_bus import EventBusProducer
+from openedx_events.event_bus.avro.deserializer import deserialize_bytes_to_event_data
+from openedx_events.event_bus.avro.schema import fingerprint_from_signal
+from openedx_events.event_bus.encoded import EncodedEvent, get_event_key_extractor
+from openedx_events.tooling import OpenEdxPublicSignal
+
+
+class SendProducer(EventBusProducer):
+    """
+    Producer only implementing send.
+    """
+
+    def __init__(self):
+        """
+        Record the calls of send.
+        """
+        self.calls = []
+
+    def send(self, **kwargs):  # pylint: disable=arguments-differ
+        self.calls.append(kwargs)
+
+
+class TestEncodedEvent(TestCase):
+    """
+    Tests for EncodedEvent.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.event_data = {
+            "xblock_info": XBlockData(
+                usage_key=UsageKey.from_string("block-v1:edx+DemoX+Demo_course+type@video+block@UaEBjyMjcLW65"),
+                block_type="video",
+            ),
+        }
+        self.metadata = XBLOCK_PUBLISHED.generate_signal_metadata()
+        self.encoded_event = EncodedEvent(XBLOCK_PUBLISHED, self.event_data, self.metadata)
+
+    def test_value_is_serialized_once(self):
+        with patch(
+            "openedx_events.event_bus.encoded.serialize_event_data_to_bytes", return_value=b"avro"
+        ) as mock_serialize:
+            assert self.encoded_event.value == b"avro"
+            assert self.encoded_event.value == b"avro"
+
+        mock_serialize.assert_called_once_with(self.event_data, XBLOCK_PUBLISHED)
+
+    def test_value_round_trip(self):
+        assert deserialize_bytes_to_event_data(self.encoded_event.value, XBLOCK_PUBLISHED) == self.event_data
+        assert self.encoded_event.schema_fingerprint == fingerprint_from_signal(XBLOCK_PUBLISHED)
+
+    def test_headers(self):
+        assert self.encoded_event.headers == self.metadata.to_json_data()
+        assert self.encoded_event.headers["id"] == str(self.metadata.id)
+
+    def test_key(self):
+        usage_key = self.event_data["xblock_info"].usage_key
+
+        assert self.encoded_event.key("xblock_info.usage_key") == usage_key
+        assert self.encoded_event.key("xblock_info") is self.event_data["xblock_info"]
+        # attributes of types that aren't attrs classes are looked up without being checked
+        assert self.encoded_event.key("xblock_info.usage_key.block_id") == usage_key.block_id
+
+    def test_extractors_are_compiled_once(self):
+        extractor = get_event_key_extractor(XBLOCK_PUBLISHED, "xblock_info.usage_key")
+
+        assert get_event_key_extractor(XBLOCK_PUBLISHED, "xblock_info.usage_key") is extractor
+        assert extractor(self.event_data) == self.event_data["xblock_info"].usage_key
+
+    def test_invalid_key_fields(self):
+        with pytest.raises(ValueError, match="'user' is not in the data of"):
+            get_event_key_extractor(XBLOCK_PUBLISHED, "user.id")
+        with pytest.raises(ValueError, match="XBlockData of 'xblock_info.usage' has no attribute 'usage'"):
+            get_event_key_extractor(XBLOCK_PUBLISHED, "xblock_info.usage")
+
+    def test_documented_key_fields(self):
+        """
+        Test that the event key fields documented by the signal annotations can be compiled.
+        """
+        annotations = re.compile(
+            r"# \.\. event_type: (\S+)\n(?:# (?!\.\. event_type).*\n)*?# \.\. event_key_field: (\S+)\n"
+        )
+        documented = []
+        for signals_path in Path(openedx_events.__file__).parent.glob("*/signals.py"):
+            documented.extend(annotations.findall(signals_path.read_text()))
+
+        assert documented
+        for event_type, event_key_field in documented:
+            get_event_key_extractor(OpenEdxPublicSignal.get_signal_by_type(event_type), event_key_field)
+
+    def test_str(self):
+        assert str(self.encoded_event) == f"{self.metadata.id} of {XBLOCK_PUBLISHED.event_type}"
+
+    def test_send_encoded_defaults_to_send(self):
+        producer = SendProducer()
+        producer.send_encoded(topic="topic", event_key_field="xblock_info.usage_key", encoded_event=self.encoded_event)
+
+        assert producer.calls == [{
+            "signal": XBLOCK_PUBLISHED,
+            "topic": "topic",
+            "event_key_field": "xblock_info.usage_key",
+            "event_data": self.event_data,
+            "event_metadata": self.metadata,
+        }]
+        # nothing was encoded for the producer
+        assert "value" not in vars(self.encoded_event)
+
+    def test_send_encoded_is_not_abstract(self):
+        producer = Mock(spec=EventBusProducer)
+
+        EventBusProducer.send_encoded(producer, topic="topic", event_key_field="key", encoded_event=self.encoded_event)
+
+        producer.send.assert_called_once()
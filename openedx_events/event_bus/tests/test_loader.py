@@ -7,12 +7,14 @@ import sys
 import warnings
 from contextlib import contextmanager
 from unittest import TestCase
+from unittest.mock import Mock
 
 import pytest
 from django.test import override_settings
 
 from openedx_events.data import EventsMetadata
 from openedx_events.event_bus import _try_load, get_producer, make_single_consumer, merge_producer_configs
+from openedx_events.event_bus.tests.test_encoded import SendProducer
 from openedx_events.learning.signals import SESSION_LOGIN_COMPLETED
 
 
@@ -130,6 +132,25 @@ class TestProducer(TestCase):
                 event_key_field='user.id', event_data={},
                 event_metadata=EventsMetadata(event_type='eh')
             ) is None
+            assert producer.send_batch([{}]) is None
+            assert producer.flush(timeout=1) is True
+        assert producer.supports_batches
+
+    def test_batch_defaults(self):
+        """
+        Test that batches are sent one by one by producers only implementing send.
+        """
+        producer = SendProducer()
+        messages = [
+            {"topic": "user-logins", "event_key_field": "user.id", "encoded_event": Mock()},
+            {"topic": "user-logouts", "event_key_field": "user.id", "encoded_event": Mock()},
+        ]
+
+        producer.send_batch(messages)
+
+        assert [call["topic"] for call in producer.calls] == ["user-logins", "user-logouts"]
+        assert producer.flush() is True
+        assert not producer.supports_batches
 
 
 class TestConsumer(TestCase):
@@ -205,6 +226,10 @@ class TestSettings(TestCase):
                 'topic_a': {'enabled': False},
                 # no override for 'enabled'
                 'topic_b': {'event_key_field': 'new_field'}
+            },
+            'event_type_1': {
+                # only override the producer mode
+                'topic_c': {'mode': 'on-commit'},
             }
         }
         result = merge_producer_configs(self.base_config, overrides)
@@ -214,6 +239,6 @@ class TestSettings(TestCase):
                 'topic_b': {'event_key_field': 'new_field', 'enabled': True}
             },
             'event_type_1': {
-                'topic_c': {'event_key_field': 'field', 'enabled': True},
+                'topic_c': {'event_key_field': 'field', 'enabled': True, 'mode': 'on-commit'},
             }
         })
@@ -0,0 +1,148 @@
+"""
+Tests for publishing events when the current transaction commits.
+"""
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from openedx_events.event_bus.on_commit import OnCommitBatch, publish_on_commit
+from openedx_events.tests.utils import login_event_message, published_user_ids
+
+
+@patch("openedx_events.event_bus.on_commit.get_producer", **{"return_value.supports_batches": False})
+class TestPublishOnCommit(TestCase):
+    """
+    Tests for publish_on_commit inside transactions.
+    """
+
+    def test_events_are_batched(self, mock_producer):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for number in range(3):
+                publish_on_commit(**login_event_message(number))
+            self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [0, 1, 2])
+
+    def test_rolled_back_savepoints_are_discarded(self, mock_producer):
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_on_commit(**login_event_message(1))
+            try:
+                with transaction.atomic():
+                    publish_on_commit(**login_event_message(2))
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+            publish_on_commit(**login_event_message(3))
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [1, 3])
+
+    def test_batch_is_published_after_other_callbacks(self, mock_producer):
+        calls = []
+        mock_producer.return_value.send_encoded.side_effect = (
+            lambda **kwargs: calls.append(kwargs["encoded_event"].event_data["user"].id)
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_on_commit(**login_event_message(1))
+            with transaction.atomic():
+                publish_on_commit(**login_event_message(2))
+                publish_on_commit(**login_event_message(3))
+            transaction.on_commit(lambda: calls.append("other callback"))
+            publish_on_commit(**login_event_message(4))
+
+        self.assertEqual(calls, ["other callback", 1, 2, 3, 4])
+
+    def test_sequential_savepoints_share_a_batch(self, mock_producer):
+        mock_producer.return_value.supports_batches = True
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for number in range(5):
+                try:
+                    with transaction.atomic():
+                        publish_on_commit(**login_event_message(number))
+                        if number in (0, 3):
+                            raise ValueError("rollback")
+                except ValueError:
+                    pass
+
+        mock_producer.return_value.send_batch.assert_called_once()
+        self.assertEqual(
+            [message["encoded_event"].event_data["user"].id
+             for message in mock_producer.return_value.send_batch.call_args.args[0]],
+            [1, 2, 4],
+        )
+
+    def test_publishing_errors_are_logged(self, mock_producer):
+        mock_producer.return_value.send_encoded.side_effect = [Exception("broker down"), None]
+
+        with self.assertLogs("openedx_events.event_bus.on_commit", "ERROR"):
+            OnCommitBatch([login_event_message(1), login_event_message(2)])()
+
+        self.assertEqual(mock_producer.return_value.send_encoded.call_count, 2)
+
+    def test_batches_are_sent_to_batch_producers(self, mock_producer):
+        mock_producer.return_value.supports_batches = True
+        batch = OnCommitBatch([login_event_message(1), login_event_message(2)])
+
+        batch()
+        mock_producer.return_value.send_batch.side_effect = Exception("broker down")
+        with self.assertLogs("openedx_events.event_bus.on_commit", "ERROR"):
+            batch()
+
+        self.assertEqual(mock_producer.return_value.send_batch.call_count, 2)
+        mock_producer.return_value.send_batch.assert_called_with(batch.messages)
+        mock_producer.return_value.send_encoded.assert_not_called()
+
+
+@patch("openedx_events.event_bus.on_commit.get_producer", **{"return_value.supports_batches": False})
+class TestPublishWithoutTransaction(TransactionTestCase):
+    """
+    Tests for publish_on_commit outside of transactions.
+    """
+
+    def test_events_are_published_immediately(self, mock_producer):
+        publish_on_commit(**login_event_message(1))
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [1])
+
+    def test_events_are_published_after_commit(self, mock_producer):
+        with transaction.atomic():
+            publish_on_commit(**login_event_message(1))
+            publish_on_commit(**login_event_message(2))
+            self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [])
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [1, 2])
+
+    def test_sequential_savepoints_are_published_in_one_batch(self, mock_producer):
+        mock_producer.return_value.supports_batches = True
+
+        with transaction.atomic():
+            for number in range(5):
+                try:
+                    with transaction.atomic():
+                        publish_on_commit(**login_event_message(number))
+                        if number == 0:
+                            raise ValueError("rollback")
+                except ValueError:
+                    pass
+            mock_producer.return_value.send_batch.assert_not_called()
+
+        mock_producer.return_value.send_batch.assert_called_once()
+        self.assertEqual(
+            [message["encoded_event"].event_data["user"].id
+             for message in mock_producer.return_value.send_batch.call_args.args[0]],
+            [1, 2, 3, 4],
+        )
+
+    def test_rolled_back_transactions_are_discarded(self, mock_producer):
+        try:
+            with transaction.atomic():
+                publish_on_commit(**login_event_message(1))
+                raise ValueError("rollback")
+        except ValueError:
+            pass
+
+        publish_on_commit(**login_event_message(2))
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [2])
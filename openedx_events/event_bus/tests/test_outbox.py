@@ -0,0 +1,173 @@
+"""
+Tests for publishing events through the transactional outbox.
+"""
+import json
+from datetime import timedelta
+from io import BytesIO
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from fastavro import schemaless_writer
+
+from openedx_events.event_bus.avro.schema import schema_fingerprint, schema_from_signal
+from openedx_events.event_bus.avro.serializer import get_signal_serializer
+from openedx_events.event_bus.outbox import get_outbox_backlog, purge_outbox, relay_outbox_batch, save_to_outbox
+from openedx_events.learning.signals import SESSION_LOGIN_COMPLETED
+from openedx_events.models import OutboxEvent
+from openedx_events.tests.utils import login_event_message, published_user_ids
+
+
+@patch("openedx_events.event_bus.outbox.get_producer", **{"return_value.supports_batches": False})
+class TestOutbox(TestCase):
+    """
+    Tests for saving, relaying and purging outbox events.
+    """
+
+    def test_events_are_relayed_in_order(self, mock_producer):
+        message = login_event_message(1)
+        save_to_outbox(**message)
+        save_to_outbox(**login_event_message(2))
+        save_to_outbox(**login_event_message(3))
+
+        self.assertEqual(relay_outbox_batch(batch_size=2), (2, False))
+        self.assertEqual(relay_outbox_batch(batch_size=2), (1, False))
+        self.assertEqual(relay_outbox_batch(batch_size=2), (0, False))
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [1, 2, 3])
+        first_call = mock_producer.return_value.send_encoded.call_args_list[0].kwargs
+        self.assertEqual(first_call["topic"], "user-login")
+        self.assertEqual(first_call["event_key_field"], "user.pii.username")
+        self.assertEqual(first_call["encoded_event"].signal, SESSION_LOGIN_COMPLETED)
+        self.assertEqual(first_call["encoded_event"].event_metadata, message["encoded_event"].event_metadata)
+        self.assertEqual(first_call["encoded_event"].key("user.pii.username"), "user1")
+        # the payload saved with the current schema is published as is
+        self.assertEqual(first_call["encoded_event"].value, message["encoded_event"].value)
+        self.assertEqual(OutboxEvent.objects.filter(published__isnull=True).count(), 0)
+
+    def test_relay_stops_at_first_failure(self, mock_producer):
+        mock_producer.return_value.send_encoded.side_effect = [None, Exception("broker down"), None, None]
+        for number in range(3):
+            save_to_outbox(**login_event_message(number))
+
+        with self.assertLogs("openedx_events.event_bus.outbox", "ERROR"):
+            self.assertEqual(relay_outbox_batch(), (1, True))
+        self.assertEqual(relay_outbox_batch(), (2, False))
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [0, 1, 1, 2])
+
+    def test_relay_batches(self, mock_producer):
+        mock_producer.return_value.supports_batches = True
+        mock_producer.return_value.send_batch.side_effect = [Exception("broker down"), None]
+        for number in range(3):
+            save_to_outbox(**login_event_message(number))
+
+        with self.assertLogs("openedx_events.event_bus.outbox", "ERROR"):
+            self.assertEqual(relay_outbox_batch(), (0, True))
+        self.assertEqual(relay_outbox_batch(), (3, False))
+
+        messages = mock_producer.return_value.send_batch.call_args.args[0]
+        self.assertEqual(
+            [message["encoded_event"].event_data["user"].id for message in messages],
+            [0, 1, 2],
+        )
+        mock_producer.return_value.send_encoded.assert_not_called()
+
+    def test_relay_waits_for_delivery(self, mock_producer):
+        mock_producer.return_value.flush.return_value = False
+        save_to_outbox(**login_event_message(1))
+
+        with self.assertLogs("openedx_events.event_bus.outbox", "ERROR"):
+            self.assertEqual(relay_outbox_batch(flush_timeout=5), (0, True))
+
+        mock_producer.return_value.flush.assert_called_once_with(5)
+        self.assertEqual(OutboxEvent.objects.filter(published__isnull=True).count(), 1)
+
+    def test_rows_written_with_an_older_schema(self, mock_producer):
+        message = login_event_message(1)
+        # The older schema had a field that was removed since
+        older_schema = schema_from_signal(SESSION_LOGIN_COMPLETED)
+        older_schema = {**older_schema, "fields": [*older_schema["fields"], {"name": "removed_field", "type": "long"}]}
+        payload = BytesIO()
+        schemaless_writer(payload, older_schema, {
+            **get_signal_serializer(SESSION_LOGIN_COMPLETED).to_dict(message["encoded_event"].event_data),
+            "removed_field": 1,
+        })
+        outbox_event = save_to_outbox(**message)
+        outbox_event.payload = payload.getvalue()
+        outbox_event.schema_fingerprint = schema_fingerprint(older_schema).hex()
+        outbox_event.writer_schema = json.dumps(older_schema)
+        outbox_event.save()
+
+        self.assertEqual(relay_outbox_batch(), (1, False))
+
+        encoded_event = mock_producer.return_value.send_encoded.call_args.kwargs["encoded_event"]
+        self.assertEqual(encoded_event.event_data, message["encoded_event"].event_data)
+        # the event is published with the current schema
+        self.assertEqual(encoded_event.value, message["encoded_event"].value)
+
+    def test_undecodable_rows_are_set_aside(self, mock_producer):
+        for number in range(3):
+            save_to_outbox(**login_event_message(number))
+        # Written with an unknown schema that wasn't stored in the row
+        OutboxEvent.objects.filter(id=OutboxEvent.objects.all()[1].id).update(
+            schema_fingerprint="00" * 8, writer_schema="",
+        )
+
+        with self.assertLogs("openedx_events.event_bus.outbox", "ERROR"):
+            self.assertEqual(relay_outbox_batch(), (2, False))
+        self.assertEqual(relay_outbox_batch(), (0, False))
+
+        self.assertEqual(published_user_ids(mock_producer.return_value.send_encoded), [0, 2])
+        failed_event = OutboxEvent.objects.get(failed__isnull=False)
+        self.assertIsNone(failed_event.published)
+        self.assertIn("0000000000000000", failed_event.error)
+        self.assertEqual(get_outbox_backlog(), (0, 0))
+
+    def test_relay_and_delete(self, mock_producer):
+        save_to_outbox(**login_event_message(1))
+
+        self.assertEqual(relay_outbox_batch(delete=True), (1, False))
+
+        self.assertFalse(OutboxEvent.objects.exists())
+        mock_producer.return_value.send_encoded.assert_called_once()
+
+    def test_backlog(self, mock_producer):  # pylint: disable=unused-argument
+        self.assertEqual(get_outbox_backlog(), (0, 0))
+        save_to_outbox(**login_event_message(1))
+        save_to_outbox(**login_event_message(2))
+        OutboxEvent.objects.update(created=timezone.now() - timedelta(minutes=1))
+
+        size, age = get_outbox_backlog()
+
+        self.assertEqual(size, 2)
+        self.assertGreaterEqual(age, 60)
+
+    def test_purge(self, mock_producer):  # pylint: disable=unused-argument
+        for number in range(3):
+            save_to_outbox(**login_event_message(number))
+        relay_outbox_batch(batch_size=2)
+        OutboxEvent.objects.filter(published__isnull=False).update(published=timezone.now() - timedelta(days=8))
+
+        self.assertEqual(purge_outbox(timedelta(days=7)), 2)
+        self.assertEqual(purge_outbox(timedelta(days=7)), 0)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
+
+
+class TestOutboxTransactions(TransactionTestCase):
+    """
+    Tests for saving outbox events in transactions.
+    """
+
+    def test_rolled_back_events_are_not_saved(self):
+        with transaction.atomic():
+            save_to_outbox(**login_event_message(1))
+        try:
+            with transaction.atomic():
+                save_to_outbox(**login_event_message(2))
+                raise ValueError("rollback")
+        except ValueError:
+            pass
+
+        self.assertEqual(OutboxEvent.objects.count(), 1)
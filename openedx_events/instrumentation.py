@@ -0,0 +1,276 @@
+"""
+Opt-in instrumentation of the receivers of Open edX Events.
+
+When the EVENTS_RECEIVER_INSTRUMENTATION_ENABLED toggle is on, each call of a receiver by ``send_event`` is timed,
+and the following are recorded by event type and receiver:
+
+* the number of calls and errors, and a histogram of their latencies, kept in memory by the process, see
+  ``get_receiver_stats``. Each process only sees its own calls, so use a metrics sink to collect the calls of all
+  processes,
+* calls slower than the latency budget of the event type, see EVENTS_RECEIVER_LATENCY_BUDGET,
+* every call, by the metrics sink configured by EVENTS_RECEIVER_METRICS_SINK, if any.
+"""
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from functools import lru_cache
+from logging import getLogger
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from edx_django_utils.monitoring import accumulate
+
+from openedx_events.utils import _callable_path
+
+log = getLogger(__name__)
+
+# Upper bounds, in milliseconds, of the buckets of the latency histograms. The last bucket holds slower calls.
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class ReceiverStats:
+    """
+    Number of calls, errors and calls over budget of a receiver of an event type, with their latency histogram.
+    """
+
+    __slots__ = ("calls", "errors", "slow_calls", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        """
+        Start with no calls.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.slow_calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, duration_ms, error, slow):
+        """
+        Add a call to the stats.
+
+        Arguments:
+            duration_ms (float): duration of the call in milliseconds.
+            error (bool): whether the receiver raised an exception.
+            slow (bool): whether the call took longer than the latency budget.
+        """
+        self.calls += 1
+        self.errors += error
+        self.slow_calls += slow
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    def to_dict(self):
+        """
+        Get the stats as a dictionary, with the histogram keyed by the upper bound of each bucket.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow_calls": self.slow_calls,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+            "histogram": {
+                **{f"<={bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                f">{LATENCY_BUCKETS_MS[-1]}ms": self.buckets[-1],
+            },
+        }
+
+
+class ReceiverMetricsSink(ABC):
+    """
+    Parent class for the destinations of the measurements of receiver calls, see EVENTS_RECEIVER_METRICS_SINK.
+    """
+
+    @abstractmethod
+    def record_receiver_call(self, event_type, receiver_path, duration_ms, error):
+        """
+        Record a call of a receiver.
+
+        Arguments:
+            event_type (str): type of the event sent.
+            receiver_path (str): dotted path of the receiver.
+            duration_ms (float): duration of the call in milliseconds.
+            error (Exception): exception raised by the receiver, None if it returned normally.
+        """
+
+
+class MonitoringMetricsSink(ReceiverMetricsSink):
+    """
+    Accumulate the time spent in receivers and their errors as custom attributes of the monitored transaction.
+
+    Uses ``edx_django_utils.monitoring``, so the attributes are reported by the configured monitoring backends
+    (e.g. New Relic or Datadog) as ``openedx_events.receivers_ms`` and ``openedx_events.receiver_errors``.
+    """
+
+    def record_receiver_call(self, event_type, receiver_path, duration_ms, error):
+        """
+        Accumulate the duration of the call, and count it if it raised an exception.
+        """
+        accumulate("openedx_events.receivers_ms", duration_ms)
+        if error is not None:
+            accumulate("openedx_events.receiver_errors", 1)
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def is_instrumentation_enabled():
+    """
+    Check whether receiver calls are instrumented.
+    """
+    # .. toggle_name: EVENTS_RECEIVER_INSTRUMENTATION_ENABLED
+    # .. toggle_implementation: DjangoSetting
+    # .. toggle_default: False
+    # .. toggle_description: If True, each call of a receiver by send_event is timed, and its duration and outcome
+    #   are added to the receiver stats of the process, checked against EVENTS_RECEIVER_LATENCY_BUDGET, and sent to
+    #   the EVENTS_RECEIVER_METRICS_SINK. Receivers are then called by openedx_events instead of Django's send and
+    #   send_robust, with the same behavior.
+    # .. toggle_use_cases: open_edx
+    # .. toggle_creation_date: 2026-10-18
+    return getattr(settings, "EVENTS_RECEIVER_INSTRUMENTATION_ENABLED", False)
+
+
+@lru_cache(maxsize=None)
+def _get_latency_budget(event_type):
+    """
+    Get the latency budget in milliseconds of each receiver of an event type, None if it has no budget.
+    """
+    # .. setting_name: EVENTS_RECEIVER_LATENCY_BUDGET
+    # .. setting_default: None
+    # .. setting_description: Maximum duration in milliseconds of a receiver call, when receivers are instrumented
+    #   (see EVENTS_RECEIVER_INSTRUMENTATION_ENABLED). Calls taking longer are counted as slow calls and reported to
+    #   the EVENTS_RECEIVER_SLOW_CALLBACK. Either a number applying to all event types, or a dictionary of numbers
+    #   by event type, where the "*" key applies to the event types that are not listed. For example:
+    #   {"*": 100, "org.openedx.learning.course.enrollment.created.v1": 50}
+    budget = getattr(settings, "EVENTS_RECEIVER_LATENCY_BUDGET", None)
+    if isinstance(budget, dict):
+        return budget.get(event_type, budget.get("*"))
+    return budget
+
+
+def log_slow_receiver(event_type, receiver_path, duration_ms, budget_ms):
+    """
+    Log a warning for a receiver call over its latency budget.
+
+    Default EVENTS_RECEIVER_SLOW_CALLBACK.
+    """
+    log.warning(
+        "Receiver %s of the Open edX Event <%s> took %.1f ms, over its budget of %s ms",
+        receiver_path,
+        event_type,
+        duration_ms,
+        budget_ms,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_slow_receiver_callback():
+    """
+    Get the function called for receiver calls over their latency budget.
+    """
+    # .. setting_name: EVENTS_RECEIVER_SLOW_CALLBACK
+    # .. setting_default: 'openedx_events.instrumentation.log_slow_receiver'
+    # .. setting_description: Dotted path of the function called with the event type, the receiver path, the
+    #   duration of the call and the latency budget (both in milliseconds) when an instrumented receiver call takes
+    #   longer than its EVENTS_RECEIVER_LATENCY_BUDGET. Defaults to logging a warning.
+    return import_string(
+        getattr(settings, "EVENTS_RECEIVER_SLOW_CALLBACK", "openedx_events.instrumentation.log_slow_receiver")
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_metrics_sink():
+    """
+    Get the ReceiverMetricsSink instance recording receiver calls, None if there is none.
+    """
+    # .. setting_name: EVENTS_RECEIVER_METRICS_SINK
+    # .. setting_default: None
+    # .. setting_description: Dotted path of a ReceiverMetricsSink subclass (or a callable creating an instance of
+    #   one) recording each instrumented receiver call, to export the measurements to a metrics system. For example:
+    #   'openedx_events.instrumentation.MonitoringMetricsSink'
+    sink_path = getattr(settings, "EVENTS_RECEIVER_METRICS_SINK", None)
+    if sink_path is None:
+        return None
+    return import_string(sink_path)()
+
+
+@receiver(setting_changed)
+def _reset_instrumentation_config(setting, **kwargs):  # pylint: disable=unused-argument
+    """
+    Forget the cached instrumentation configuration when the settings change (e.g. in tests).
+    """
+    if setting == "EVENTS_RECEIVER_LATENCY_BUDGET":
+        _get_latency_budget.cache_clear()
+    elif setting == "EVENTS_RECEIVER_SLOW_CALLBACK":
+        _get_slow_receiver_callback.cache_clear()
+    elif setting == "EVENTS_RECEIVER_METRICS_SINK":
+        _get_metrics_sink.cache_clear()
+
+
+def record_receiver_call(event_type, receiver_function, duration_ms, error=None):
+    """
+    Record a call of a receiver in the receiver stats, and report it to the slow receiver callback and metrics sink.
+
+    Failures of any step, including those of the callback and the sink, are logged, so that instrumentation never
+    breaks sending events.
+
+    Arguments:
+        event_type (str): type of the event sent.
+        receiver_function (callable): receiver called.
+        duration_ms (float): duration of the call in milliseconds.
+        error (Exception): exception raised by the receiver, None if it returned normally.
+    """
+    receiver_path = receiver_function
+    try:
+        receiver_path = _callable_path(receiver_function)
+        budget_ms = _get_latency_budget(event_type)
+        slow = budget_ms is not None and duration_ms > budget_ms
+        with _stats_lock:
+            stats = _stats.get((event_type, receiver_path))
+            if stats is None:
+                stats = _stats[(event_type, receiver_path)] = ReceiverStats()
+            stats.record(duration_ms, error is not None, slow)
+
+        if slow:
+            _get_slow_receiver_callback()(event_type, receiver_path, duration_ms, budget_ms)
+        sink = _get_metrics_sink()
+        if sink is not None:
+            sink.record_receiver_call(event_type, receiver_path, duration_ms, error)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        log.error(
+            "Error reporting the call of %s for the Open edX Event <%s> (%s)",
+            receiver_path,
+            event_type,
+            err,
+            exc_info=err,
+        )
+
+
+def get_receiver_stats():
+    """
+    Get the stats of the receivers called by the process since the stats were last reset.
+
+    Returns:
+        dict: map of event type to a map of receiver path to the stats of the receiver, see ReceiverStats.to_dict.
+    """
+    with _stats_lock:
+        stats = {key: receiver_stats.to_dict() for key, receiver_stats in _stats.items()}
+    stats_by_event_type = {}
+    for (event_type, receiver_path), receiver_stats in sorted(stats.items()):
+        stats_by_event_type.setdefault(event_type, {})[receiver_path] = receiver_stats
+    return stats_by_event_type
+
+
+def reset_receiver_stats():
+    """
+    Forget the stats of all receivers.
+    """
+    with _stats_lock:
+        _stats.clear()
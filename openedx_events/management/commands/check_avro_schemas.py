@@ -0,0 +1,86 @@
+"""
+Management command to check the compatibility of the current Avro schemas with the stored ones.
+"""
+import logging
+from importlib import import_module
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openedx_events.event_bus.avro.compatibility import (
+    COMPATIBILITY_LEVELS,
+    FULL,
+    check_signals_compatibility,
+    load_schema_history,
+)
+from openedx_events.tooling import KNOWN_UNSERIALIZABLE_SIGNALS, OpenEdxPublicSignal, load_all_signals
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to check the current Avro schemas of all signals against their stored schemas.
+    """
+
+    help = """
+    Check that the current Avro schema of each OpenEdxPublicSignal is compatible with its stored schemas.
+
+    Stored schemas are read from openedx_events/event_bus/avro/tests/schemas by default, see the
+    generate_avro_schemas management command. Exits with an error if any schema is incompatible, or if a signal
+    has no stored schema.
+
+    Example::
+
+        # check full (backward and forward) compatibility of all signals
+        python manage.py check_avro_schemas
+
+        # check that consumers using the current schemas can read events produced with the stored schemas
+        python manage.py check_avro_schemas --compatibility backward --schemas-dir /path/to/schemas
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguments for the compatibility level and the folder of stored schemas.
+        """
+        parser.add_argument(
+            '--compatibility',
+            choices=COMPATIBILITY_LEVELS,
+            default=FULL,
+            help='Compatibility level to check. Defaults to full.'
+        )
+        parser.add_argument(
+            '--schemas-dir',
+            type=str,
+            help='Folder of the stored .avsc schemas. Defaults to the schemas stored in openedx_events.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Check the schemas of all serializable signals, and fail if any is incompatible.
+        """
+        load_all_signals()
+        schemas_dir = options['schemas_dir']
+        if not schemas_dir:
+            root_path = import_module('openedx_events').__path__[0]
+            schemas_dir = f"{root_path}/event_bus/avro/tests/schemas"
+
+        history = load_schema_history(schemas_dir)
+        signals = [
+            signal for signal in OpenEdxPublicSignal.all_events()
+            if signal.event_type not in KNOWN_UNSERIALIZABLE_SIGNALS
+        ]
+        problems_by_event_type = check_signals_compatibility(signals, history, level=options['compatibility'])
+
+        for event_type, problems in sorted(problems_by_event_type.items()):
+            for problem in problems:
+                logger.error(f"{event_type}: {problem}")
+        if problems_by_event_type:
+            raise CommandError(
+                f"{len(problems_by_event_type)} of {len(signals)} signals failed the {options['compatibility']}"
+                f" compatibility check against {schemas_dir}. If a new signal has been added, you may need to run"
+                f" the generate_avro_schemas management command to save the signal schema."
+            )
+        logger.info(
+            f"{len(signals)} signals passed the {options['compatibility']} compatibility check against"
+            f" {sum(len(schemas) for schemas in history.values())} stored schemas"
+        )
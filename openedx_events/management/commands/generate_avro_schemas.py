@@ -8,6 +8,7 @@ from importlib import import_module
 
 from django.core.management.base import BaseCommand
 
+from openedx_events.event_bus.avro.schema import build_schema_bundle
 from openedx_events.event_bus.avro.serializer import AvroSignalSerializer
 from openedx_events.tooling import KNOWN_UNSERIALIZABLE_SIGNALS, OpenEdxPublicSignal, load_all_signals
 
@@ -38,6 +39,9 @@ class Command(BaseCommand):
         # all signals
         python manage.py generate_avro_schemas --all
 
+        # a bundle of the schemas of all signals, to be loaded at startup with the EVENT_BUS_AVRO_SCHEMA_BUNDLE setting
+        python manage.py generate_avro_schemas --all --bundle /path/to/avro_schema_bundle.json
+
     """
 
     def add_arguments(self, parser):
@@ -57,6 +61,12 @@ class Command(BaseCommand):
             help='Write schema for all event types'
         )
 
+        parser.add_argument(
+            '--bundle',
+            type=str,
+            help='Write the schemas to a single bundle at this path instead of one file per event type'
+        )
+
     def handle(self, *args, **options):
         """
         Create consumer based on django settings and consume events.
@@ -67,10 +77,20 @@ class Command(BaseCommand):
         else:
             signals = [OpenEdxPublicSignal.get_signal_by_type(event_type) for event_type in options['types']]
 
+        serializable_signals = []
         for signal in signals:
             if signal.event_type in KNOWN_UNSERIALIZABLE_SIGNALS:
                 logger.info(f"Known unserializable signal: {signal.event_type}. Skipping.")
                 continue
+            serializable_signals.append(signal)
+
+        if options['bundle']:
+            logger.info(f"Writing {options['bundle']}")
+            with open(options['bundle'], 'w') as writes:
+                writes.write(json.dumps(build_schema_bundle(serializable_signals)))
+            return
+
+        for signal in serializable_signals:
             serializer = AvroSignalSerializer(signal)
             schema_dict = serializer.schema
             filename = f"{signal.event_type.replace('.','+')}_schema.avsc"
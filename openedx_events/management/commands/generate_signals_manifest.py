@@ -0,0 +1,62 @@
+"""
+Management command to generate the manifest of the signals defined by the library.
+"""
+import logging
+from importlib import import_module
+
+from django.core.management.base import BaseCommand
+
+from openedx_events.tooling import build_signals_manifest
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_HEADER = '''"""
+Map of the event type of each Open edX Event to the module and attribute defining its signal.
+
+Used to import signals on demand, and to load all signals without walking the package tree.
+Generated by the generate_signals_manifest management command, do not edit by hand.
+"""
+'''
+
+
+def format_signals_manifest(manifest):
+    """
+    Format a signals manifest as the source of the signals_manifest module.
+
+    Arguments:
+        manifest (dict): event type to (module name, attribute name) tuples, see build_signals_manifest.
+    """
+    lines = [MANIFEST_HEADER, "SIGNAL_MANIFEST = {"]
+    for event_type, (module_name, attribute) in manifest.items():
+        lines.append(f'    "{event_type}": (')
+        lines.append(f'        "{module_name}", "{attribute}",')
+        lines.append("    ),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+class Command(BaseCommand):
+    """
+    Management command to regenerate openedx_events/signals_manifest.py.
+    """
+
+    help = """
+    Generate the manifest mapping the event type of each OpenEdxPublicSignal to the module and attribute defining it.
+
+    Must be run whenever a signal is added, renamed or moved. A test checks that the manifest is up to date.
+
+    Example::
+
+        python manage.py generate_signals_manifest
+    """
+
+    def handle(self, *args, **options):
+        """
+        Walk the package tree to find all signals, and write the manifest.
+        """
+        manifest = build_signals_manifest()
+        root_path = import_module('openedx_events').__path__[0]
+        file_name = f"{root_path}/signals_manifest.py"
+        logger.info(f"Writing {len(manifest)} signals to {file_name}")
+        with open(file_name, 'w') as writes:
+            writes.write(format_signals_manifest(manifest))
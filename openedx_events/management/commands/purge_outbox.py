@@ -0,0 +1,43 @@
+"""
+Management command to delete the published events of the transactional outbox.
+"""
+import logging
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from openedx_events.event_bus.outbox import purge_outbox
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to delete the events of the outbox that were published some time ago.
+    """
+
+    help = """
+    Delete the events of the outbox that were published by relay_outbox more than a number of days ago.
+
+    Example::
+
+        python3 manage.py purge_outbox --days 7
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add argument for the number of days the published events are kept.
+        """
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Number of days the published events are kept. Defaults to 7.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Delete the published events older than the number of days.
+        """
+        deleted = purge_outbox(timedelta(days=options['days']))
+        logger.info(f"Deleted {deleted} published outbox events")
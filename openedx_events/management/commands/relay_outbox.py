@@ -0,0 +1,74 @@
+"""
+Management command to publish the events of the transactional outbox to the event bus.
+"""
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from openedx_events.event_bus.outbox import get_outbox_backlog, relay_outbox_batch
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to relay the events saved by the outbox producer mode to the event bus.
+    """
+
+    help = """
+    Publish the events saved in the outbox by the "outbox" producer mode (see EVENT_BUS_PRODUCER_MODE) with the
+    configured event bus producer, in the order they were sent.
+
+    Example::
+
+        python3 manage.py relay_outbox --loop --interval 1
+    """
+
+    def add_arguments(self, parser):
+        """
+        Add arguments for the batch size, the handling of published events and looping.
+        """
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Maximum number of events published in a single database transaction'
+        )
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete the published events instead of marking them as published'
+        )
+        parser.add_argument(
+            '--flush-timeout',
+            type=float,
+            default=30.0,
+            help='Seconds to wait for the producer to deliver a batch before retrying it'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep relaying events until the command is interrupted'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when the outbox is empty or an event could not be published, with --loop'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Relay batches of events until the outbox is empty, or forever with --loop.
+        """
+        while True:
+            relayed, failed = relay_outbox_batch(
+                batch_size=options['batch_size'], delete=options['delete'], flush_timeout=options['flush_timeout'],
+            )
+            size, age = get_outbox_backlog()
+            logger.info(f"Relayed {relayed} outbox events, {size} left, the oldest sent {age:.1f} seconds ago")
+            if relayed < options['batch_size'] or failed:
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-18 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('topic', models.CharField(max_length=255)),
+                ('event_type', models.CharField(max_length=255)),
+                ('event_key_field', models.CharField(max_length=255)),
+                ('payload', models.BinaryField()),
+                ('schema_fingerprint', models.CharField(max_length=16)),
+                ('metadata', models.TextField()),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('published', models.DateTimeField(blank=True, db_index=True, null=True)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+"""
+Database models for openedx_events.
+"""
+from django.db import models
+
+
+class OutboxEvent(models.Model):
+    """
+    An event waiting in the transactional outbox to be published to the event bus.
+
+    Rows are written by the ``outbox`` producer mode in the transaction of the code sending the event, and
+    published in id order by the ``relay_outbox`` management command. See ADR 0015.
+
+    .. no_pii:
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    topic = models.CharField(max_length=255)
+    event_type = models.CharField(max_length=255)
+    event_key_field = models.CharField(max_length=255)
+    # Event data serialized with the Avro schema of the signal, along with the hex fingerprint and the JSON string of
+    # that schema, so that rows written before the schema changed are resolved against the schema they were written
+    # with. Rows without a schema string need it registered with register_writer_schema.
+    payload = models.BinaryField()
+    schema_fingerprint = models.CharField(max_length=16)
+    writer_schema = models.TextField(blank=True, default="")
+    # EventsMetadata serialized to JSON.
+    metadata = models.TextField()
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    published = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Set when the row couldn't be decoded, along with the error: the relay skips the row instead of retrying it
+    # forever. Clear ``failed`` to relay the row again once the cause is fixed.
+    failed = models.DateTimeField(null=True, blank=True, db_index=True)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        """
+        Rows are relayed in the order they were written.
+        """
+
+        ordering = ("id",)
+
+    def __str__(self):
+        """
+        Represent the event by its event type and topic.
+        """
+        return f"<OutboxEvent {self.id}: {self.event_type} to {self.topic}>"
@@ -0,0 +1,144 @@
+"""
+Map of the event type of each Open edX Event to the module and attribute defining its signal.
+
+Used to import signals on demand, and to load all signals without walking the package tree.
+Generated by the generate_signals_manifest management command, do not edit by hand.
+"""
+
+SIGNAL_MANIFEST = {
+    "org.openedx.analytics.tracking.event.emitted.v1": (
+        "openedx_events.analytics.signals", "TRACKING_EVENT_EMITTED",
+    ),
+    "org.openedx.content_authoring.content.object.tags.changed.v1": (
+        "openedx_events.content_authoring.signals", "CONTENT_OBJECT_TAGS_CHANGED",
+    ),
+    "org.openedx.content_authoring.content_library.created.v1": (
+        "openedx_events.content_authoring.signals", "CONTENT_LIBRARY_CREATED",
+    ),
+    "org.openedx.content_authoring.content_library.deleted.v1": (
+        "openedx_events.content_authoring.signals", "CONTENT_LIBRARY_DELETED",
+    ),
+    "org.openedx.content_authoring.content_library.updated.v1": (
+        "openedx_events.content_authoring.signals", "CONTENT_LIBRARY_UPDATED",
+    ),
+    "org.openedx.content_authoring.course.catalog_info.changed.v1": (
+        "openedx_events.content_authoring.signals", "COURSE_CATALOG_INFO_CHANGED",
+    ),
+    "org.openedx.content_authoring.course.certificate_config.changed.v1": (
+        "openedx_events.content_authoring.signals", "COURSE_CERTIFICATE_CONFIG_CHANGED",
+    ),
+    "org.openedx.content_authoring.course.certificate_config.deleted.v1": (
+        "openedx_events.content_authoring.signals", "COURSE_CERTIFICATE_CONFIG_DELETED",
+    ),
+    "org.openedx.content_authoring.course.created.v1": (
+        "openedx_events.content_authoring.signals", "COURSE_CREATED",
+    ),
+    "org.openedx.content_authoring.library_block.created.v1": (
+        "openedx_events.content_authoring.signals", "LIBRARY_BLOCK_CREATED",
+    ),
+    "org.openedx.content_authoring.library_block.deleted.v1": (
+        "openedx_events.content_authoring.signals", "LIBRARY_BLOCK_DELETED",
+    ),
+    "org.openedx.content_authoring.library_block.updated.v1": (
+        "openedx_events.content_authoring.signals", "LIBRARY_BLOCK_UPDATED",
+    ),
+    "org.openedx.content_authoring.xblock.created.v1": (
+        "openedx_events.content_authoring.signals", "XBLOCK_CREATED",
+    ),
+    "org.openedx.content_authoring.xblock.deleted.v1": (
+        "openedx_events.content_authoring.signals", "XBLOCK_DELETED",
+    ),
+    "org.openedx.content_authoring.xblock.duplicated.v1": (
+        "openedx_events.content_authoring.signals", "XBLOCK_DUPLICATED",
+    ),
+    "org.openedx.content_authoring.xblock.published.v1": (
+        "openedx_events.content_authoring.signals", "XBLOCK_PUBLISHED",
+    ),
+    "org.openedx.content_authoring.xblock.updated.v1": (
+        "openedx_events.content_authoring.signals", "XBLOCK_UPDATED",
+    ),
+    "org.openedx.enterprise.subsidy.redeemed.v1": (
+        "openedx_events.enterprise.signals", "SUBSIDY_REDEEMED",
+    ),
+    "org.openedx.enterprise.subsidy.redemption-reversed.v1": (
+        "openedx_events.enterprise.signals", "SUBSIDY_REDEMPTION_REVERSED",
+    ),
+    "org.openedx.learning.auth.session.login.completed.v1": (
+        "openedx_events.learning.signals", "SESSION_LOGIN_COMPLETED",
+    ),
+    "org.openedx.learning.certificate.changed.v1": (
+        "openedx_events.learning.signals", "CERTIFICATE_CHANGED",
+    ),
+    "org.openedx.learning.certificate.created.v1": (
+        "openedx_events.learning.signals", "CERTIFICATE_CREATED",
+    ),
+    "org.openedx.learning.certificate.revoked.v1": (
+        "openedx_events.learning.signals", "CERTIFICATE_REVOKED",
+    ),
+    "org.openedx.learning.cohort_membership.changed.v1": (
+        "openedx_events.learning.signals", "COHORT_MEMBERSHIP_CHANGED",
+    ),
+    "org.openedx.learning.course.enrollment.changed.v1": (
+        "openedx_events.learning.signals", "COURSE_ENROLLMENT_CHANGED",
+    ),
+    "org.openedx.learning.course.enrollment.created.v1": (
+        "openedx_events.learning.signals", "COURSE_ENROLLMENT_CREATED",
+    ),
+    "org.openedx.learning.course.notification.requested.v1": (
+        "openedx_events.learning.signals", "COURSE_NOTIFICATION_REQUESTED",
+    ),
+    "org.openedx.learning.course.persistent_grade_summary.changed.v1": (
+        "openedx_events.learning.signals", "PERSISTENT_GRADE_SUMMARY_CHANGED",
+    ),
+    "org.openedx.learning.course.unenrollment.completed.v1": (
+        "openedx_events.learning.signals", "COURSE_UNENROLLMENT_COMPLETED",
+    ),
+    "org.openedx.learning.discussions.configuration.changed.v1": (
+        "openedx_events.learning.signals", "COURSE_DISCUSSIONS_CHANGED",
+    ),
+    "org.openedx.learning.exam.attempt.errored.v1": (
+        "openedx_events.learning.signals", "EXAM_ATTEMPT_ERRORED",
+    ),
+    "org.openedx.learning.exam.attempt.rejected.v1": (
+        "openedx_events.learning.signals", "EXAM_ATTEMPT_REJECTED",
+    ),
+    "org.openedx.learning.exam.attempt.reset.v1": (
+        "openedx_events.learning.signals", "EXAM_ATTEMPT_RESET",
+    ),
+    "org.openedx.learning.exam.attempt.submitted.v1": (
+        "openedx_events.learning.signals", "EXAM_ATTEMPT_SUBMITTED",
+    ),
+    "org.openedx.learning.exam.attempt.verified.v1": (
+        "openedx_events.learning.signals", "EXAM_ATTEMPT_VERIFIED",
+    ),
+    "org.openedx.learning.ora.submission.created.v1": (
+        "openedx_events.learning.signals", "ORA_SUBMISSION_CREATED",
+    ),
+    "org.openedx.learning.program.certificate.awarded.v1": (
+        "openedx_events.learning.signals", "PROGRAM_CERTIFICATE_AWARDED",
+    ),
+    "org.openedx.learning.program.certificate.revoked.v1": (
+        "openedx_events.learning.signals", "PROGRAM_CERTIFICATE_REVOKED",
+    ),
+    "org.openedx.learning.response.created.v1": (
+        "openedx_events.learning.signals", "FORUM_RESPONSE_COMMENT_CREATED",
+    ),
+    "org.openedx.learning.student.registration.completed.v1": (
+        "openedx_events.learning.signals", "STUDENT_REGISTRATION_COMPLETED",
+    ),
+    "org.openedx.learning.thread.created.v1": (
+        "openedx_events.learning.signals", "FORUM_THREAD_CREATED",
+    ),
+    "org.openedx.learning.user.course_access_role.added.v1": (
+        "openedx_events.learning.signals", "COURSE_ACCESS_ROLE_ADDED",
+    ),
+    "org.openedx.learning.user.course_access_role.removed.v1": (
+        "openedx_events.learning.signals", "COURSE_ACCESS_ROLE_REMOVED",
+    ),
+    "org.openedx.learning.user.notification.requested.v1": (
+        "openedx_events.learning.signals", "USER_NOTIFICATION_REQUESTED",
+    ),
+    "org.openedx.learning.xblock.skill.verified.v1": (
+        "openedx_events.learning.signals", "XBLOCK_SKILL_VERIFIED",
+    ),
+}
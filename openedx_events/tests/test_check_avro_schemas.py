@@ -0,0 +1,44 @@
+"""Tests for check_avro_schemas."""
+import copy
+import json
+import tempfile
+from importlib import import_module
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from openedx_events.management.commands.check_avro_schemas import Command
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+
+
+class TestCheckAvroSchemasCommand(FreezeSignalCacheMixin, TestCase):
+    """
+    Tests for check_avro_schemas management command.
+    """
+
+    def test_stored_schemas_are_compatible(self):
+        with self.assertLogs("openedx_events.management.commands.check_avro_schemas", "INFO") as logs:
+            call_command(Command())
+        self.assertIn("passed the full compatibility check", logs.output[-1])
+
+    def test_incompatible_schema_fails(self):
+        root_path = import_module('openedx_events').__path__[0]
+        with tempfile.TemporaryDirectory() as schemas_dir:
+            for schema_path in Path(f"{root_path}/event_bus/avro/tests/schemas").glob("*.avsc"):
+                schema = json.loads(schema_path.read_text())
+                if schema["namespace"] == "org.openedx.learning.course.enrollment.changed.v1":
+                    schema = copy.deepcopy(schema)
+                    schema["fields"].append({"name": "removed_field", "type": "string"})
+                (Path(schemas_dir) / schema_path.name).write_text(json.dumps(schema))
+
+            call_command(Command(), compatibility="backward", schemas_dir=schemas_dir)
+            with self.assertLogs("openedx_events.management.commands.check_avro_schemas", "ERROR") as logs:
+                with self.assertRaises(CommandError):
+                    call_command(Command(), compatibility="forward", schemas_dir=schemas_dir)
+        self.assertEqual(logs.output, [
+            "ERROR:openedx_events.management.commands.check_avro_schemas:"
+            "org.openedx.learning.course.enrollment.changed.v1: "
+            "org+openedx+learning+course+enrollment+changed+v1_schema.avsc: "
+            "forward: removed_field: field is missing from the writer and has no default",
+        ])
@@ -1,12 +1,13 @@
 """ Tests for openedx_events.data module."""
 from datetime import datetime, timezone
+from unittest.mock import patch
 from uuid import UUID
 
 import ddt
 from django.test import TestCase
 from django.test.utils import override_settings
 
-from openedx_events.data import EventsMetadata
+from openedx_events.data import EventsMetadata, _get_sourcehost, _get_sourcelib
 
 
 @ddt.ddt
@@ -22,7 +23,8 @@ class TestEventsMetadata(TestCase):
             source='test_source',
             sourcehost='test_source_host',
             sourcelib=(1, 2, 3),
-            id=UUID('c45efb10-3556-11ee-9f19-7e694b1e500b')
+            id=UUID('c45efb10-3556-11ee-9f19-7e694b1e500b'),
+            minorversion=1,
         )
 
     def test_events_metadata_to_and_from_json(self):
@@ -46,3 +48,21 @@ class TestEventsMetadata(TestCase):
                 event_type='test_type'
             )
             self.assertEqual(metadata.source, expected_source)
+
+    @patch("openedx_events.data.socket")
+    @patch("openedx_events.data.openedx_events")
+    def test_events_metadata_process_fields_are_computed_once(self, events_package_mock, socket_mock):
+        events_package_mock.__version__ = "1.2.3"
+        socket_mock.gethostname.return_value = "edx.devstack.lms"
+        _get_sourcehost.cache_clear()
+        _get_sourcelib.cache_clear()
+        try:
+            EventsMetadata(event_type='test_type')
+            metadata = EventsMetadata(event_type='test_type')
+        finally:
+            _get_sourcehost.cache_clear()
+            _get_sourcelib.cache_clear()
+
+        self.assertEqual(metadata.sourcehost, "edx.devstack.lms")
+        self.assertEqual(metadata.sourcelib, (1, 2, 3))
+        socket_mock.gethostname.assert_called_once()
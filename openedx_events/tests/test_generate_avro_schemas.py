@@ -1,4 +1,5 @@
 """Tests for generate_avro_schemas."""
+import json
 import os
 from importlib import import_module
 from unittest.mock import call, mock_open, patch
@@ -85,3 +86,12 @@ class TestGenerateAvroCommand(FreezeSignalCacheMixin, TestCase):
             with patch("builtins.open", mock_open()):
                 call_command(Command(), signal.event_type)
         mock_makedirs.assert_called_once_with(TestGenerateAvroCommand.folder_path)
+
+    def test_generate_bundle(self):
+        signal = create_simple_signal({"key": str})
+        with patch("builtins.open", mock_open()) as mock_file:
+            call_command(Command(), signal.event_type, bundle="/tmp/bundle.json")
+            mock_file.assert_called_once_with("/tmp/bundle.json", "w")
+            bundle = json.loads(mock_file().write.call_args[0][0])
+        self.assertEqual(list(bundle["schemas"]), ["simple.signal"])
+        self.assertEqual(bundle["schemas"]["simple.signal"]["schema"]["namespace"], "simple.signal")
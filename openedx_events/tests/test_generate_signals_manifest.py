@@ -0,0 +1,27 @@
+"""Tests for generate_signals_manifest."""
+from importlib import import_module
+from unittest.mock import mock_open, patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from openedx_events.management.commands.generate_signals_manifest import Command
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+
+
+class TestGenerateSignalsManifestCommand(FreezeSignalCacheMixin, TestCase):
+    """
+    Tests for generate_signals_manifest management command.
+    """
+
+    def test_generate_manifest(self):
+        root_path = import_module('openedx_events').__path__[0]
+        with open(f"{root_path}/signals_manifest.py", encoding="utf-8") as manifest_file:
+            current_manifest = manifest_file.read()
+
+        with patch("builtins.open", mock_open()) as mock_file:
+            call_command(Command())
+
+        mock_file.assert_called_once_with(f"{root_path}/signals_manifest.py", "w")
+        # the manifest in the repository is up to date, so it's written unchanged
+        mock_file().write.assert_called_once_with(current_manifest)
@@ -0,0 +1,233 @@
+"""
+This file contains all test for the instrumentation.py file.
+"""
+from unittest.mock import Mock, patch
+
+import ddt
+from django.test import TestCase, override_settings
+
+from openedx_events.instrumentation import (
+    MonitoringMetricsSink,
+    ReceiverMetricsSink,
+    ReceiverStats,
+    _get_latency_budget,
+    get_receiver_stats,
+    record_receiver_call,
+    reset_receiver_stats,
+)
+from openedx_events.tests.utils import FreezeSignalCacheMixin
+from openedx_events.tooling import OpenEdxPublicSignal
+
+sink_calls = []
+slow_calls = []
+
+
+class FakeMetricsSink(ReceiverMetricsSink):
+    """
+    Metrics sink keeping the calls it records in sink_calls.
+    """
+
+    def record_receiver_call(self, event_type, receiver_path, duration_ms, error):
+        sink_calls.append((event_type, receiver_path, duration_ms, error))
+
+
+def slow_receiver_callback(event_type, receiver_path, duration_ms, budget_ms):
+    slow_calls.append((event_type, receiver_path, duration_ms, budget_ms))
+
+
+def ok_receiver(**kwargs):  # pylint: disable=unused-argument
+    return "success"
+
+
+def error_receiver(**kwargs):
+    raise ValueError("fake error")
+
+
+class CallableReceiver:
+    """
+    Receiver that is a callable object, without a __name__.
+    """
+
+    def __call__(self, **kwargs):
+        return "called"
+
+
+@ddt.ddt
+class TestReceiverStats(TestCase):
+    """
+    Tests for the receiver stats and how receiver calls are recorded.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.event_type = "org.openedx.learning.session.login.completed.v1"
+        reset_receiver_stats()
+        self.addCleanup(reset_receiver_stats)
+        sink_calls.clear()
+        slow_calls.clear()
+
+    def test_record(self):
+        stats = ReceiverStats()
+
+        stats.record(0.5, False, False)
+        stats.record(7, True, False)
+        stats.record(6000, False, True)
+
+        self.assertDictEqual(
+            stats.to_dict(),
+            {
+                "calls": 3,
+                "errors": 1,
+                "slow_calls": 1,
+                "total_ms": 6007.5,
+                "mean_ms": 2002.5,
+                "max_ms": 6000,
+                "histogram": {
+                    "<=1ms": 1, "<=5ms": 0, "<=10ms": 1, "<=25ms": 0, "<=50ms": 0, "<=100ms": 0, "<=250ms": 0,
+                    "<=500ms": 0, "<=1000ms": 0, "<=2500ms": 0, "<=5000ms": 0, ">5000ms": 1,
+                },
+            },
+        )
+
+    @ddt.data(
+        (None, None),
+        (100, 100),
+        ({"*": 100, "org.openedx.learning.session.login.completed.v1": 20}, 20),
+        ({"*": 100}, 100),
+        ({"org.openedx.learning.course.enrollment.created.v1": 20}, None),
+    )
+    @ddt.unpack
+    def test_latency_budget(self, setting, expected_budget):
+        with override_settings(EVENTS_RECEIVER_LATENCY_BUDGET=setting):
+            self.assertEqual(_get_latency_budget(self.event_type), expected_budget)
+
+    @override_settings(
+        EVENTS_RECEIVER_LATENCY_BUDGET=10,
+        EVENTS_RECEIVER_SLOW_CALLBACK="openedx_events.tests.test_instrumentation.slow_receiver_callback",
+        EVENTS_RECEIVER_METRICS_SINK="openedx_events.tests.test_instrumentation.FakeMetricsSink",
+    )
+    def test_record_receiver_call(self):
+        error = ValueError("fake error")
+
+        record_receiver_call(self.event_type, ok_receiver, 2)
+        record_receiver_call(self.event_type, ok_receiver, 20)
+        record_receiver_call(self.event_type, error_receiver, 4, error)
+
+        receiver_path = "openedx_events.tests.test_instrumentation.ok_receiver"
+        error_receiver_path = "openedx_events.tests.test_instrumentation.error_receiver"
+        stats = get_receiver_stats()[self.event_type]
+        self.assertEqual(
+            (stats[receiver_path]["calls"], stats[receiver_path]["errors"], stats[receiver_path]["slow_calls"]),
+            (2, 0, 1),
+        )
+        self.assertEqual(
+            (stats[error_receiver_path]["calls"], stats[error_receiver_path]["errors"]),
+            (1, 1),
+        )
+        self.assertListEqual(slow_calls, [(self.event_type, receiver_path, 20, 10)])
+        self.assertListEqual(
+            sink_calls,
+            [
+                (self.event_type, receiver_path, 2, None),
+                (self.event_type, receiver_path, 20, None),
+                (self.event_type, error_receiver_path, 4, error),
+            ],
+        )
+
+    @override_settings(EVENTS_RECEIVER_LATENCY_BUDGET=10)
+    def test_slow_receiver_warning(self):
+        with self.assertLogs("openedx_events.instrumentation", "WARNING") as logs:
+            record_receiver_call(self.event_type, ok_receiver, 12.5)
+
+        self.assertListEqual(
+            logs.output,
+            [
+                "WARNING:openedx_events.instrumentation:Receiver openedx_events.tests.test_instrumentation.ok_receiver"
+                " of the Open edX Event <org.openedx.learning.session.login.completed.v1> took 12.5 ms, over its"
+                " budget of 10 ms"
+            ],
+        )
+
+    @override_settings(EVENTS_RECEIVER_METRICS_SINK="openedx_events.tests.test_instrumentation.FakeMetricsSink")
+    @patch.object(FakeMetricsSink, "record_receiver_call", side_effect=Exception("sink down"))
+    def test_sink_error(self, _record_mock):
+        with self.assertLogs("openedx_events.instrumentation", "ERROR"):
+            record_receiver_call(self.event_type, ok_receiver, 2)
+
+        self.assertEqual(get_receiver_stats()[self.event_type][f"{__name__}.ok_receiver"]["calls"], 1)
+
+    @patch("openedx_events.instrumentation._callable_path", side_effect=AttributeError("no path"))
+    def test_recording_error(self, _path_mock):
+        with self.assertLogs("openedx_events.instrumentation", "ERROR"):
+            record_receiver_call(self.event_type, ok_receiver, 2)
+
+        self.assertDictEqual(get_receiver_stats(), {})
+
+    @patch("openedx_events.instrumentation.accumulate")
+    def test_monitoring_metrics_sink(self, accumulate_mock):
+        sink = MonitoringMetricsSink()
+
+        sink.record_receiver_call(self.event_type, "path.receiver", 2.5, None)
+        sink.record_receiver_call(self.event_type, "path.receiver", 1.5, ValueError())
+
+        self.assertListEqual(
+            [call.args for call in accumulate_mock.call_args_list],
+            [
+                ("openedx_events.receivers_ms", 2.5),
+                ("openedx_events.receivers_ms", 1.5),
+                ("openedx_events.receiver_errors", 1),
+            ],
+        )
+
+
+@override_settings(EVENTS_RECEIVER_INSTRUMENTATION_ENABLED=True)
+class TestInstrumentedSendEvent(FreezeSignalCacheMixin, TestCase):
+    """
+    Tests for sending events with instrumented receivers.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.event_type = "org.openedx.learning.session.login.completed.v1"
+        self.public_signal = OpenEdxPublicSignal(event_type=self.event_type, data={"user": Mock})
+        reset_receiver_stats()
+        self.addCleanup(reset_receiver_stats)
+        for receiver in (ok_receiver, error_receiver):
+            self.public_signal.connect(receiver)
+            self.addCleanup(self.public_signal.disconnect, receiver)
+
+    def test_send_event_robust(self):
+        with self.assertLogs("openedx_events.tooling", "ERROR"):
+            responses = self.public_signal.send_event(user=Mock())
+
+        self.assertEqual(responses[0], (ok_receiver, "success"))
+        self.assertEqual(responses[1][0], error_receiver)
+        self.assertIsInstance(responses[1][1], ValueError)
+        stats = get_receiver_stats()[self.event_type]
+        self.assertEqual(stats[f"{__name__}.ok_receiver"]["calls"], 1)
+        self.assertEqual(stats[f"{__name__}.error_receiver"]["errors"], 1)
+
+    def test_send_event_discarding_responses(self):
+        with self.assertLogs("openedx_events.tooling", "ERROR"):
+            self.assertIsNone(self.public_signal.send_event(user=Mock(), discard_responses=True))
+
+        self.assertEqual(len(get_receiver_stats()[self.event_type]), 2)
+
+    def test_send_event_to_callable_object(self):
+        callable_receiver = CallableReceiver()
+        self.public_signal.connect(callable_receiver)
+        self.addCleanup(self.public_signal.disconnect, callable_receiver)
+
+        with self.assertLogs("openedx_events.tooling", "ERROR"):
+            responses = self.public_signal.send_event(user=Mock())
+
+        self.assertIn((callable_receiver, "called"), responses)
+        stats = get_receiver_stats()[self.event_type]
+        self.assertEqual(stats[repr(CallableReceiver)]["calls"], 1)
+
+    def test_send_event_not_robust(self):
+        with self.assertRaises(ValueError):
+            self.public_signal.send_event(user=Mock(), send_robust=False)
+
+        stats = get_receiver_stats()[self.event_type]
+        self.assertEqual(stats[f"{__name__}.error_receiver"]["errors"], 1)
@@ -11,6 +11,7 @@ from django.test import TestCase, override_settings
 from openedx_events.content_authoring.data import XBlockData
 from openedx_events.content_authoring.signals import XBLOCK_DELETED, XBLOCK_PUBLISHED
 from openedx_events.exceptions import ProducerConfigurationError
+from openedx_events.models import OutboxEvent
 
 
 @ddt.ddt
@@ -40,19 +41,25 @@ class ProducerConfiguratonTest(TestCase):
         mock_producer.return_value = mock_send
         # XBLOCK_PUBLISHED has three configurations where 2 configurations have set enabled as True.
         XBLOCK_PUBLISHED.send_event(xblock_info=self.xblock_info)
-        mock_send.send.assert_called()
-        mock_send.send.call_count = 2
+        mock_send.send_encoded.assert_called()
+        mock_send.send_encoded.call_count = 2
         expected_call_args = [
             {'topic': 'enabled_topic_a', 'event_key_field': 'xblock_info.usage_key'},
             {'topic': 'enabled_topic_b', 'event_key_field': 'xblock_info.usage_key'}
         ]
 
         # check that call_args_list only consists of enabled topics.
-        call_args = mock_send.send.call_args_list[0][1]
+        call_args = mock_send.send_encoded.call_args_list[0][1]
         self.assertEqual(call_args, {**call_args, **expected_call_args[0]})
-        call_args = mock_send.send.call_args_list[1][1]
+        call_args = mock_send.send_encoded.call_args_list[1][1]
         self.assertEqual(call_args, {**call_args, **expected_call_args[1]})
 
+        # both topics share the same encoded event, so that it is serialized once
+        self.assertIs(
+            mock_send.send_encoded.call_args_list[0][1]["encoded_event"],
+            mock_send.send_encoded.call_args_list[1][1]["encoded_event"],
+        )
+
     @patch("openedx_events.apps.logger")
     @patch('openedx_events.apps.get_producer')
     def test_send_events_with_custom_metadata_not_replayed_by_handler(self, mock_producer, mock_logger):
@@ -70,7 +77,7 @@ class ProducerConfiguratonTest(TestCase):
 
         XBLOCK_PUBLISHED.send_event_with_custom_metadata(metadata, xblock_info=self.xblock_info)
 
-        mock_send.send.assert_not_called()
+        mock_send.send_encoded.assert_not_called()
         mock_logger.debug.assert_called_once_with(
             "Declining to send signal to the Event Bus since that's "
             f"where it was sent from: {XBLOCK_PUBLISHED.event_type} (preventing recursion)"
@@ -89,7 +96,7 @@ class ProducerConfiguratonTest(TestCase):
         mock_producer.return_value = mock_send
         XBLOCK_PUBLISHED.send_event(xblock_info=self.xblock_info)
         mock_producer.assert_not_called()
-        mock_send.send.assert_not_called()
+        mock_send.send_encoded.assert_not_called()
 
     def test_configuration_is_validated(self):
         """
@@ -143,7 +150,99 @@ class ProducerConfiguratonTest(TestCase):
         mock_send = Mock()
         mock_producer.return_value = mock_send
         XBLOCK_DELETED.send_event(xblock_info=self.xblock_info)
-        mock_send.send.assert_called_once()
+        mock_send.send_encoded.assert_called_once()
+
+        call_args = mock_send.send_encoded.call_args_list[0][1]
+        self.assertIn("xblock_info", call_args["encoded_event"].event_data)
+
+    @patch('openedx_events.apps.get_producer')
+    @patch('openedx_events.apps.get_background_producer')
+    def test_background_producer(self, mock_background_producer, mock_producer):
+        """
+        Check whether events are put in the background producer queue when it is configured.
+        """
+        XBLOCK_DELETED.send_event(xblock_info=self.xblock_info)
+
+        mock_background_producer.return_value.send_encoded.assert_called_once()
+        mock_producer.assert_not_called()
+
+    @patch('openedx_events.apps.get_producer')
+    @patch('openedx_events.event_bus.on_commit.get_producer')
+    def test_on_commit_mode(self, mock_on_commit_producer, mock_producer):
+        """
+        Check whether events are only published once the transaction commits in the on-commit mode.
+        """
+        with override_settings(EVENT_BUS_PRODUCER_MODE="on-commit"):
+            with self.captureOnCommitCallbacks() as callbacks:
+                XBLOCK_PUBLISHED.send_event(xblock_info=self.xblock_info)
+                XBLOCK_PUBLISHED.send_event(xblock_info=self.xblock_info)
+                mock_on_commit_producer.return_value.send_batch.assert_not_called()
+
+        # both events and both topics are published by a single callback, in a single batch
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        mock_on_commit_producer.return_value.send_batch.assert_called_once()
+        self.assertEqual(len(mock_on_commit_producer.return_value.send_batch.call_args.args[0]), 4)
+        mock_producer.assert_not_called()
+
+    @patch('openedx_events.apps.get_producer')
+    def test_outbox_mode(self, mock_producer):
+        """
+        Check whether events are saved to the outbox in the outbox mode.
+        """
+        with override_settings(EVENT_BUS_PRODUCER_MODE="outbox"):
+            XBLOCK_PUBLISHED.send_event(xblock_info=self.xblock_info)
+
+        self.assertEqual(
+            sorted(OutboxEvent.objects.values_list("topic", flat=True)), ["enabled_topic_a", "enabled_topic_b"]
+        )
+        mock_producer.assert_not_called()
+
+    def test_event_key_field_is_validated(self):
+        """
+        Check whether event key fields are checked against the data of the signal before connecting handlers.
+        """
+        with override_settings(
+            EVENT_BUS_PRODUCER_CONFIG={
+                "org.openedx.content_authoring.xblock.deleted.v1":
+                {
+                    "some": {"enabled": True, "event_key_field": "xblock_info.usage_key"},
+                    "other": {"enabled": True, "event_key_field": "xblock_info.usage"},
+                }
+            }
+        ):
+            with pytest.raises(
+                ProducerConfigurationError,
+                match="Invalid 'event_key_field' for topic 'other': XBlockData of 'xblock_info.usage' has no attribute",
+            ):
+                apps.get_app_config("openedx_events").ready()
+
+    def test_mode_is_validated(self):
+        """
+        Check whether the producer modes are validated before connecting handlers.
+        """
+        with override_settings(EVENT_BUS_PRODUCER_MODE="later"):
+            with pytest.raises(ProducerConfigurationError, match="'EVENT_BUS_PRODUCER_MODE' should be one of"):
+                apps.get_app_config("openedx_events").ready()
+
+        with override_settings(
+            EVENT_BUS_PRODUCER_CONFIG={
+                "org.openedx.content_authoring.xblock.deleted.v1":
+                {
+                    "some": {"enabled": True, "event_key_field": "some", "mode": "later"}
+                }
+            }
+        ):
+            with pytest.raises(ProducerConfigurationError, match="Expected 'mode' to be one of"):
+                apps.get_app_config("openedx_events").ready()
 
-        call_args = mock_send.send.call_args_list[0][1]
-        self.assertIn("xblock_info", call_args["event_data"])
+        with override_settings(
+            EVENT_BUS_PRODUCER_CONFIG={
+                "org.openedx.learning.user.notification.requested.v1":
+                {
+                    "some": {"enabled": True, "event_key_field": "some", "mode": "outbox"}
+                }
+            }
+        ):
+            with pytest.raises(ProducerConfigurationError, match="can't be published with the outbox mode"):
+                apps.get_app_config("openedx_events").ready()
@@ -0,0 +1,56 @@
+"""Tests for relay_outbox and purge_outbox."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from openedx_events.event_bus.outbox import save_to_outbox
+from openedx_events.management.commands.purge_outbox import Command as PurgeCommand
+from openedx_events.management.commands.relay_outbox import Command as RelayCommand
+from openedx_events.models import OutboxEvent
+from openedx_events.tests.utils import login_event_message
+
+
+@patch("openedx_events.event_bus.outbox.get_producer", **{"return_value.supports_batches": False})
+class TestOutboxCommands(TestCase):
+    """
+    Tests for the outbox management commands.
+    """
+
+    def test_relay_until_empty(self, mock_producer):
+        for number in range(5):
+            save_to_outbox(**login_event_message(number))
+
+        with self.assertLogs("openedx_events.management.commands.relay_outbox", "INFO") as logs:
+            call_command(RelayCommand(), batch_size=2)
+
+        self.assertEqual(mock_producer.return_value.send_encoded.call_count, 5)
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn("Relayed 1 outbox events, 0 left", logs.output[-1])
+        self.assertFalse(OutboxEvent.objects.filter(published__isnull=True).exists())
+
+    @patch("openedx_events.management.commands.relay_outbox.time.sleep", side_effect=KeyboardInterrupt)
+    def test_relay_loop_waits_when_empty(self, mock_sleep, mock_producer):
+        save_to_outbox(**login_event_message(1))
+
+        with self.assertRaises(KeyboardInterrupt):
+            call_command(RelayCommand(), loop=True, interval=5, delete=True)
+
+        mock_sleep.assert_called_once_with(5)
+        mock_producer.return_value.send_encoded.assert_called_once()
+        self.assertFalse(OutboxEvent.objects.exists())
+
+    def test_purge(self, mock_producer):  # pylint: disable=unused-argument
+        save_to_outbox(**login_event_message(1))
+        save_to_outbox(**login_event_message(2))
+        OutboxEvent.objects.filter(id=OutboxEvent.objects.first().id).update(
+            published=timezone.now() - timedelta(days=3)
+        )
+
+        call_command(PurgeCommand())
+        self.assertEqual(OutboxEvent.objects.count(), 2)
+
+        call_command(PurgeCommand(), days=2)
+        self.assertEqual(OutboxEvent.objects.count(), 1)
@@ -4,21 +4,31 @@ This file contains all test for the tooling.py file.
 Classes:
     EventsToolingTest: Test events tooling.
 """
+import asyncio
 import datetime
 import sys
 from contextlib import contextmanager
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID, uuid1
 
 import attr
 import ddt
 import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.dispatch import Signal
 from django.test import TestCase, override_settings
 
 from openedx_events.data import EventsMetadata
 from openedx_events.exceptions import SenderValidationError
+from openedx_events.signals_manifest import SIGNAL_MANIFEST
 from openedx_events.tests.utils import FreezeSignalCacheMixin
-from openedx_events.tooling import OpenEdxPublicSignal, _process_all_signals_modules, load_all_signals
+from openedx_events.tooling import (
+    OpenEdxPublicSignal,
+    _EventTypePatternIndex,
+    _process_all_signals_modules,
+    build_signals_manifest,
+    load_all_signals,
+)
 
 
 @contextmanager
@@ -36,6 +46,24 @@ def receivers_attached(signal, receivers):
             signal.disconnect(receiver)
 
 
+class CallableReceiver:
+    """
+    Receiver that is a callable object, without a __name__.
+    """
+
+    def __call__(self, **kwargs):
+        return "called"
+
+
+class RaisingCallableReceiver:
+    """
+    Receiver that is a callable object, without a __name__, failing when called.
+    """
+
+    def __call__(self, **kwargs):
+        raise ValueError("failed")
+
+
 @ddt.ddt
 class OpenEdxPublicSignalTestCache(FreezeSignalCacheMixin, TestCase):
     """
@@ -175,7 +203,8 @@ class OpenEdxPublicSignalTestCache(FreezeSignalCacheMixin, TestCase):
         fake_metadata.return_value = expected_metadata
         self.public_signal.allow_send_event_failure()
 
-        self.public_signal.send_event(user=self.user_mock)
+        with receivers_attached(self.public_signal, [self.ok_receiver]):
+            self.public_signal.send_event(user=self.user_mock)
 
         send_mock.assert_called_once_with(
             sender=None,
@@ -225,7 +254,8 @@ class OpenEdxPublicSignalTestCache(FreezeSignalCacheMixin, TestCase):
         expected_time = datetime.datetime.now(datetime.timezone.utc)
         fake_metadata.return_value = expected_metadata
 
-        self.public_signal.send_event(user=self.user_mock, time=expected_time)
+        with receivers_attached(self.public_signal, [self.ok_receiver]):
+            self.public_signal.send_event(user=self.user_mock, time=expected_time)
 
         # generate_signal_metadata is fully tested elsewhere
         fake_metadata.assert_called_once_with(time=expected_time)
@@ -289,6 +319,193 @@ class OpenEdxPublicSignalTestCache(FreezeSignalCacheMixin, TestCase):
         with self.assertRaisesMessage(SenderValidationError, exception_message):
             self.public_signal.send_event(**send_arguments)
 
+    @patch("openedx_events.tooling.Signal.send_robust", return_value=[])
+    def test_skip_consumer_send_validation(self, send_robust_mock):
+        """
+        This method tests that validation of events sent by the event bus
+        consumer can be skipped with a setting.
+
+        Expected behavior:
+            Invalid arguments sent with custom metadata are only rejected
+            while EVENT_BUS_SKIP_CONSUMER_SEND_VALIDATION is not set, and
+            events sent by the application are always validated.
+        """
+        metadata = self.public_signal.generate_signal_metadata()
+
+        with self.assertRaises(SenderValidationError):
+            self.public_signal.send_event_with_custom_metadata(metadata, student=Mock())
+
+        with override_settings(EVENT_BUS_SKIP_CONSUMER_SEND_VALIDATION=True):
+            self.public_signal.send_event_with_custom_metadata(metadata, student=Mock())
+            with self.assertRaises(SenderValidationError):
+                self.public_signal.send_event(student=Mock())
+            send_robust_mock.assert_called_once()
+
+    @ddt.data(
+        ("off", False, False),
+        ("all", False, True),
+        ({"mode": "errors"}, False, False),
+        ({"mode": "errors"}, True, True),
+        ({"sample_rate": 10}, False, False),
+        ({"mode": "all", "sample_rate": 60}, False, True),
+    )
+    @ddt.unpack
+    @patch("openedx_events.tooling.random.random", return_value=0.5)
+    @patch("openedx_events.tooling.log", autospec=True)
+    @patch("openedx_events.tooling.format_responses", autospec=True, return_value="fake-output")
+    def test_response_logging_configuration(
+        self, configuration, with_error, expected_log, format_responses_mock, log_mock, _random_mock
+    ):
+        """
+        This method tests that the responses of the receivers are logged as
+        configured for the event type.
+
+        Expected behavior:
+            Responses are only formatted and logged when the configured mode
+            and sample rate allow it.
+        """
+        receivers = [self.ok_receiver, self.error_receiver] if with_error else [self.ok_receiver]
+
+        with override_settings(EVENTS_RESPONSE_LOGGING={self.event_type: configuration}):
+            with receivers_attached(self.public_signal, receivers):
+                responses = self.public_signal.send_event(user=self.user_mock)
+
+        self.assertEqual(len(responses), len(receivers))
+        self.assertEqual(format_responses_mock.called, expected_log)
+        self.assertEqual(log_mock.info.called, expected_log)
+
+    @patch("openedx_events.tooling.log.isEnabledFor", return_value=False)
+    @patch("openedx_events.tooling.format_responses", autospec=True)
+    def test_response_logging_is_lazy(self, format_responses_mock, _is_enabled_for_mock):
+        """
+        This method tests that the responses are not formatted when INFO
+        messages are not logged.
+
+        Expected behavior:
+            format_responses is not called.
+        """
+        with receivers_attached(self.public_signal, [self.ok_receiver]):
+            self.public_signal.send_event(user=self.user_mock)
+
+        format_responses_mock.assert_not_called()
+
+    @override_settings(EVENTS_RESPONSE_LOGGING={"*": {"compact": True}})
+    def test_compact_response_logging(self):
+        """
+        This method tests the compact form of the response logging.
+
+        Expected behavior:
+            A single line with the outcome of each receiver is logged.
+        """
+        self.ok_receiver.__name__ = "ok_receiver"
+
+        with self.assertLogs("openedx_events.tooling", "INFO") as logs:
+            with receivers_attached(self.public_signal, [self.ok_receiver, self.error_receiver]):
+                self.public_signal.send_event(user=self.user_mock)
+
+        self.assertIn(
+            "INFO:openedx_events.tooling:"
+            "Responses of the Open edX Event <org.openedx.learning.session.login.completed.v1>: "
+            "unittest.mock.ok_receiver=ok, openedx_events.tests.test_tooling.error_receiver=Exception",
+            logs.output,
+        )
+
+    @override_settings(EVENTS_RESPONSE_LOGGING={"*": {"compact": True}})
+    def test_compact_response_logging_of_callable_objects(self):
+        """
+        This method tests the compact response logging of a receiver that is a callable object.
+
+        Expected behavior:
+            The receiver is represented by its type.
+        """
+        callable_receiver = CallableReceiver()
+
+        with self.assertLogs("openedx_events.tooling", "INFO") as logs:
+            with receivers_attached(self.public_signal, [callable_receiver]):
+                self.public_signal.send_event(user=self.user_mock)
+
+        self.assertIn(
+            "INFO:openedx_events.tooling:"
+            "Responses of the Open edX Event <org.openedx.learning.session.login.completed.v1>: "
+            "<class 'openedx_events.tests.test_tooling.CallableReceiver'>=ok",
+            logs.output,
+        )
+
+    @ddt.data(
+        "sometimes",
+        {"sample_rate": "10"},
+        {"sample_rate": 150},
+        {"sample_rate": True},
+        {"compact": "yes"},
+    )
+    def test_invalid_response_logging_configuration(self, configuration):
+        """
+        This method tests that invalid response logging configurations are rejected.
+
+        Expected behavior:
+            ImproperlyConfigured is raised.
+        """
+        with override_settings(EVENTS_RESPONSE_LOGGING={"*": configuration}):
+            with receivers_attached(self.public_signal, [self.ok_receiver]):
+                with self.assertRaises(ImproperlyConfigured):
+                    self.public_signal.send_event(user=self.user_mock)
+
+    @patch("openedx_events.tooling.format_responses", autospec=True)
+    def test_send_event_discarding_responses(self, format_responses_mock):
+        """
+        This method tests sending an event whose responses are discarded.
+
+        Expected behavior:
+            All receivers are called, errors are logged but not raised, and no
+            responses are formatted or returned.
+        """
+        with self.assertLogs("openedx_events.tooling", "ERROR") as logs:
+            with receivers_attached(self.public_signal, [self.error_receiver, self.ok_receiver]):
+                result = self.public_signal.send_event(user=self.user_mock, discard_responses=True)
+
+        self.assertIsNone(result)
+        self.ok_receiver.assert_called_once()
+        format_responses_mock.assert_not_called()
+        self.assertIn("Error calling", logs.output[0])
+
+        self.public_signal.allow_send_event_failure()
+        with receivers_attached(self.public_signal, [self.error_receiver]):
+            with self.assertRaises(Exception):
+                self.public_signal.send_event(user=self.user_mock, discard_responses=True)
+        # Without receivers, there's nothing to call
+        self.assertIsNone(self.public_signal.send_event(user=self.user_mock, discard_responses=True))
+
+    @ddt.data(False, True)
+    def test_send_event_discarding_errors_of_callable_objects(self, instrumented):
+        """
+        This method tests that errors of callable-object receivers are logged when responses are discarded.
+
+        Expected behavior:
+            The error is logged with the class of the receiver, and the other receivers are called.
+        """
+        with override_settings(EVENTS_RECEIVER_INSTRUMENTATION_ENABLED=instrumented), \
+                self.assertLogs("openedx_events.tooling", "ERROR") as logs, \
+                receivers_attached(self.public_signal, [RaisingCallableReceiver(), self.ok_receiver]):
+            self.assertIsNone(self.public_signal.send_event(user=self.user_mock, discard_responses=True))
+
+        self.ok_receiver.assert_called_once()
+        self.assertIn(f"Error calling {RaisingCallableReceiver!r}", logs.output[0])
+
+    @patch("openedx_events.tooling.OpenEdxPublicSignal.generate_signal_metadata")
+    def test_send_event_without_receivers(self, fake_metadata):
+        """
+        This method tests sending an event that has no receivers.
+
+        Expected behavior:
+            The arguments are validated, but no metadata is generated.
+        """
+        self.assertEqual(self.public_signal.send_event(user=self.user_mock), [])
+        self.assertIsNone(self.public_signal.send_event(user=self.user_mock, discard_responses=True))
+        with self.assertRaises(SenderValidationError):
+            self.public_signal.send_event(student=self.user_mock)
+
+        fake_metadata.assert_not_called()
+
     def test_send_event_with_django(self):
         """
         This method tests sending an event using the `send` built-in Django
@@ -333,6 +550,174 @@ class OpenEdxPublicSignalTestCache(FreezeSignalCacheMixin, TestCase):
         self.assertListEqual([], result)
 
 
+class TestAsyncSendEvent(FreezeSignalCacheMixin, TestCase):
+    """
+    Test cases for sending events from async code.
+    """
+
+    def setUp(self):
+        """
+        Setup common conditions for every test case.
+        """
+        super().setUp()
+        self.event_type = "org.openedx.learning.session.login.completed.v1"
+        self.public_signal = OpenEdxPublicSignal(event_type=self.event_type, data={"user": Mock})
+        self.sync_receiver = Mock(return_value="sync")
+
+    async def test_async_receivers_run_concurrently(self):
+        """
+        This method tests that async receivers overlap, and sync receivers are
+        called as well.
+
+        Expected behavior:
+            The first async receiver can wait for the second one, and the
+            responses of sync receivers come first.
+        """
+        second_receiver_called = asyncio.Event()
+
+        async def first_receiver(**kwargs):  # pylint: disable=unused-argument
+            await asyncio.wait_for(second_receiver_called.wait(), timeout=5)
+            return "first"
+
+        async def second_receiver(**kwargs):  # pylint: disable=unused-argument
+            second_receiver_called.set()
+            return "second"
+
+        with receivers_attached(self.public_signal, [first_receiver, self.sync_receiver, second_receiver]):
+            responses = await self.public_signal.asend_event(user=Mock())
+
+        self.assertListEqual(
+            responses,
+            [(self.sync_receiver, "sync"), (first_receiver, "first"), (second_receiver, "second")],
+        )
+        self.assertIsInstance(self.sync_receiver.call_args.kwargs["metadata"], EventsMetadata)
+
+    async def test_asend_event_robust(self):
+        """
+        This method tests that exceptions raised by receivers are returned
+        when sending robustly, and raised otherwise.
+
+        Expected behavior:
+            The exception is in the responses, then raised.
+        """
+        error = ValueError("fake error")
+
+        async def error_receiver(**kwargs):
+            raise error
+
+        with receivers_attached(self.public_signal, [error_receiver]):
+            with self.assertLogs("openedx_events.tooling", "ERROR"):
+                responses = await self.public_signal.asend_event(user=Mock())
+            with self.assertRaises(ValueError):
+                await self.public_signal.asend_event(user=Mock(), send_robust=False)
+
+        self.assertListEqual(responses, [(error_receiver, error)])
+
+    async def test_asend_event_with_custom_metadata(self):
+        """
+        This method tests sending an event with custom metadata from async code.
+
+        Expected behavior:
+            Receivers get the metadata, and invalid arguments are rejected.
+        """
+        metadata = self.public_signal.generate_signal_metadata()
+
+        with receivers_attached(self.public_signal, [self.sync_receiver]):
+            await self.public_signal.asend_event_with_custom_metadata(metadata, user=Mock())
+            with self.assertRaises(SenderValidationError):
+                await self.public_signal.asend_event_with_custom_metadata(metadata, student=Mock())
+
+        self.assertEqual(self.sync_receiver.call_args.kwargs["metadata"], metadata)
+        self.assertTrue(self.sync_receiver.call_args.kwargs["from_event_bus"])
+
+    async def test_asend_event_uses_native_asend(self):
+        """
+        This method tests that Django's asend_robust and asend are used when they exist (Django 5.0+).
+
+        Expected behavior:
+            The responses of Django's methods are returned, and logged when sending robustly.
+        """
+        responses = [(self.sync_receiver, "sync")]
+        asend_robust = AsyncMock(return_value=responses)
+        asend = AsyncMock(return_value=responses)
+
+        with patch.object(Signal, "asend_robust", asend_robust, create=True), \
+                patch.object(Signal, "asend", asend, create=True):
+            with receivers_attached(self.public_signal, [self.sync_receiver]):
+                self.assertListEqual(await self.public_signal.asend_event(user=Mock()), responses)
+                self.assertListEqual(await self.public_signal.asend_event(user=Mock(), send_robust=False), responses)
+
+        asend_robust.assert_awaited_once()
+        asend.assert_awaited_once()
+        self.sync_receiver.assert_not_called()
+
+    async def test_asend_event_without_receivers(self):
+        """
+        This method tests sending an event without receivers from async code.
+
+        Expected behavior:
+            Arguments are validated, and no responses are returned.
+        """
+        self.assertListEqual(await self.public_signal.asend_event(user=Mock()), [])
+        with self.assertRaises(SenderValidationError):
+            await self.public_signal.asend_event(student=Mock())
+
+
+@ddt.ddt
+class TestLiveReceivers(FreezeSignalCacheMixin, TestCase):
+    """
+    Test cases for reading the receivers connected to a signal on all supported Django versions.
+    """
+
+    def setUp(self):
+        """
+        Setup common conditions for every test case.
+        """
+        super().setUp()
+        self.public_signal = OpenEdxPublicSignal(
+            event_type="org.openedx.learning.session.login.completed.v1", data={"user": Mock},
+        )
+        self.sync_receiver = Mock(return_value="sync")
+        self.sync_receiver.__name__ = "sync_receiver"
+
+        async def async_receiver(**kwargs):  # pylint: disable=unused-argument
+            return "async"
+        self.async_receiver = async_receiver
+
+    def test_django_4_live_receivers(self):
+        """
+        This method tests that a single list of receivers is split into sync and async receivers.
+        """
+        with receivers_attached(self.public_signal, [self.async_receiver, self.sync_receiver]):
+            self.assertEqual(
+                self.public_signal._get_live_receivers(),  # pylint: disable=protected-access
+                ([self.sync_receiver], [self.async_receiver]),
+            )
+
+    @ddt.data(False, True)
+    def test_django_5_live_receivers(self, instrumented):
+        """
+        This method tests sending events when receivers are returned as a tuple of sync and async receivers.
+
+        Expected behavior:
+            Sync receivers are called first, then async receivers are run to completion.
+        """
+        live_receivers = ([self.sync_receiver], [self.async_receiver])
+
+        with override_settings(EVENTS_RECEIVER_INSTRUMENTATION_ENABLED=instrumented), \
+                receivers_attached(self.public_signal, [self.sync_receiver, self.async_receiver]), \
+                patch.object(OpenEdxPublicSignal, "_live_receivers", return_value=live_receivers):
+            self.assertIsNone(self.public_signal.send_event(user=Mock(), discard_responses=True))
+            if instrumented:
+                # otherwise the responses are collected by Django's send_robust
+                self.assertListEqual(
+                    self.public_signal.send_event(user=Mock()),
+                    [(self.sync_receiver, "sync"), (self.async_receiver, "async")],
+                )
+
+        self.assertEqual(self.sync_receiver.call_count, 2 if instrumented else 1)
+
+
 class TestLoadAllSignals(FreezeSignalCacheMixin, TestCase):
     """ Tests for the load_all_signals method"""
     def setUp(self):
@@ -368,16 +753,125 @@ class TestLoadAllSignals(FreezeSignalCacheMixin, TestCase):
         OpenEdxPublicSignal._mapping = {}  # pylint: disable=protected-access
         OpenEdxPublicSignal.instances = []
         with pytest.raises(KeyError):
-            OpenEdxPublicSignal.get_signal_by_type('org.openedx.content_authoring.course.catalog_info.changed.v1')
-        with pytest.raises(KeyError):
-            OpenEdxPublicSignal.get_signal_by_type('org.openedx.learning.course.enrollment.created.v1')
+            OpenEdxPublicSignal.get_signal_by_type('xxx')
 
-        load_all_signals()
+        # signals are imported on demand, one module at a time
         assert isinstance(
             OpenEdxPublicSignal.get_signal_by_type('org.openedx.content_authoring.course.catalog_info.changed.v1'),
             OpenEdxPublicSignal
         )
+        assert 'openedx_events.content_authoring.signals' in sys.modules
+        assert 'openedx_events.learning.signals' not in sys.modules
+
+        load_all_signals()
         assert isinstance(
             OpenEdxPublicSignal.get_signal_by_type('org.openedx.learning.course.enrollment.created.v1'),
             OpenEdxPublicSignal
         )
+        assert {signal.event_type for signal in OpenEdxPublicSignal.all_events()} == set(SIGNAL_MANIFEST)
+
+    def test_load_all_signals_after_registry_reset(self):
+        """
+        Tests signals whose module was already imported are registered again after the registry is reset
+        """
+        load_all_signals()
+        OpenEdxPublicSignal._mapping = {}  # pylint: disable=protected-access
+        OpenEdxPublicSignal.instances = []
+
+        assert OpenEdxPublicSignal.get_signal_by_type('org.openedx.learning.course.enrollment.created.v1') is (
+            sys.modules['openedx_events.learning.signals'].COURSE_ENROLLMENT_CREATED
+        )
+        assert {signal.event_type for signal in OpenEdxPublicSignal.all_events()} == set(SIGNAL_MANIFEST)
+
+    def test_signals_manifest_is_up_to_date(self):
+        """
+        Tests the signals manifest lists all the signals of the library
+        """
+        self.assertEqual(
+            build_signals_manifest(), SIGNAL_MANIFEST,
+            "The signals manifest is outdated, run the generate_signals_manifest management command to update it.",
+        )
+
+
+@ddt.ddt
+class TestPatternSubscriptions(FreezeSignalCacheMixin, TestCase):
+    """ Tests for receivers connected to event type patterns"""
+    def setUp(self):
+        super().setUp()
+        pattern_index = OpenEdxPublicSignal._pattern_index  # pylint: disable=protected-access
+        OpenEdxPublicSignal._pattern_index = _EventTypePatternIndex()  # pylint: disable=protected-access
+        self.addCleanup(setattr, OpenEdxPublicSignal, "_pattern_index", pattern_index)
+        self.receiver = Mock(return_value="success")
+        self.enrollment_created = OpenEdxPublicSignal(
+            event_type="org.openedx.learning.course.enrollment.created.v1", data={"user": Mock},
+        )
+        self.catalog_changed = OpenEdxPublicSignal(
+            event_type="org.openedx.content_authoring.course.catalog_info.changed.v1", data={"user": Mock},
+        )
+
+    @ddt.data(
+        ("org.openedx.learning.*", [True, False]),
+        ("*.changed.v1", [False, True]),
+        ("org.openedx.*.course.*", [True, True]),
+        ("org.openedx.learning.course.enrollment.created.v1", [True, False]),
+        ("org.openedx.*.created", [False, False]),
+    )
+    @ddt.unpack
+    def test_connect_pattern(self, pattern, expected_connections):
+        """
+        Tests receivers are connected to the already loaded signals matching the pattern
+        """
+        OpenEdxPublicSignal.connect_pattern(pattern, self.receiver)
+
+        self.assertEqual(
+            [self.enrollment_created.has_listeners(), self.catalog_changed.has_listeners()], expected_connections
+        )
+
+    def test_connect_pattern_to_signals_loaded_later(self):
+        """
+        Tests receivers are connected to matching signals created after the subscription, and called once
+        """
+        OpenEdxPublicSignal.connect_pattern("org.openedx.learning.*", self.receiver)
+        OpenEdxPublicSignal.connect_pattern("*.v1", self.receiver)
+        later_signal = OpenEdxPublicSignal(event_type="org.openedx.learning.later.v1", data={"user": Mock})
+        other_signal = OpenEdxPublicSignal(event_type="org.openedx.enterprise.later.v2", data={"user": Mock})
+
+        later_signal.send_event(user=Mock())
+
+        self.receiver.assert_called_once()
+        self.assertFalse(other_signal.has_listeners())
+
+    def test_disconnect_pattern(self):
+        """
+        Tests receivers are disconnected from the signals no other pattern of theirs matches
+        """
+        OpenEdxPublicSignal.connect_pattern("org.openedx.*", self.receiver)
+        OpenEdxPublicSignal.connect_pattern("*.changed.v1", self.receiver)
+
+        OpenEdxPublicSignal.disconnect_pattern("org.openedx.*", self.receiver)
+        later_signal = OpenEdxPublicSignal(event_type="org.openedx.learning.later.v1", data={"user": Mock})
+
+        self.assertFalse(self.enrollment_created.has_listeners())
+        self.assertTrue(self.catalog_changed.has_listeners())
+        self.assertFalse(later_signal.has_listeners())
+
+    def test_disconnect_pattern_keeps_direct_connections(self):
+        """
+        Tests receivers connected directly to a signal stay connected when a pattern matching it is disconnected
+        """
+        self.enrollment_created.connect(self.receiver)
+        OpenEdxPublicSignal.connect_pattern("org.openedx.*", self.receiver)
+
+        OpenEdxPublicSignal.disconnect_pattern("org.openedx.*", self.receiver)
+        self.enrollment_created.send_event(user=Mock())
+
+        self.receiver.assert_called_once()
+        self.assertFalse(self.catalog_changed.has_listeners())
+
+    @ddt.data("org..learning", "org.openedx.learn*", "")
+    def test_invalid_pattern(self, pattern):
+        """
+        Tests invalid patterns are rejected
+        """
+        with self.assertRaises(ValueError):
+            OpenEdxPublicSignal.connect_pattern(pattern, self.receiver)
@@ -2,9 +2,47 @@
 Utils used by Open edX event tests.
 """
 
+from openedx_events.event_bus.avro.deserializer import clear_deserializer_fingerprints, get_signal_deserializer
+from openedx_events.event_bus.avro.schema import clear_schema_cache
+from openedx_events.event_bus.avro.serializer import get_signal_serializer
+from openedx_events.event_bus.encoded import EncodedEvent
+from openedx_events.learning.data import UserData, UserPersonalData
+from openedx_events.learning.signals import SESSION_LOGIN_COMPLETED
 from openedx_events.tooling import OpenEdxPublicSignal
 
 
+def login_event_message(number, topic="user-login"):
+    """
+    Build the arguments of EventBusProducer.send_encoded for a SESSION_LOGIN_COMPLETED event, keyed by username.
+
+    Arguments:
+        number (int): id of the user logging in, also used in their username and email.
+        topic (str): topic the event is published to.
+
+    Returns:
+        dict: the topic, event key field and encoded event.
+    """
+    user = UserData(
+        id=number,
+        is_active=True,
+        pii=UserPersonalData(username=f"user{number}", email=f"user{number}@example.com", name=f"User {number}"),
+    )
+    return {
+        "topic": topic,
+        "event_key_field": "user.pii.username",
+        "encoded_event": EncodedEvent(
+            SESSION_LOGIN_COMPLETED, {"user": user}, SESSION_LOGIN_COMPLETED.generate_signal_metadata()
+        ),
+    }
+
+
+def published_user_ids(send_encoded):
+    """
+    Get the ids of the users of the events published with a mock of send_encoded, see login_event_message.
+    """
+    return [call.kwargs["encoded_event"].event_data["user"].id for call in send_encoded.call_args_list]
+
+
 class FreezeSignalCacheMixin:
     """
     A mixin to be used by TestCases to avoid new signals persisting in the OpenEdxPublicSignal cache of instances.
@@ -23,10 +61,17 @@ class FreezeSignalCacheMixin:
     def tearDownClass(cls):
         """
         Restore instance cache to pre-test state.
+
+        Cached Avro schemas, serializers and deserializers are dropped as well, since they may hold
+        signals created during the test run.
         """
         super().tearDownClass()
         OpenEdxPublicSignal.instances = cls.pre_run_instances
         OpenEdxPublicSignal._mapping = cls.pre_run_mapping  # pylint: disable=protected-access
+        get_signal_serializer.cache_clear()
+        get_signal_deserializer.cache_clear()
+        clear_deserializer_fingerprints()
+        clear_schema_cache()
 
 
 class EventsIsolationMixin:
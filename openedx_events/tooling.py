@@ -1,19 +1,30 @@
 """
 Tooling necessary to use Open edX events.
 """
+import asyncio
+import logging
 import pkgutil
+import random
 import warnings
+from functools import lru_cache
 from importlib import import_module
 from logging import getLogger
+from time import perf_counter
 
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.db import connection
-from django.dispatch import Signal
+from django.dispatch import Signal, receiver
+from django.dispatch.dispatcher import NO_RECEIVERS, _make_id
 from edx_django_utils.cache import RequestCache
 
 from openedx_events.data import EventsMetadata
 from openedx_events.exceptions import SenderValidationError
-from openedx_events.utils import format_responses
+from openedx_events.instrumentation import is_instrumentation_enabled, record_receiver_call
+from openedx_events.signals_manifest import SIGNAL_MANIFEST
+from openedx_events.utils import _callable_path, format_responses, format_responses_compact
 
 log = getLogger(__name__)
 
@@ -33,6 +44,182 @@ KNOWN_UNSERIALIZABLE_SIGNALS = [
 
 SIGNAL_PROCESSED_FROM_EVENT_BUS = "from_event_bus"
 
+RESPONSE_LOGGING_MODES = ("all", "errors", "off")
+
+
+@lru_cache(maxsize=None)
+def _get_response_logging_config(event_type):
+    """
+    Get how the receivers' responses to an event type are logged.
+
+    Arguments:
+        event_type (str): name of the event.
+
+    Returns:
+        tuple: (mode, sample_rate, compact), see EVENTS_RESPONSE_LOGGING.
+
+    Exceptions raised:
+        ImproperlyConfigured: if the configuration of the event type is not valid.
+    """
+    # .. setting_name: EVENTS_RESPONSE_LOGGING
+    # .. setting_default: {}
+    # .. setting_description: Dictionary configuring how the responses of receivers are logged (at INFO level)
+    #   after an event is sent robustly, by event type. The "*" key configures the event types that are not listed.
+    #   Each value is either a mode, or a dictionary with the keys "mode", "sample_rate" (percentage of the sends
+    #   whose responses are logged, defaults to 100) and "compact" (log a single line with the outcome of each
+    #   receiver instead of pretty-printing the responses, defaults to False). Modes are "all" (the default),
+    #   "errors" (only log when a receiver raised an exception) and "off". For example:
+    #   {"*": {"mode": "errors", "compact": True},
+    #   "org.openedx.analytics.tracking.event.emitted.v1": "off",
+    #   "org.openedx.learning.auth.session.login.completed.v1": {"mode": "all", "sample_rate": 10}}
+    configurations = getattr(settings, "EVENTS_RESPONSE_LOGGING", {})
+    configuration = configurations.get(event_type, configurations.get("*", {}))
+    if isinstance(configuration, str):
+        configuration = {"mode": configuration}
+    mode = configuration.get("mode", "all")
+    if mode not in RESPONSE_LOGGING_MODES:
+        raise ImproperlyConfigured(
+            f"EVENTS_RESPONSE_LOGGING mode for {event_type} should be one of {RESPONSE_LOGGING_MODES}, got '{mode}'"
+        )
+    sample_rate = configuration.get("sample_rate", 100)
+    if isinstance(sample_rate, bool) or not isinstance(sample_rate, (int, float)) or not 0 <= sample_rate <= 100:
+        raise ImproperlyConfigured(
+            f"EVENTS_RESPONSE_LOGGING sample_rate for {event_type} should be a number between 0 and 100,"
+            f" got {sample_rate!r}"
+        )
+    compact = configuration.get("compact", False)
+    if not isinstance(compact, bool):
+        raise ImproperlyConfigured(
+            f"EVENTS_RESPONSE_LOGGING compact for {event_type} should be True or False, got {compact!r}"
+        )
+    return mode, sample_rate, compact
+
+
+@receiver(setting_changed)
+def _reset_response_logging_config(setting, **kwargs):  # pylint: disable=unused-argument
+    """
+    Forget the cached response logging configuration when the setting changes (e.g. in tests).
+    """
+    if setting == "EVENTS_RESPONSE_LOGGING":
+        _get_response_logging_config.cache_clear()
+
+
+def _raise_sender_validation_error(event_type, key, data_type, argument):
+    """
+    Raise the SenderValidationError describing why an argument of send_event is not valid.
+    """
+    if not argument:
+        raise SenderValidationError(
+            event_type=event_type,
+            message="Missing required argument '{key}'".format(key=key),
+        )
+    raise SenderValidationError(
+        event_type=event_type,
+        message="The argument '{key}' is not instance of the Class Attribute '{attr}'".format(
+            key=key, attr=data_type.__class__.__name__
+        ),
+    )
+
+
+def _compile_sender_validator(event_type, init_data):
+    """
+    Build the function validating the arguments of send_event for a signal.
+
+    The validation checks whether the send arguments match the arguments used
+    when instantiating the event. If they don't a validation error is raised.
+
+    Arguments:
+        event_type (str): name of the event.
+        init_data (dict): attributes passed to the event.
+
+    Returns:
+        A function taking the send arguments as a dict.
+    """
+    expected_arguments = tuple(init_data.items())
+    expected_length = len(expected_arguments)
+
+    def validate_sender(kwargs):
+        if len(kwargs) != expected_length:
+            raise SenderValidationError(
+                event_type=event_type,
+                message="There's a mismatch between initialization data and send_event arguments",
+            )
+        for key, data_type in expected_arguments:
+            argument = kwargs.get(key)
+            if not argument or not isinstance(argument, data_type):
+                _raise_sender_validation_error(event_type, key, data_type, argument)
+
+    return validate_sender
+
+
+class _EventTypePatternIndex:
+    """
+    Trie of event type patterns, indexed by segment.
+
+    Patterns are event types whose dot-separated segments may be ``*``, which
+    matches one or more segments. For example, ``org.openedx.learning.*``
+    matches all the events of the learning subdomain, and ``*.changed.v1``
+    matches all the version 1 events ending with ``changed``.
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.subscriptions = []
+
+    @staticmethod
+    def split_pattern(pattern):
+        """
+        Split a pattern into segments, checking that it is valid.
+
+        Exceptions raised:
+            ValueError: if a segment is empty, or contains ``*`` and other characters.
+        """
+        segments = tuple(pattern.split("."))
+        for segment in segments:
+            if not segment or ("*" in segment and segment != "*"):
+                raise ValueError(
+                    f"Invalid event type pattern '{pattern}': segments must be non-empty, and '*' must be a whole "
+                    "segment"
+                )
+        return segments
+
+    def add(self, segments, subscription):
+        """
+        Add a subscription for the pattern with the given segments.
+        """
+        node = self
+        for segment in segments:
+            node = node.children.setdefault(segment, _EventTypePatternIndex())
+        node.subscriptions.append(subscription)
+
+    def remove(self, segments, subscription):
+        """
+        Remove a subscription for the pattern with the given segments, if present.
+        """
+        node = self
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return
+        if subscription in node.subscriptions:
+            node.subscriptions.remove(subscription)
+
+    def match(self, segments, start=0):
+        """
+        Get the subscriptions of all the patterns matching an event type, given as segments.
+        """
+        if start == len(segments):
+            return list(self.subscriptions)
+        matches = []
+        child = self.children.get(segments[start])
+        if child is not None:
+            matches += child.match(segments, start + 1)
+        wildcard = self.children.get("*")
+        if wildcard is not None:
+            for end in range(start + 1, len(segments) + 1):
+                matches += wildcard.match(segments, end)
+        return matches
+
 
 class OpenEdxPublicSignal(Signal):
     """
@@ -41,6 +228,7 @@ class OpenEdxPublicSignal(Signal):
 
     _mapping = {}
     instances = []
+    _pattern_index = _EventTypePatternIndex()
 
     def __init__(self, event_type, data, minor_version=0):
         """
@@ -56,9 +244,13 @@ class OpenEdxPublicSignal(Signal):
         self.minor_version = minor_version
         self._allow_events = True
         self._allow_send_event_failure = False
+        self._validate_sender = _compile_sender_validator(event_type, data)
+        # (receiver, dispatch_uid) connected to this signal by connect_pattern, and not directly
+        self._pattern_connections = set()
         self.__class__.instances.append(self)
         self.__class__._mapping[self.event_type] = self
         super().__init__()
+        self._connect_pattern_receivers()
 
     def __repr__(self):
         """
@@ -69,8 +261,9 @@ class OpenEdxPublicSignal(Signal):
     @classmethod
     def all_events(cls):
         """
-        Get all current events.
+        Get all current events, loading all the signals of the library first.
         """
+        load_all_signals()
         return cls.instances
 
     @classmethod
@@ -78,14 +271,108 @@ class OpenEdxPublicSignal(Signal):
         """
         Get event identified by type.
 
+        Signals of the library that haven't been loaded yet are imported on
+        demand, using the signals manifest to find their module.
+
         Arguments:
             event_type (str): name of the event.
 
         Exceptions raised:
             Raises KeyError if not found.
         """
+        try:
+            return cls._mapping[event_type]
+        except KeyError:
+            if event_type not in SIGNAL_MANIFEST:
+                raise
+        return cls._load_signal(event_type)
+
+    @classmethod
+    def _load_signal(cls, event_type):
+        """
+        Import the signal of an event type listed in the signals manifest, and make sure it's registered.
+        """
+        module_name, attribute = SIGNAL_MANIFEST[event_type]
+        signal = getattr(import_module(module_name), attribute)
+        if event_type not in cls._mapping:
+            # The module was imported before the registry was reset (e.g. in tests)
+            cls.instances.append(signal)
+            cls._mapping[event_type] = signal
+            signal._connect_pattern_receivers()  # pylint: disable=protected-access
         return cls._mapping[event_type]
 
+    @classmethod
+    def connect_pattern(cls, pattern, receiver, dispatch_uid=None):  # pylint: disable=redefined-outer-name
+        """
+        Connect a receiver to all the events whose type matches a pattern.
+
+        The receiver is connected to the matching signals that are already
+        loaded, and to matching signals loaded later when they are created, so
+        matching only happens once per signal instead of on every send.
+
+        Arguments:
+            pattern (str): event type whose dot-separated segments may be ``*``,
+                matching one or more segments. For example,
+                ``org.openedx.learning.*`` or ``*.changed.v1``.
+            receiver (callable): function to connect, see Django signal docs.
+                Pattern receivers are connected with strong references.
+            dispatch_uid (str): (Optional) unique identifier of the receiver,
+                see Django signal docs.
+
+        Example usage:
+            >>> OpenEdxPublicSignal.connect_pattern("org.openedx.learning.*", audit_receiver)
+
+        Exceptions raised:
+            ValueError: if the pattern is not valid.
+        """
+        segments = _EventTypePatternIndex.split_pattern(pattern)
+        subscription = (receiver, dispatch_uid)
+        cls._pattern_index.add(segments, subscription)
+        for signal in list(cls._mapping.values()):
+            if subscription in cls._pattern_index.match(tuple(signal.event_type.split("."))):
+                signal._connect_pattern_receiver(receiver, dispatch_uid)  # pylint: disable=protected-access
+
+    @classmethod
+    def disconnect_pattern(cls, pattern, receiver, dispatch_uid=None):  # pylint: disable=redefined-outer-name
+        """
+        Disconnect a receiver connected with connect_pattern from all the events matching the pattern.
+
+        The receiver stays connected to the events matching its other patterns, and to the events it was
+        connected to directly with ``connect``.
+
+        Arguments:
+            pattern (str): pattern the receiver was connected with.
+            receiver (callable): function to disconnect.
+            dispatch_uid (str): (Optional) unique identifier the receiver was connected with.
+        """
+        segments = _EventTypePatternIndex.split_pattern(pattern)
+        subscription = (receiver, dispatch_uid)
+        cls._pattern_index.remove(segments, subscription)
+        for signal in list(cls._mapping.values()):
+            if (
+                subscription in signal._pattern_connections  # pylint: disable=protected-access
+                and subscription not in cls._pattern_index.match(tuple(signal.event_type.split(".")))
+            ):
+                signal.disconnect(receiver, dispatch_uid=dispatch_uid)
+                signal._pattern_connections.discard(subscription)  # pylint: disable=protected-access
+
+    def _connect_pattern_receivers(self):
+        """
+        Connect the receivers subscribed to patterns matching the event type of this signal.
+        """
+        for pattern_receiver, dispatch_uid in self._pattern_index.match(tuple(self.event_type.split("."))):
+            self._connect_pattern_receiver(pattern_receiver, dispatch_uid)
+
+    def _connect_pattern_receiver(self, receiver, dispatch_uid):  # pylint: disable=redefined-outer-name
+        """
+        Connect a receiver subscribed to a pattern, remembering the connection unless it was already made directly.
+        """
+        lookup_key = (dispatch_uid or _make_id(receiver), _make_id(None))
+        if any(receiver_key == lookup_key for receiver_key, *_ in self.receivers):
+            return
+        self.connect(receiver, weak=False, dispatch_uid=dispatch_uid)
+        self._pattern_connections.add((receiver, dispatch_uid))
+
     def generate_signal_metadata(self, time=None):
         """
         Generate signal metadata when an event is sent.
@@ -118,7 +405,76 @@ class OpenEdxPublicSignal(Signal):
             time=time,
         )
 
-    def _send_event_with_metadata(self, metadata, send_robust=True, from_event_bus=False, **kwargs):
+    def _validate_send_arguments(self, from_event_bus, kwargs):
+        """
+        Validate the arguments of an event, unless it comes from the event bus and its validation is skipped.
+        """
+        # .. toggle_name: EVENT_BUS_SKIP_CONSUMER_SEND_VALIDATION
+        # .. toggle_implementation: DjangoSetting
+        # .. toggle_default: False
+        # .. toggle_description: If True, the arguments of events sent by the event bus consumer (i.e. with
+        #   ``send_event_with_custom_metadata``) are not validated against the signal's data definition. The event
+        #   data was validated when the event was produced and was decoded with the signal's schema, so validating
+        #   it again can be skipped when the producers are trusted.
+        # .. toggle_use_cases: open_edx
+        # .. toggle_creation_date: 2026-10-18
+        if not (from_event_bus and getattr(settings, "EVENT_BUS_SKIP_CONSUMER_SEND_VALIDATION", False)):
+            self._validate_sender(kwargs)
+
+    def _is_robust(self, send_robust):
+        """
+        Check whether exceptions raised by receivers are caught, or propagated to the sender.
+        """
+        return not (self._allow_send_event_failure or settings.DEBUG or not send_robust)
+
+    def _has_receivers(self):
+        """
+        Check whether any receiver may be connected, without resolving weak references.
+        """
+        return bool(self.receivers) and self.sender_receivers_cache.get(None) is not NO_RECEIVERS
+
+    def _get_live_receivers(self):
+        """
+        Get the sync and async receivers connected to the signal, as two lists.
+
+        Django's private ``_live_receivers`` returns a single list in Django 4.2, and a tuple of the sync and async
+        receivers since Django 5.0. With a single list, async receivers are told apart with iscoroutinefunction.
+        """
+        live_receivers = self._live_receivers(None)
+        if isinstance(live_receivers, tuple):
+            return live_receivers
+        sync_receivers, async_receivers = [], []
+        for live_receiver in live_receivers:
+            if iscoroutinefunction(live_receiver):
+                async_receivers.append(live_receiver)
+            else:
+                sync_receivers.append(live_receiver)
+        return sync_receivers, async_receivers
+
+    def _get_sync_calls(self):
+        """
+        Get each receiver along with the function calling it from sync code, sync receivers first like Django's send.
+        """
+        sync_receivers, async_receivers = self._get_live_receivers()
+        return [(live_receiver, live_receiver) for live_receiver in sync_receivers] + [
+            (live_receiver, async_to_sync(live_receiver)) for live_receiver in async_receivers
+        ]
+
+    def _log_receiver_error(self, live_receiver, err):
+        """
+        Log an exception raised by a receiver of a robust send.
+        """
+        log.error(
+            "Error calling %s for the Open edX Event <%s> (%s)",
+            _callable_path(live_receiver),
+            self.event_type,
+            err,
+            exc_info=err,
+        )
+
+    def _send_event_with_metadata(
+        self, metadata, send_robust=True, from_event_bus=False, discard_responses=False, **kwargs
+    ):
         """
         Send events to all connected receivers with the provided metadata.
 
@@ -131,58 +487,103 @@ class OpenEdxPublicSignal(Signal):
                 being sent from the event bus. This is used to prevent infinite
                 loops when the event bus is consuming events. It should not be
                 used when sending events from the application.
+            discard_responses (bool): Defaults to False. If True, the
+                responses of the receivers are neither collected nor logged,
+                and None is returned.
 
         See ``send_event`` docstring for more details on its usage and behavior.
         """
-
-        def validate_sender():
-            """
-            Run validations over the send arguments.
-
-            The validation checks whether the send arguments match the
-            arguments used when instantiating the event. If they don't a
-            validation error is raised.
-            """
-            if len(kwargs) != len(self.init_data):
-                raise SenderValidationError(
-                    event_type=self.event_type,
-                    message="There's a mismatch between initialization data and send_event arguments",
-                )
-
-            for key, value in self.init_data.items():
-                argument = kwargs.get(key)
-                if not argument:
-                    raise SenderValidationError(
-                        event_type=self.event_type,
-                        message="Missing required argument '{key}'".format(key=key),
-                    )
-                if not isinstance(argument, value):
-                    raise SenderValidationError(
-                        event_type=self.event_type,
-                        message="The argument '{key}' is not instance of the Class Attribute '{attr}'".format(
-                            key=key, attr=value.__class__.__name__
-                        ),
-                    )
-
         if not self._allow_events:
-            return []
-
-        validate_sender()
+            return None if discard_responses else []
 
+        self._validate_send_arguments(from_event_bus, kwargs)
         kwargs["metadata"] = metadata
         kwargs[SIGNAL_PROCESSED_FROM_EVENT_BUS] = from_event_bus
 
-        if self._allow_send_event_failure or settings.DEBUG or not send_robust:
+        robust = self._is_robust(send_robust)
+        if is_instrumentation_enabled():
+            responses = self._send_instrumented(robust, **kwargs)
+            if discard_responses:
+                return None
+            if robust:
+                self._log_responses(responses)
+            return responses
+
+        if discard_responses:
+            self._send_discarding_responses(robust, **kwargs)
+            return None
+
+        if not robust:
             return super().send(sender=None, **kwargs)
 
         responses = super().send_robust(sender=None, **kwargs)
-        log.info(
-            f"Responses of the Open edX Event <{self.event_type}>: \n{format_responses(responses, depth=2)}",
-        )
+        self._log_responses(responses)
+
+        return responses
+
+    def _send_discarding_responses(self, robust, **kwargs):
+        """
+        Call all connected receivers without collecting their responses.
+
+        Exceptions raised by receivers are logged if robust is True, and
+        propagated otherwise.
+        """
+        if not self._has_receivers():
+            return
+        for live_receiver, call_receiver in self._get_sync_calls():
+            if not robust:
+                call_receiver(signal=self, sender=None, **kwargs)
+                continue
+            try:
+                call_receiver(signal=self, sender=None, **kwargs)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self._log_receiver_error(live_receiver, err)
+
+    def _send_instrumented(self, robust, **kwargs):
+        """
+        Call all connected receivers like send or send_robust, recording the duration and outcome of each call.
 
+        See openedx_events.instrumentation for how calls are recorded.
+        """
+        responses = []
+        if not self._has_receivers():
+            return responses
+        for live_receiver, call_receiver in self._get_sync_calls():
+            start = perf_counter()
+            try:
+                response = call_receiver(signal=self, sender=None, **kwargs)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                record_receiver_call(self.event_type, live_receiver, (perf_counter() - start) * 1000, err)
+                if not robust:
+                    raise
+                self._log_receiver_error(live_receiver, err)
+                responses.append((live_receiver, err))
+            else:
+                record_receiver_call(self.event_type, live_receiver, (perf_counter() - start) * 1000)
+                responses.append((live_receiver, response))
         return responses
 
-    def send_event(self, send_robust=True, time=None, **kwargs):
+    def _log_responses(self, responses):
+        """
+        Log the responses of the receivers as configured by EVENTS_RESPONSE_LOGGING.
+
+        Responses are only formatted when the log record is going to be emitted.
+        """
+        mode, sample_rate, compact = _get_response_logging_config(self.event_type)
+        if mode == "off" or not log.isEnabledFor(logging.INFO):
+            return
+        if mode == "errors" and not any(isinstance(response, Exception) for _, response in responses):
+            return
+        if sample_rate < 100 and random.random() * 100 >= sample_rate:
+            return
+        if compact:
+            log.info(f"Responses of the Open edX Event <{self.event_type}>: {format_responses_compact(responses)}")
+        else:
+            log.info(
+                f"Responses of the Open edX Event <{self.event_type}>: \n{format_responses(responses, depth=2)}",
+            )
+
+    def send_event(self, send_robust=True, time=None, discard_responses=False, **kwargs):
         """
         Send events to all connected receivers.
 
@@ -194,6 +595,11 @@ class OpenEdxPublicSignal(Signal):
                 current time in UTC. This argument is optional for backward
                 compatability, but ideally would be explicitly set. See OEP-41
                 for details.
+            discard_responses (bool): Defaults to False. If True, the
+                responses of the receivers are neither collected nor logged,
+                which saves building them when the caller doesn't use them.
+                Exceptions raised by receivers are still logged when sending
+                robustly.
             kwargs: Data to be sent to the signal's receivers.
 
         Used to send events just like Django signals are sent. In addition,
@@ -204,6 +610,9 @@ class OpenEdxPublicSignal(Signal):
         If the event is disabled (i.e _allow_events is False), then this method
         won't have any effect. Meaning, the Django Signal won't be sent.
 
+        If the event has no receivers, its arguments are validated but no
+        metadata is generated.
+
         Example usage:
             >>> STUDENT_REGISTRATION_COMPLETED.send_event(
                 user=user_data, registration=registration_data,
@@ -213,14 +622,24 @@ class OpenEdxPublicSignal(Signal):
         Returns:
             list: response of each receiver following the format
             [(receiver, response), ... ]. Empty list if the event is disabled.
+            None if discard_responses is True.
 
         Exceptions raised:
             SenderValidationError: raised when there's a mismatch between
             arguments passed to this method and arguments used to initialize
             the event.
         """
+        if not self._has_receivers():
+            # Nobody is listening, so skip generating the metadata. The arguments are still
+            # validated so that invalid calls are caught whether or not the event has receivers.
+            if self._allow_events:
+                self._validate_sender(kwargs)
+            return None if discard_responses else []
+
         metadata = self.generate_signal_metadata(time=time)
-        return self._send_event_with_metadata(metadata=metadata, send_robust=send_robust, **kwargs)
+        return self._send_event_with_metadata(
+            metadata=metadata, send_robust=send_robust, discard_responses=discard_responses, **kwargs
+        )
 
     def send_event_with_custom_metadata(
             self, metadata, /, *, send_robust=True, **kwargs
@@ -246,6 +665,150 @@ class OpenEdxPublicSignal(Signal):
             metadata=metadata, send_robust=send_robust, from_event_bus=True, **kwargs
         )
 
+    async def _asend_event_with_metadata(self, metadata, send_robust=True, from_event_bus=False, **kwargs):
+        """
+        Send events to all connected receivers with the provided metadata, from async code.
+
+        This method is for internal use only.
+
+        See ``_send_event_with_metadata`` and ``asend_event`` docstrings for more details.
+        """
+        if not self._allow_events:
+            return []
+
+        self._validate_send_arguments(from_event_bus, kwargs)
+        kwargs["metadata"] = metadata
+        kwargs[SIGNAL_PROCESSED_FROM_EVENT_BUS] = from_event_bus
+
+        robust = self._is_robust(send_robust)
+        if is_instrumentation_enabled() or not hasattr(Signal, "asend"):
+            responses = await self._acall_receivers(robust, **kwargs)
+        elif robust:
+            # Django 5.0+ sends signals from async code natively.
+            responses = await super().asend_robust(sender=None, **kwargs)  # pylint: disable=no-member
+        else:
+            responses = await super().asend(sender=None, **kwargs)  # pylint: disable=no-member
+        if robust:
+            self._log_responses(responses)
+        return responses
+
+    async def _acall_receivers(self, robust, **kwargs):
+        """
+        Call all connected receivers from async code, like Django's asend and asend_robust.
+
+        Used when receivers are instrumented, and on Django versions without asend.
+
+        Sync receivers are called one after another in a single thread with
+        sync_to_async, while async receivers run concurrently on the event
+        loop. Responses of sync receivers come first, in the order receivers
+        were connected.
+        """
+        if not self._has_receivers():
+            return []
+        sync_receivers, async_receivers = self._get_live_receivers()
+        instrumented = is_instrumentation_enabled()
+
+        def call_sync_receiver(live_receiver):
+            start = perf_counter()
+            try:
+                response = live_receiver(signal=self, sender=None, **kwargs)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                return self._handle_receiver_error(robust, instrumented, live_receiver, start, err)
+            if instrumented:
+                record_receiver_call(self.event_type, live_receiver, (perf_counter() - start) * 1000)
+            return live_receiver, response
+
+        async def call_sync_receivers():
+            if not sync_receivers:
+                return []
+            return await sync_to_async(
+                lambda: [call_sync_receiver(live_receiver) for live_receiver in sync_receivers]
+            )()
+
+        async def call_async_receiver(live_receiver):
+            start = perf_counter()
+            try:
+                response = await live_receiver(signal=self, sender=None, **kwargs)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                return self._handle_receiver_error(robust, instrumented, live_receiver, start, err)
+            if instrumented:
+                record_receiver_call(self.event_type, live_receiver, (perf_counter() - start) * 1000)
+            return live_receiver, response
+
+        sync_responses, *async_responses = await asyncio.gather(
+            call_sync_receivers(),
+            *(call_async_receiver(live_receiver) for live_receiver in async_receivers),
+        )
+        return sync_responses + async_responses
+
+    def _handle_receiver_error(self, robust, instrumented, live_receiver, start, err):
+        """
+        Record and log an exception raised by a receiver called from async code, or raise it if not robust.
+        """
+        if instrumented:
+            record_receiver_call(self.event_type, live_receiver, (perf_counter() - start) * 1000, err)
+        if not robust:
+            raise err
+        self._log_receiver_error(live_receiver, err)
+        return live_receiver, err
+
+    async def asend_event(self, send_robust=True, time=None, **kwargs):
+        """
+        Send events to all connected receivers, from async code.
+
+        Works like ``send_event``, with the same validations and metadata,
+        except that receivers are called without blocking the event loop:
+        async receivers (``async def`` functions) run concurrently, and sync
+        receivers run one after another in a thread with ``sync_to_async``.
+        I/O-bound async receivers, like webhook calls, thus overlap instead of
+        running one after another.
+
+        Example usage:
+            >>> await STUDENT_REGISTRATION_COMPLETED.asend_event(
+                user=user_data, registration=registration_data,
+            )
+            [(<function callback at 0x7f2ce638ef70>, 'callback response')]
+
+        Returns:
+            list: response of each receiver following the format
+            [(receiver, response), ... ], with the responses of sync
+            receivers first. Empty list if the event is disabled.
+
+        Exceptions raised:
+            SenderValidationError: raised when there's a mismatch between
+            arguments passed to this method and arguments used to initialize
+            the event.
+
+        See ``send_event`` docstring for more details.
+        """
+        if not self._has_receivers():
+            if self._allow_events:
+                self._validate_sender(kwargs)
+            return []
+
+        metadata = self.generate_signal_metadata(time=time)
+        return await self._asend_event_with_metadata(metadata=metadata, send_robust=send_robust, **kwargs)
+
+    async def asend_event_with_custom_metadata(self, metadata, /, *, send_robust=True, **kwargs):
+        """
+        Send events to all connected receivers using the provided metadata, from async code.
+
+        This method works exactly like ``asend_event``, except it uses the given
+            event metadata rather than generating it, like
+            ``send_event_with_custom_metadata``. This is used by async event bus
+            consumers.
+
+        Arguments:
+            metadata (EventsMetadata): The metadata to be sent with the signal.
+            send_robust (bool): Defaults to True. See Django signal docs.
+            kwargs: Data to be sent to the signal's receivers.
+
+        See ``asend_event`` docstring for more details.
+        """
+        return await self._asend_event_with_metadata(
+            metadata=metadata, send_robust=send_robust, from_event_bus=True, **kwargs
+        )
+
     def send(self, sender, **kwargs):  # pylint: disable=unused-argument
         """
         Override method used to recommend the sender to adopt our custom send.
@@ -297,13 +860,38 @@ def _process_all_signals_modules(func):
             func(module_name)
 
 
+def build_signals_manifest():
+    """
+    Map the event type of each signal of the library to the module and attribute defining it.
+
+    Walks the package tree and imports all non-test signals.py modules. See the
+    generate_signals_manifest management command.
+
+    Returns:
+        dict: event type to (module name, attribute name) tuples, sorted by event type.
+    """
+    manifest = {}
+
+    def add_module_signals(module_name):
+        module = import_module(module_name)
+        for attribute, value in vars(module).items():
+            if isinstance(value, OpenEdxPublicSignal):
+                # Like the registry, keep the last signal defined for an event type
+                manifest[value.event_type] = (module_name, attribute)
+
+    _process_all_signals_modules(add_module_signals)
+    return dict(sorted(manifest.items()))
+
+
 def load_all_signals():
     """
     Ensure OpenEdxPublicSignal.all_events() cache is fully populated.
 
-    Loads all non-test signals.py modules.
+    Loads all the signals.py modules listed in the signals manifest, without walking the package tree.
     """
-    _process_all_signals_modules(import_module)
+    for event_type in SIGNAL_MANIFEST:
+        if event_type not in OpenEdxPublicSignal._mapping:  # pylint: disable=protected-access
+            OpenEdxPublicSignal._load_signal(event_type)  # pylint: disable=protected-access
 
 
 def _reconnect_to_db_if_needed():  # pragma: no cover
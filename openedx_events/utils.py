@@ -29,13 +29,25 @@ class ResponsePrettyPrinter(PrettyPrinter):
             )
             obj = "".join(exc_traceback_formatted)
         if isinstance(obj, collections.abc.Callable):
-            obj = "{func_module}.{func_name}".format(
-                func_module=obj.__module__,
-                func_name=obj.__name__,
-            )
+            obj = _callable_path(obj)
         return super()._format(obj, stream, indent, allowance, context, level)
 
 
+def _callable_path(obj):
+    """
+    Get the dotted path of a function.
+
+    Callables without a name, like callable objects or ``functools.partial`` objects, are represented by their type.
+    """
+    func_name = getattr(obj, "__name__", None) or getattr(obj, "__qualname__", None)
+    if func_name is None:
+        return repr(type(obj))
+    return "{func_module}.{func_name}".format(
+        func_module=getattr(obj, "__module__", None),
+        func_name=func_name,
+    )
+
+
 def format_responses(obj, indent=1, width=80, depth=None, *, compact=False, sort_dicts=True):
     """
     Format a Django Signal response object into a pretty-printed representation.
@@ -88,3 +100,35 @@ def format_responses(obj, indent=1, width=80, depth=None, *, compact=False, sort
         compact=compact,
         sort_dicts=sort_dicts,
     ).pformat(obj)
+
+
+def format_responses_compact(responses):
+    """
+    Format a Django Signal response object into a single line.
+
+    Each receiver is represented by its path and either ``ok`` or the name of
+    the exception it raised. Return values of receivers are left out.
+
+    Example usage::
+
+        format_responses_compact(responses)
+
+    Will result in:
+
+    .. code-block:: none
+
+        openedx_basic_hooks.receivers.login_receiver=ZeroDivisionError, openedx_basic_hooks.receivers.audit=ok
+
+    Arguments:
+        responses (list): response of each receiver following the format [(receiver, response), ... ].
+
+    Returns:
+        (str) single line representation of Open edX events responses.
+    """
+    return ", ".join(
+        "{receiver}={result}".format(
+            receiver=_callable_path(receiver),
+            result=type(response).__name__ if isinstance(response, Exception) else "ok",
+        )
+        for receiver, response in responses
+    )
@@ -0,0 +1,99 @@
+"""
+Benchmark the cold start of a process publishing events, with and without an Avro schema bundle.
+
+Each measure runs in a fresh process, which sets Django up with the test settings and gets the schema fingerprint of
+the signals configured in EVENT_BUS_PRODUCER_CONFIG, as the first event sent to each of them would. The script
+reports the median time of both steps, and how many signals were loaded, which should be the configured ones only.
+
+Usage::
+
+    python test_utils/benchmark_startup.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code run in each fresh process, printing its measures as JSON
+STARTUP = """
+import json
+import os
+from time import perf_counter
+
+start = perf_counter()
+import django
+from test_utils import test_settings
+test_settings.EVENT_BUS_AVRO_SCHEMA_BUNDLE = os.environ.get("BENCHMARK_SCHEMA_BUNDLE")
+django.setup()
+setup_time = perf_counter() - start
+
+from django.conf import settings
+from openedx_events.event_bus.avro.schema import fingerprint_from_signal
+from openedx_events.tooling import OpenEdxPublicSignal
+
+start = perf_counter()
+for event_type in settings.EVENT_BUS_PRODUCER_CONFIG:
+    fingerprint_from_signal(OpenEdxPublicSignal.get_signal_by_type(event_type))
+first_send_time = perf_counter() - start
+
+print(json.dumps({
+    "setup": setup_time,
+    "first_send": first_send_time,
+    "loaded_signals": len(OpenEdxPublicSignal.instances),
+}))
+"""
+
+
+def measure(runs, bundle_path=None):
+    """
+    Run the startup code in fresh processes and get the median of its measures.
+
+    Arguments:
+        runs (int): number of processes to run.
+        bundle_path (str): (Optional) path of the schema bundle to load.
+
+    Returns:
+        dict: median setup and first send times, in seconds, and number of loaded signals.
+    """
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "test_utils.test_settings", "PYTHONPATH": ROOT}
+    if bundle_path:
+        env["BENCHMARK_SCHEMA_BUNDLE"] = bundle_path
+    results = [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", STARTUP], env=env, cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout)
+        for _ in range(runs)
+    ]
+    return {name: statistics.median(result[name] for result in results) for name in results[0]}
+
+
+def main():
+    """
+    Build a schema bundle of all signals, then compare the startup without and with it.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of processes to run per measure")
+    runs = parser.parse_args().runs
+
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_path = os.path.join(directory, "avro_schema_bundle.json")
+        subprocess.run(
+            [sys.executable, "manage.py", "generate_avro_schemas", "--all", "--bundle", bundle_path],
+            cwd=ROOT, check=True, capture_output=True,
+        )
+        for label, path in (("without bundle", None), ("with bundle", bundle_path)):
+            result = measure(runs, path)
+            print(
+                f"{label:>15}: setup {result['setup'] * 1000:.1f} ms, "
+                f"first send {result['first_send'] * 1000:.1f} ms, "
+                f"{result['loaded_signals']:.0f} signals loaded"
+            )
+
+
+if __name__ == "__main__":
+    main()